@@ -0,0 +1,17 @@
+"""Benchmarks
+
+This package measures the running time and the peak memory of the :class:`matrix` operations across matrix sizes,
+stores the measurements as JSON and compares them against a stored baseline to catch performance regressions. The
+modules are,
+
+- cases: The benchmarked operations.
+- runner: Measuring, saving, loading and comparing the results.
+
+Run ``python -m benchmarks --help`` from the root of the repository for the command line interface.
+
+Created on Oct 18 20:10:34 2026
+"""
+
+import sys
+
+sys.path.append('./src/')
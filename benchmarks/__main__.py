@@ -0,0 +1,63 @@
+"""Command line interface of the benchmarks.
+
+Examples, from the root of the repository,
+
+    python -m benchmarks --output baseline.json
+    python -m benchmarks --cases determinant inverse --sizes 8 64 --baseline baseline.json --threshold 1.2
+
+The exit status is 1 if any measurement regressed against the baseline.
+
+Created on Oct 18 20:52:19 2026
+"""
+
+import argparse
+import sys
+
+from .cases import CASES
+from .runner import THRESHOLD, compare, load, run, save
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmark the umatrix operations.')
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), help='cases to run, default is all of them')
+    parser.add_argument('--sizes', nargs='+', type=int, help='matrix sizes, default is 2 to 1024 in powers of 2')
+    parser.add_argument('--max-size', type=int, help='largest size for every case, default is a limit per case')
+    parser.add_argument('--repeat', type=int, default=3, help='timing repetitions, the best one is kept')
+    parser.add_argument('--min-time', type=float, default=0.05, help='minimum duration of a repetition, in seconds')
+    parser.add_argument('--no-memory', action='store_true', help='skip the peak memory measurements')
+    parser.add_argument('--backend', default='python', help="backend of the matrices, default is 'python'")
+    parser.add_argument('--output', help='JSON file to write the results to')
+    parser.add_argument('--baseline', help='JSON file of the results to compare against')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='allowed slowdown against the baseline')
+    parser.add_argument('--memory-threshold', type=float, help='allowed peak memory ratio, default is not compared')
+
+    return parser
+
+
+def _report(name: str, size: int, measurement: dict):
+    memory = f"{measurement['peak_memory'] / 1024:12.1f} KiB" if 'peak_memory' in measurement else ''
+    print(f"{name:20s} {size:6d} {measurement['time'] * 1e3:14.4f} ms {memory}")
+
+
+def main(arguments: list = None) -> int:
+    arguments = _parser().parse_args(arguments)
+
+    results = run(arguments.cases, arguments.sizes, arguments.max_size, arguments.repeat, arguments.min_time,
+                  not arguments.no_memory, arguments.backend, progress=_report)
+
+    if arguments.output:
+        save(results, arguments.output)
+
+    if not arguments.baseline:
+        return 0
+
+    regressions = compare(results, load(arguments.baseline), arguments.threshold, arguments.memory_threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression['case']} {regression['size']} {regression['metric']}: "
+              f"{regression['baseline']:.6g} -> {regression['current']:.6g} ({regression['ratio']:.2f}x)")
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
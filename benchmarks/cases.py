@@ -0,0 +1,97 @@
+"""Benchmark cases
+
+This module contains the benchmarked operations. Every case is a function taking the size of the matrices and giving
+the zero argument callable to be timed, all the inputs are created beforehand so only the operation itself is
+measured. The elements are seeded pseudo random floats, so every run measures the same matrices. The inputs of the
+cached :class:`matrix` properties are passed as plain lists, so every call computes the result again.
+
+Created on Oct 18 20:14:52 2026
+"""
+
+from random import Random
+
+from umatrix.matrix import Inverse, Matrix, determinant, map_to_matrix, matrix_copy
+
+SIZES = (2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+# largest default size for the O(n^3) cases, a pure Python 1024x1024 product takes minutes
+CUBIC_MAX_SIZE = 256
+
+
+def _rows(n_rows: int, n_cols: int, seed: int = 0) -> list:
+    random_ = Random(seed + 1000 * n_rows + n_cols)
+    return [[random_.uniform(-1, 1) + (i == j) * n_cols for j in range(n_cols)] for i in range(n_rows)]
+
+
+def _matrix(n_rows: int, n_cols: int, seed: int = 0) -> Matrix:
+    rows_ = _rows(n_rows, n_cols, seed)
+    return Matrix(rows_[0] if n_rows == 1 else rows_)
+
+
+def determinant_case(size: int):
+    rows_ = _rows(size, size)
+    return lambda: determinant(rows_)
+
+
+def inverse_case(size: int):
+    rows_ = _rows(size, size)
+    return lambda: Inverse(rows_).inverse()
+
+
+def mul_matrix_matrix_case(size: int):
+    a_, b_ = _matrix(size, size), _matrix(size, size, 1)
+    return lambda: a_ * b_
+
+
+def mul_matrix_column_case(size: int):
+    a_, b_ = _matrix(size, size), _matrix(size, 1, 1)
+    return lambda: a_ * b_
+
+
+def mul_row_matrix_case(size: int):
+    a_, b_ = _matrix(1, size), _matrix(size, size, 1)
+    return lambda: a_ * b_
+
+
+def mul_row_column_case(size: int):
+    a_, b_ = _matrix(1, size), _matrix(size, 1, 1)
+    return lambda: a_ * b_
+
+
+def mul_scalar_case(size: int):
+    a_ = _matrix(size, size)
+    return lambda: 2.5 * a_
+
+
+def transpose_case(size: int):
+    a_ = _matrix(size, size)
+    return a_._transpose
+
+
+def map_to_matrix_case(size: int):
+    a_ = _matrix(size, size)
+    return lambda: map_to_matrix(a_, abs)
+
+
+def repr_case(size: int):
+    a_ = _matrix(size, size)
+    return lambda: repr(a_)
+
+
+def matrix_copy_case(size: int):
+    a_ = _matrix(size, size)
+    return lambda: matrix_copy(a_)
+
+
+# name: (case, largest default size)
+CASES = {'determinant': (determinant_case, CUBIC_MAX_SIZE),
+         'inverse': (inverse_case, CUBIC_MAX_SIZE),
+         'mul_matrix_matrix': (mul_matrix_matrix_case, CUBIC_MAX_SIZE),
+         'mul_matrix_column': (mul_matrix_column_case, None),
+         'mul_row_matrix': (mul_row_matrix_case, None),
+         'mul_row_column': (mul_row_column_case, None),
+         'mul_scalar': (mul_scalar_case, None),
+         'transpose': (transpose_case, None),
+         'map_to_matrix': (map_to_matrix_case, None),
+         'repr': (repr_case, None),
+         'matrix_copy': (matrix_copy_case, None)}
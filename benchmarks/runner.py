@@ -0,0 +1,205 @@
+"""Benchmark runner
+
+This module measures the benchmark cases and compares the measurements. The results are stored as,
+
+    {"metadata": {...}, "results": {case: {size: {"time": seconds, "peak_memory": bytes}}}}
+
+where the time is the best per call time over the repetitions, and the peak memory is the largest amount of memory
+allocated during a single call, as traced by ``tracemalloc``. The module provides,
+
+- measure_time: Best per call time of a callable.
+- measure_peak_memory: Peak memory allocated during a call.
+- run: Measures the cases over the sizes.
+- save: Writes the results to a JSON file.
+- load: Reads the results from a JSON file.
+- compare: Lists the measurements that got slower, or bigger, than the baseline by more than a threshold.
+
+Created on Oct 18 20:31:07 2026
+"""
+
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from umatrix.matrix import get_backend, set_backend
+
+from .cases import CASES, SIZES
+
+THRESHOLD = 1.25
+
+# measurements faster than this are dominated by timer noise, and are not compared
+NOISE_FLOOR = 1e-6
+
+
+def measure_time(function, repeat: int = 3, min_time: float = 0.05) -> float:
+    """
+    Measure the best per call time of a callable.
+
+    Parameters
+    ----------
+    function:
+        The zero argument callable to time.
+    repeat:
+        Number of repetitions, the best one is kept. Default is 3.
+    min_time:
+        Minimum duration of a repetition, fast callables are called several times per repetition. Default is 0.05 s.
+
+    Returns
+    -------
+        The time per call, in seconds.
+    """
+
+    number = 1
+
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+
+        if elapsed >= min_time:
+            break
+        number = number * 10 if elapsed < min_time / 10 else number * 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, time.perf_counter() - start)
+
+    return best / number
+
+
+def measure_peak_memory(function) -> int:
+    """Peak memory allocated during a single call of the callable, in bytes."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(cases: list = None, sizes: list = None, max_size: int = None, repeat: int = 3, min_time: float = 0.05,
+        memory: bool = True, backend: str = 'python', progress=None) -> dict:
+    """
+    Measure the benchmark cases.
+
+    Parameters
+    ----------
+    cases:
+        Names of the cases to run. Default is all of them.
+    sizes:
+        Sizes of the matrices. Default is ``SIZES``.
+    max_size:
+        Largest size to run for every case. Default is to skip the sizes above the limit of each case, e.g.,
+        ``CUBIC_MAX_SIZE`` for the O(n^3) cases.
+    repeat:
+        Number of timing repetitions. Default is 3.
+    min_time:
+        Minimum duration of a timing repetition. Default is 0.05 s.
+    memory:
+        Whether to measure the peak memory as well. Default is True.
+    backend:
+        The backend of the matrices during the run. Default is 'python', so the timings do not depend on NumPy.
+    progress:
+        Called with the case, the size and the measurement after every measurement. Default is None.
+
+    Returns
+    -------
+        The results, with the metadata of the run.
+    """
+
+    cases = list(CASES) if cases is None else cases
+    unknown = [name for name in cases if name not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases {', '.join(unknown)}, use any of {', '.join(CASES)}.")
+
+    previous_backend = get_backend()
+    set_backend(backend)
+
+    results = {}
+    try:
+        for name in cases:
+            case, case_max_size = CASES[name]
+            limit = max_size if max_size is not None else case_max_size
+
+            for size in SIZES if sizes is None else sizes:
+                if limit is not None and size > limit:
+                    continue
+
+                function = case(size)
+                measurement = {'time': measure_time(function, repeat, min_time)}
+                if memory:
+                    measurement['peak_memory'] = measure_peak_memory(function)
+
+                results.setdefault(name, {})[str(size)] = measurement
+                if progress is not None:
+                    progress(name, size, measurement)
+    finally:
+        set_backend(previous_backend)
+
+    metadata = {'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'python': platform.python_version(), 'implementation': platform.python_implementation(),
+                'system': platform.system(), 'machine': platform.machine(), 'backend': backend}
+
+    return {'metadata': metadata, 'results': results}
+
+
+def save(results: dict, path: str):
+    with open(path, 'w', encoding='utf-8') as file_:
+        json.dump(results, file_, indent=2)
+
+
+def load(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as file_:
+        return json.load(file_)
+
+
+def compare(current: dict, baseline: dict, threshold: float = THRESHOLD, memory_threshold: float = None) -> list:
+    """
+    Compare the results against a baseline.
+
+    Parameters
+    ----------
+    current:
+        The results to check.
+    baseline:
+        The reference results.
+    threshold:
+        Largest allowed ratio of the current time to the baseline time. Default is ``THRESHOLD``.
+    memory_threshold:
+        Largest allowed ratio of the current peak memory to the baseline one. Default is None, for not comparing the
+        memory.
+
+    Returns
+    -------
+        The regressions, as dictionaries with the case, the size, the metric, both values and their ratio. Only the
+        case and size pairs present in both results are compared.
+    """
+
+    gates = [('time', threshold)] + ([('peak_memory', memory_threshold)] if memory_threshold is not None else [])
+    regressions = []
+
+    for name, sizes in current['results'].items():
+        for size, measurement in sizes.items():
+            reference = baseline['results'].get(name, {}).get(size)
+            if reference is None:
+                continue
+
+            for metric, limit in gates:
+                if metric not in measurement or metric not in reference:
+                    continue
+                if metric == 'time' and reference[metric] < NOISE_FLOOR:
+                    continue
+
+                ratio = measurement[metric] / reference[metric] if reference[metric] else float('inf')
+                if measurement[metric] and ratio > limit:
+                    regressions.append({'case': name, 'size': int(size), 'metric': metric,
+                                        'baseline': reference[metric], 'current': measurement[metric],
+                                        'ratio': ratio})
+
+    return regressions
@@ -0,0 +1,95 @@
+"""Backends
+
+This module contains the registry of the accelerated backends of :class:`matrix`. A backend is a module, or any
+object, providing the same kernels as :mod:`numpy_`, i.e., ``available``, ``from_buffer``, ``from_rows``,
+``to_buffer``, ``to_rows``, ``is_numeric``, ``matmul``, ``inverse``, ``determinant``, ``hadamard`` and ``apply``.
+Matrices with at least ``threshold`` elements dispatch to the active backend, smaller matrices, or all matrices when
+no backend is available, use the pure Python implementation. The module provides,
+
+- register_backend: Registers a new backend under the given name.
+- set_backend: Selects the backend, and optionally the size threshold, to use.
+- get_backend: Gives the name of the selected backend.
+- select: Gives the backend to use for a matrix of the given size, if any.
+
+Created on Oct 18 13:05:52 2026
+"""
+
+from . import numpy_
+
+THRESHOLD = 256
+
+_REGISTRY = {'numpy': numpy_}
+_ACTIVE = {'name': 'auto', 'threshold': THRESHOLD}
+
+
+def register_backend(name: str, kernels):
+    """
+    Register an accelerated backend.
+
+    Parameters
+    ----------
+    name:
+        Name of the backend, 'auto' and 'python' are reserved.
+    kernels:
+        The module or object providing the backend kernels.
+    """
+
+    if name in ('auto', 'python'):
+        raise ValueError(f"The backend name '{name}' is reserved.")
+
+    _REGISTRY[name] = kernels
+
+
+def set_backend(name: str = 'auto', threshold: int = None):
+    """
+    Select the backend used by the matrix operations.
+
+    Parameters
+    ----------
+    name:
+        Either 'python' for the pure Python implementation, 'auto' for the first available registered backend or the
+        name of a registered backend. Default is 'auto'.
+    threshold:
+        Minimum number of elements of a matrix for it to be dispatched to the backend. Default is to keep the
+        current threshold.
+    """
+
+    if name not in ('auto', 'python'):
+        if name not in _REGISTRY:
+            raise ValueError(f"Unknown backend '{name}', use 'auto', 'python' or one of {', '.join(_REGISTRY)}.")
+        if not _REGISTRY[name].available():
+            raise ImportError(f"The '{name}' backend is not available.")
+
+    _ACTIVE['name'] = name
+    if threshold is not None:
+        _ACTIVE['threshold'] = threshold
+
+
+def get_backend() -> str:
+    """Gives the name of the selected backend."""
+    return _ACTIVE['name']
+
+
+def select(size: int):
+    """
+    Gives the backend kernels to use for a matrix with the given number of elements.
+
+    Parameters
+    ----------
+    size:
+        Number of elements of the largest matrix taking part in the operation.
+
+    Returns
+    -------
+        The backend kernels, or None if the pure Python implementation should be used.
+    """
+
+    name = _ACTIVE['name']
+
+    if name == 'python' or size < _ACTIVE['threshold']:
+        return None
+
+    if name == 'auto':
+        return next((kernels for kernels in _REGISTRY.values() if kernels.available()), None)
+
+    return _REGISTRY[name]
@@ -0,0 +1,343 @@
+"""Batch kernels
+
+This module contains the kernels used by :class:`MatrixBatch`. Every kernel takes the row-major elements of a whole
+stack of same-shape matrices as one flat sequence, matrix after matrix, and returns the elements of the results the
+same way, so a single call processes the whole stack without creating any per-matrix objects. A step of zero for an
+operand broadcasts its single matrix (or vector) against every matrix of the other operand.
+
+Determinants, inverses, products and matrix-vector products of 2x2, 3x3 and 4x4 matrices use unrolled closed-form
+expressions, the other shapes fall back to generic loops and to the elimination kernels. The module provides,
+
+- chunks: Splits a flat sequence into tuples of a given size.
+- determinants: Determinant of every matrix.
+- inverses: Inverse of every matrix, raising DeterminantIsZero on the first singular one.
+- multiply: Product of every pair of matrices.
+- matvec: Product of every matrix with its vector.
+- transpose: Transpose of every matrix.
+
+Created on Oct 18 17:12:48 2026
+"""
+
+from itertools import chain
+from operator import mul
+
+from . import custom_exceptions_ as c_ex_, elimination_ as elim_
+
+
+def chunks(values, size: int):
+    """Gives consecutive tuples of ``size`` values, e.g., the elements of every matrix of a stack."""
+    return zip(*[iter(values)] * size)
+
+
+def _rows(matrix_: tuple, n_cols: int) -> list:
+    return [list(matrix_[i:i + n_cols]) for i in range(0, len(matrix_), n_cols)]
+
+
+def _determinant_2(a, b, c, d):
+    return a * d - b * c
+
+
+def _determinant_3(a, b, c, d, e, f, g, h, i):
+    return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+
+def _determinant_4(a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33):
+    # Laplace expansion over the 2x2 minors of the top and the bottom two rows
+    s_0, s_1, s_2 = a00 * a11 - a10 * a01, a00 * a12 - a10 * a02, a00 * a13 - a10 * a03
+    s_3, s_4, s_5 = a01 * a12 - a11 * a02, a01 * a13 - a11 * a03, a02 * a13 - a12 * a03
+    c_0, c_1, c_2 = a20 * a31 - a30 * a21, a20 * a32 - a30 * a22, a20 * a33 - a30 * a23
+    c_3, c_4, c_5 = a21 * a32 - a31 * a22, a21 * a33 - a31 * a23, a22 * a33 - a32 * a23
+
+    return s_0 * c_5 - s_1 * c_4 + s_2 * c_3 + s_3 * c_2 - s_4 * c_1 + s_5 * c_0
+
+
+_DETERMINANTS = {2: _determinant_2, 3: _determinant_3, 4: _determinant_4}
+
+
+def determinants(values, n_rows: int) -> list:
+    """
+    Calculate the determinant of every matrix of the stack.
+
+    Parameters
+    ----------
+    values:
+        The flat elements of the stack of square matrices.
+    n_rows:
+        Number of rows (and columns) of every matrix.
+
+    Returns
+    -------
+        The determinants, exact for integer elements.
+    """
+
+    if n_rows == 1:
+        return list(values)
+
+    if n_rows in _DETERMINANTS:
+        kernel = _DETERMINANTS[n_rows]
+        return [kernel(*matrix_) for matrix_ in chunks(values, n_rows * n_rows)]
+
+    determinants_ = []
+    for matrix_ in chunks(values, n_rows * n_rows):
+        rows_ = _rows(matrix_, n_rows)
+        exact = elim_.is_exact(rows_)
+        determinants_.append(elim_.bareiss_determinant(rows_) if exact else elim_.lu_determinant(rows_))
+
+    return determinants_
+
+
+def _inverse_2(a, b, c, d):
+    det_ = a * d - b * c
+    if det_ == 0:
+        return None
+
+    return d / det_, -b / det_, -c / det_, a / det_
+
+
+def _inverse_3(a, b, c, d, e, f, g, h, i):
+    b00, b01, b02 = e * i - f * h, c * h - b * i, b * f - c * e
+    b10, b11, b12 = f * g - d * i, a * i - c * g, c * d - a * f
+    b20, b21, b22 = d * h - e * g, b * g - a * h, a * e - b * d
+
+    det_ = a * b00 + b * b10 + c * b20
+    if det_ == 0:
+        return None
+
+    return tuple(value / det_ for value in (b00, b01, b02, b10, b11, b12, b20, b21, b22))
+
+
+def _inverse_4(a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33):
+    s_0, s_1, s_2 = a00 * a11 - a10 * a01, a00 * a12 - a10 * a02, a00 * a13 - a10 * a03
+    s_3, s_4, s_5 = a01 * a12 - a11 * a02, a01 * a13 - a11 * a03, a02 * a13 - a12 * a03
+    c_0, c_1, c_2 = a20 * a31 - a30 * a21, a20 * a32 - a30 * a22, a20 * a33 - a30 * a23
+    c_3, c_4, c_5 = a21 * a32 - a31 * a22, a21 * a33 - a31 * a23, a22 * a33 - a32 * a23
+
+    det_ = s_0 * c_5 - s_1 * c_4 + s_2 * c_3 + s_3 * c_2 - s_4 * c_1 + s_5 * c_0
+    if det_ == 0:
+        return None
+
+    adjugate = (a11 * c_5 - a12 * c_4 + a13 * c_3, -a01 * c_5 + a02 * c_4 - a03 * c_3,
+                a31 * s_5 - a32 * s_4 + a33 * s_3, -a21 * s_5 + a22 * s_4 - a23 * s_3,
+                -a10 * c_5 + a12 * c_2 - a13 * c_1, a00 * c_5 - a02 * c_2 + a03 * c_1,
+                -a30 * s_5 + a32 * s_2 - a33 * s_1, a20 * s_5 - a22 * s_2 + a23 * s_1,
+                a10 * c_4 - a11 * c_2 + a13 * c_0, -a00 * c_4 + a01 * c_2 - a03 * c_0,
+                a30 * s_4 - a31 * s_2 + a33 * s_0, -a20 * s_4 + a21 * s_2 - a23 * s_0,
+                -a10 * c_3 + a11 * c_1 - a12 * c_0, a00 * c_3 - a01 * c_1 + a02 * c_0,
+                -a30 * s_3 + a31 * s_1 - a32 * s_0, a20 * s_3 - a21 * s_1 + a22 * s_0)
+
+    return tuple(value / det_ for value in adjugate)
+
+
+def _inverse_n(*matrix_):
+    n_rows = round(len(matrix_)**0.5)
+    lu_, permutation, _ = elim_.lu_factor(_rows(matrix_, n_rows))
+
+    if any(row[i] == 0 for i, row in enumerate(lu_)):
+        return None
+
+    columns = [[int(i == j) for i in range(n_rows)] for j in range(n_rows)]
+
+    return tuple(chain.from_iterable(zip(*elim_.lu_solve(lu_, permutation, columns))))
+
+
+_INVERSES = {2: _inverse_2, 3: _inverse_3, 4: _inverse_4}
+
+
+def inverses(values, n_rows: int) -> list:
+    """
+    Calculate the inverse of every matrix of the stack.
+
+    Parameters
+    ----------
+    values:
+        The flat elements of the stack of square matrices.
+    n_rows:
+        Number of rows (and columns) of every matrix.
+
+    Returns
+    -------
+        The flat elements of the inverses, as floats.
+    """
+
+    kernel = _INVERSES.get(n_rows, _inverse_n)
+    inverses_ = []
+
+    for index, matrix_ in enumerate(chunks(values, n_rows * n_rows)):
+        inverse_ = kernel(*matrix_)
+        if inverse_ is None:
+            raise c_ex_.DeterminantIsZero(f'Matrix {index} of the batch is singular and its inverse can\'t be '
+                                          f'calculated.')
+        inverses_.extend(inverse_)
+
+    return inverses_
+
+
+def _multiply_2(a, b):
+    a00, a01, a10, a11 = a
+    b00, b01, b10, b11 = b
+
+    return (a00 * b00 + a01 * b10, a00 * b01 + a01 * b11,
+            a10 * b00 + a11 * b10, a10 * b01 + a11 * b11)
+
+
+def _multiply_3(a, b):
+    a00, a01, a02, a10, a11, a12, a20, a21, a22 = a
+    b00, b01, b02, b10, b11, b12, b20, b21, b22 = b
+
+    return (a00 * b00 + a01 * b10 + a02 * b20, a00 * b01 + a01 * b11 + a02 * b21, a00 * b02 + a01 * b12 + a02 * b22,
+            a10 * b00 + a11 * b10 + a12 * b20, a10 * b01 + a11 * b11 + a12 * b21, a10 * b02 + a11 * b12 + a12 * b22,
+            a20 * b00 + a21 * b10 + a22 * b20, a20 * b01 + a21 * b11 + a22 * b21, a20 * b02 + a21 * b12 + a22 * b22)
+
+
+def _multiply_4(a, b):
+    b00, b01, b02, b03, b10, b11, b12, b13, b20, b21, b22, b23, b30, b31, b32, b33 = b
+    product = []
+
+    for i in range(0, 16, 4):
+        x_0, x_1, x_2, x_3 = a[i:i + 4]
+        product += (x_0 * b00 + x_1 * b10 + x_2 * b20 + x_3 * b30, x_0 * b01 + x_1 * b11 + x_2 * b21 + x_3 * b31,
+                    x_0 * b02 + x_1 * b12 + x_2 * b22 + x_3 * b32, x_0 * b03 + x_1 * b13 + x_2 * b23 + x_3 * b33)
+
+    return product
+
+
+_PRODUCTS = {2: _multiply_2, 3: _multiply_3, 4: _multiply_4}
+
+
+def multiply(a_values, b_values, count: int, shape: tuple, a_step: int, b_step: int) -> list:
+    """
+    Multiply every pair of matrices of two stacks.
+
+    Parameters
+    ----------
+    a_values:
+        The flat elements of the left stack.
+    b_values:
+        The flat elements of the right stack.
+    count:
+        Number of products.
+    shape:
+        The rows of the left, the inner dimension, and the columns of the right matrices.
+    a_step:
+        Number of elements between consecutive left matrices, zero to use the same left matrix for every product.
+    b_step:
+        Number of elements between consecutive right matrices, zero to use the same right matrix for every product.
+
+    Returns
+    -------
+        The flat elements of the products.
+    """
+
+    n_rows, n_inner, n_cols = shape
+    a_size, b_size = n_rows * n_inner, n_inner * n_cols
+    kernel = _PRODUCTS.get(n_rows) if n_rows == n_inner == n_cols else None
+    product = []
+
+    for index in range(count):
+        a_start, b_start = index * a_step, index * b_step
+        a_, b_ = a_values[a_start:a_start + a_size], b_values[b_start:b_start + b_size]
+
+        if kernel is not None:
+            product += kernel(a_, b_)
+        else:
+            columns = [b_[j::n_cols] for j in range(n_cols)]
+            product += [sum(map(mul, a_[i:i + n_inner], column))
+                        for i in range(0, a_size, n_inner) for column in columns]
+
+    return product
+
+
+def _matvec_2(a, v):
+    a00, a01, a10, a11 = a
+    x_0, x_1 = v
+
+    return [a00 * x_0 + a01 * x_1, a10 * x_0 + a11 * x_1]
+
+
+def _matvec_3(a, v):
+    a00, a01, a02, a10, a11, a12, a20, a21, a22 = a
+    x_0, x_1, x_2 = v
+
+    return [a00 * x_0 + a01 * x_1 + a02 * x_2, a10 * x_0 + a11 * x_1 + a12 * x_2, a20 * x_0 + a21 * x_1 + a22 * x_2]
+
+
+def _matvec_4(a, v):
+    a00, a01, a02, a03, a10, a11, a12, a13, a20, a21, a22, a23, a30, a31, a32, a33 = a
+    x_0, x_1, x_2, x_3 = v
+
+    return [a00 * x_0 + a01 * x_1 + a02 * x_2 + a03 * x_3, a10 * x_0 + a11 * x_1 + a12 * x_2 + a13 * x_3,
+            a20 * x_0 + a21 * x_1 + a22 * x_2 + a23 * x_3, a30 * x_0 + a31 * x_1 + a32 * x_2 + a33 * x_3]
+
+
+_MATVECS = {2: _matvec_2, 3: _matvec_3, 4: _matvec_4}
+
+
+def matvec(values, vectors: list, count: int, shape: tuple, step: int) -> list:
+    """
+    Multiply every matrix of the stack with its vector.
+
+    Parameters
+    ----------
+    values:
+        The flat elements of the stack.
+    vectors:
+        The vectors, either one per product or a single one used for every product.
+    count:
+        Number of products.
+    shape:
+        Number of rows and columns of every matrix.
+    step:
+        Number of elements between consecutive matrices, zero to use the same matrix for every vector.
+
+    Returns
+    -------
+        The resulting vectors, as lists.
+    """
+
+    n_rows, n_cols = shape
+    size_ = n_rows * n_cols
+    kernel = _MATVECS.get(n_rows) if n_rows == n_cols else None
+    vectors = vectors * count if len(vectors) == 1 and count > 1 else vectors
+
+    if step == 0:
+        matrix_ = values[:size_]
+        if kernel is not None:
+            return [kernel(matrix_, vector) for vector in vectors]
+
+        rows_ = [matrix_[i:i + n_cols] for i in range(0, size_, n_cols)]
+        return [[sum(map(mul, row, vector)) for row in rows_] for vector in vectors]
+
+    results = []
+    for matrix_, vector in zip(chunks(values, size_), vectors):
+        if kernel is not None:
+            results.append(kernel(matrix_, vector))
+        else:
+            results.append([sum(map(mul, matrix_[i:i + n_cols], vector)) for i in range(0, size_, n_cols)])
+
+    return results
+
+
+def transpose(values, shape: tuple) -> list:
+    """
+    Transpose every matrix of the stack.
+
+    Parameters
+    ----------
+    values:
+        The flat elements of the stack.
+    shape:
+        Number of rows and columns of every matrix.
+
+    Returns
+    -------
+        The flat elements of the transposed matrices.
+    """
+
+    n_rows, n_cols = shape
+    transposed = []
+
+    for matrix_ in chunks(values, n_rows * n_cols):
+        for j in range(n_cols):
+            transposed += matrix_[j::n_cols]
+
+    return transposed
@@ -8,6 +8,7 @@ This module contains custom error classes for :class:`matrix`. The error classes
 - SlicingNotAllowed
 - IndexOutOfBounds
 - DeterminantIsZero
+- NotPositiveDefinite
 
 Created on Oct 05 23:54:59 2023
 """
@@ -46,3 +47,8 @@ class IndexOutOfBounds(MatrixException):
 class DeterminantIsZero(MatrixException):
     def __init__(self, message="The given matrix is singular and its inverse can't be calculated."):
         super().__init__(message)
+
+
+class NotPositiveDefinite(MatrixException):
+    def __init__(self, message="The given matrix is not positive definite.\nCan't perform Cholesky Decomposition."):
+        super().__init__(message)
@@ -0,0 +1,171 @@
+"""Element wise kernels
+
+This module contains the element wise function application used by ``map_to_matrix`` and ``Matrix.__pow__``. Every
+mode has its own kernel, built from row comprehensions and ``map``, so the mode is checked once per call instead of
+once per element, and the elements are read from the rows directly instead of through matrix indexing. The kernels
+take the rows of one or more matrices, the function receiving one element of each. The module provides,
+
+- map_rows: Applies a function to the full rows, to their diagonal elements or to their off-diagonal elements.
+- map_values: Applies a function to flat sequences of values, for the full mode.
+- power: Gives the function raising an element to a power, optionally modulo a number.
+- result_typecode: Gives the array typecode of the results of a known builtin function.
+
+``map`` calls builtin functions, e.g., ``abs`` or the ``math`` functions, without any Python level frame per element,
+so they are much faster than equivalent lambdas. The typecode of their results is known in advance as well, which
+saves inferring it from the mapped values for the array storage.
+
+Created on Oct 19 00:03:12 2026
+"""
+
+import math
+from functools import partial
+from itertools import repeat
+from operator import abs as abs_, add, mul, neg, pos, sub
+
+from . import storage_ as stor_
+from .. import LList
+
+APPLY_TO = ('full', 'diagonal', 'off-diagonal')
+
+# builtins whose results are always floats
+_FLOAT_FUNCTIONS = {float, math.sqrt, math.exp, math.expm1, math.log, math.log1p, math.log2, math.log10, math.sin,
+                    math.cos, math.tan, math.asin, math.acos, math.atan, math.atan2, math.sinh, math.cosh, math.tanh,
+                    math.asinh, math.acosh, math.atanh, math.hypot, math.degrees, math.radians, math.fabs, math.erf,
+                    math.erfc, math.gamma, math.lgamma, math.pow, math.copysign, math.fmod}
+
+# builtins whose results are always integers
+_INT_FUNCTIONS = {int, math.floor, math.ceil, math.trunc}
+
+# builtins whose results are integers for integer arguments and floats otherwise
+_PRESERVING_FUNCTIONS = {abs, abs_, neg, pos, add, sub, mul, max, min}
+
+
+def result_typecode(function, typecodes: list):
+    """
+    Gives the typecode of the results of the function, when it is a known builtin.
+
+    Parameters
+    ----------
+    function:
+        The mapped function.
+    typecodes:
+        The typecodes of the mapped storages.
+
+    Returns
+    -------
+        'q' or 'd', or None if the results have to be inspected to find it out.
+    """
+
+    try:
+        if function in _FLOAT_FUNCTIONS:
+            return stor_.FLOAT_TYPECODE
+        if function in _INT_FUNCTIONS:
+            return stor_.INT_TYPECODE
+        if function in _PRESERVING_FUNCTIONS:
+            return stor_.result_typecode(*typecodes)
+    except TypeError:
+        # unhashable callables
+        return None
+
+    return None
+
+
+def power(exponent, modulo=None):
+    """
+    Gives the function raising an element to the exponent, and taking the result modulo ``modulo`` if it is given.
+
+    Squares are computed as products, and the other exponents through the builtin ``pow``, both without any Python
+    level frame per element.
+    """
+
+    if modulo is not None:
+        return lambda element: element**exponent % modulo
+
+    if exponent == 2 and isinstance(exponent, int):
+        return _Square()
+
+    return partial(_power, exponent=exponent)
+
+
+def _power(element, exponent):
+    return element**exponent
+
+
+class _Square:
+    """Squares the element, this is recognized by ``map_rows``, which maps ``mul`` over the row and itself instead."""
+
+    def __call__(self, element):
+        return element * element
+
+
+def _full(function, rows_lists: list) -> LList:
+    if isinstance(function, _Square):
+        return [list(map(mul, row, row)) for row in rows_lists[0]]
+
+    if isinstance(function, partial) and function.func is _power:
+        return [list(map(pow, row, repeat(function.keywords['exponent']))) for row in rows_lists[0]]
+
+    return [list(map(function, *rows)) for rows in zip(*rows_lists)]
+
+
+def _diagonal(function, rows_lists: list, start: int) -> LList:
+    mapped = []
+    for i, rows in enumerate(zip(*rows_lists), start):
+        row = list(rows[0])
+        if i < len(row):
+            row[i] = function(*(row_[i] for row_ in rows))
+
+        mapped.append(row)
+
+    return mapped
+
+
+def _off_diagonal(function, rows_lists: list, start: int) -> LList:
+    mapped = []
+    for i, rows in enumerate(zip(*rows_lists), start):
+        if i < len(rows[0]):
+            row = list(map(function, *(row_[:i] for row_ in rows)))
+            row.append(rows[0][i])
+            row.extend(map(function, *(row_[i + 1:] for row_ in rows)))
+        else:
+            row = list(map(function, *rows))
+
+        mapped.append(row)
+
+    return mapped
+
+
+def map_rows(function, rows_lists: list, apply_to: str = 'full', start: int = 0) -> LList:
+    """
+    Apply a function element wise to the rows of one or more matrices.
+
+    Parameters
+    ----------
+    function:
+        The function, taking one element of every matrix.
+    rows_lists:
+        The rows of every matrix, all the matrices having the same dimensions.
+    apply_to:
+        Where to apply the function, either 'diagonal', 'off-diagonal' or 'full'. The other elements are taken from
+        the first matrix. Default is 'full'.
+    start:
+        The index of the first row in the whole matrix, for the rows of a block. Default is 0.
+
+    Returns
+    -------
+        The mapped rows, as new lists.
+    """
+
+    if apply_to == 'full':
+        return _full(function, rows_lists)
+    elif apply_to == 'diagonal':
+        return _diagonal(function, rows_lists, start)
+    elif apply_to == 'off-diagonal':
+        return _off_diagonal(function, rows_lists, start)
+    else:
+        raise ValueError(f"Unknown apply_to '{apply_to}', use 'full', 'diagonal' or 'off-diagonal'.")
+
+
+def map_values(function, values_lists: list) -> list:
+    """Apply a function element wise to flat sequences of values, see ``map_rows``."""
+    return _full(function, [[values] for values in values_lists])[0]
@@ -0,0 +1,556 @@
+"""Elimination kernels
+
+This module contains the elimination routines used by :class:`matrix` for determinants and factorizations. All the
+routines work directly on nested lists and never modify the lists they are given. The routines include,
+
+- lu_factor: Partial-pivoting LU factorization, with L and U stored compactly in a single nested list, O(n^3).
+- cholesky_factor: Cholesky factorization of a symmetric positive definite matrix, stopping at the first
+  non-positive pivot, O(n^3 / 3).
+- householder_qr: Householder QR factorization, optionally with column pivoting, stored compactly, O(m n^2).
+- apply_householder: Multiplies vectors by Q or Q^T from the compact QR factors, O(m n) per vector.
+- lu_solve: Solves for any number of right-hand sides with the compact LU factors, O(n^2) per right-hand side.
+- forward_substitution: Solves lower triangular systems, O(n^2) per right-hand side.
+- back_substitution: Solves upper triangular systems, O(n^2) per right-hand side.
+- lu_determinant: Determinant through partial-pivoting LU elimination, O(n^3).
+- bareiss_determinant: Exact determinant through fraction-free Bareiss elimination, O(n^3).
+- bareiss_solve: Exact solutions through fraction-free Gauss-Jordan elimination, O(n^3 + n^2) per right-hand side.
+- bareiss_inverse: Exact inverse through fraction-free Gauss-Jordan elimination, O(n^3).
+- bareiss_adjugate: Exact adjugate through fraction-free Gauss-Jordan elimination, O(n^3).
+- cofactor_determinant: Determinant through cofactor expansion, O(n!), only for tiny matrices.
+- is_exact: Whether all the elements of a matrix are integers or fractions.
+
+Created on Oct 18 09:12:40 2026
+"""
+
+from fractions import Fraction
+from math import copysign, lcm, prod, sqrt
+from numbers import Rational
+from operator import mul
+from sys import float_info
+
+from .. import IFloat, LList
+from .custom_exceptions_ import DeterminantIsZero
+
+COFACTOR_MAX_SIZE = 8
+
+# the downdated column norms of the pivoting QR are computed again below this fraction of their last computed value
+_NORM_RECOMPUTE = sqrt(float_info.epsilon)
+
+
+def is_exact(elements: LList) -> bool:
+    """
+    Check whether the elements can be handled without floating point arithmetic.
+
+    Parameters
+    ----------
+    elements:
+        The nested list of matrix elements.
+
+    Returns
+    -------
+        True if every element is an integer or a fraction.
+    """
+
+    return all(isinstance(element, Rational) for row in elements for element in row)
+
+
+def lu_factor(elements: LList) -> tuple[LList, list, int]:
+    """
+    Factorize a square matrix as PA = LU, using partial pivoting.
+
+    Parameters
+    ----------
+    elements:
+        The nested list of a square matrix.
+
+    Returns
+    -------
+        The compact factors, holding the multipliers of the unit lower triangular L below the diagonal and U on and
+        above it, the row permutation, such that row ``i`` of PA is row ``permutation[i]`` of A, and the sign of the
+        permutation. A singular matrix is factorized as well, with a zero on the diagonal of U.
+    """
+
+    n_rows = len(elements)
+    lu_, permutation, sign_ = [list(row) for row in elements], list(range(n_rows)), 1
+
+    for col in range(n_rows):
+        pivot = max(range(col, n_rows), key=lambda r, col=col: abs(lu_[r][col]))
+        pivot_value = lu_[pivot][col]
+
+        if pivot != col:
+            lu_[col], lu_[pivot] = lu_[pivot], lu_[col]
+            permutation[col], permutation[pivot] = permutation[pivot], permutation[col]
+            sign_ = -sign_
+
+        if pivot_value == 0:
+            continue
+
+        pivot_tail = lu_[col][col + 1:]
+
+        for row in range(col + 1, n_rows):
+            row_ = lu_[row]
+            factor = row_[col] / pivot_value
+            row_[col] = factor
+            if factor:
+                row_[col + 1:] = [x - factor * y for x, y in zip(row_[col + 1:], pivot_tail)]
+
+    return lu_, permutation, sign_
+
+
+def cholesky_factor(elements: LList) -> LList:
+    """
+    Factorize a symmetric positive definite matrix as A = LL^T.
+
+    Parameters
+    ----------
+    elements:
+        The rows of the matrix, only the elements on and below the diagonal are read, so the packed rows of its lower
+        triangle are accepted as well.
+
+    Returns
+    -------
+        The packed rows of L, i + 1 elements in the row i, or None as soon as a pivot is not positive, i.e., if the
+        matrix is not positive definite.
+    """
+
+    lower = []
+    for i, row in enumerate(elements):
+        lower_row = []
+        for j in range(i):
+            # the row j of L has j + 1 elements, so ``map`` stops before its diagonal
+            lower_row.append((row[j] - sum(map(mul, lower_row, lower[j]))) / lower[j][j])
+
+        pivot = row[i] - sum(map(mul, lower_row, lower_row))
+        if not pivot > 0:
+            return None
+
+        lower_row.append(sqrt(pivot))
+        lower.append(lower_row)
+
+    return lower
+
+
+def forward_substitution(rows: LList, columns: LList, unit_diagonal: bool = False) -> LList:
+    """
+    Solve Lx = b for a lower triangular L.
+
+    Parameters
+    ----------
+    rows:
+        Rows of L, only the elements on and below the diagonal are read.
+    columns:
+        The right-hand sides, as a list of columns.
+    unit_diagonal:
+        Whether to take the diagonal of L as ones, without reading it. Default is False.
+
+    Returns
+    -------
+        The solutions, as a list of columns.
+    """
+
+    lower = [row[:i] for i, row in enumerate(rows)]
+    diagonal = None if unit_diagonal else [row[i] for i, row in enumerate(rows)]
+
+    solutions = []
+    for column in columns:
+        x_ = []
+        for i, lower_row in enumerate(lower):
+            value = column[i] - sum(map(mul, lower_row, x_))
+            x_.append(value if diagonal is None else value / diagonal[i])
+
+        solutions.append(x_)
+
+    return solutions
+
+
+def back_substitution(rows: LList, columns: LList, unit_diagonal: bool = False, packed: bool = False) -> LList:
+    """
+    Solve Ux = b for an upper triangular U.
+
+    Parameters
+    ----------
+    rows:
+        Rows of U, only the elements on and above the diagonal are read.
+    columns:
+        The right-hand sides, as a list of columns.
+    unit_diagonal:
+        Whether to take the diagonal of U as ones, without reading it. Default is False.
+    packed:
+        Whether the rows hold only the elements from the diagonal on, n - i elements in the row i. Default is False.
+
+    Returns
+    -------
+        The solutions, as a list of columns.
+    """
+
+    n_rows = len(rows)
+    if packed:
+        upper = [row[1:] for row in rows]
+        diagonal = None if unit_diagonal else [row[0] for row in rows]
+    else:
+        upper = [row[i + 1:] for i, row in enumerate(rows)]
+        diagonal = None if unit_diagonal else [row[i] for i, row in enumerate(rows)]
+
+    solutions = []
+    for column in columns:
+        x_ = [0] * n_rows
+        for i in reversed(range(n_rows)):
+            value = column[i] - sum(map(mul, upper[i], x_[i + 1:]))
+            x_[i] = value if diagonal is None else value / diagonal[i]
+
+        solutions.append(x_)
+
+    return solutions
+
+
+def householder_qr(columns: LList, pivoting: bool = False) -> tuple[LList, list, list]:
+    """
+    Factorize an m x n matrix as AP = QR through Householder reflections.
+
+    The reflection k is H_k = I - tau_k v_k v_k^T, with v_k zero above its element k and one at it. The factors are
+    stored compactly, in place of the columns of A: R on and above the diagonal, and the elements of v_k below the
+    diagonal of the column k.
+
+    Parameters
+    ----------
+    columns:
+        The columns of the matrix.
+    pivoting:
+        Whether to exchange the columns so that the remaining column of largest norm is reflected first, which makes
+        the magnitude of the diagonal of R non-increasing and reveals the rank of A. Default is False.
+
+    Returns
+    -------
+        The compact factors, as a list of columns, the scalar factors ``tau`` of the min(m, n) reflections and the
+        column permutation, such that column ``j`` of AP is column ``permutation[j]`` of A.
+    """
+
+    qr_ = [list(column) for column in columns]
+    n_cols, n_rows = len(qr_), len(qr_[0])
+    permutation, tau = list(range(n_cols)), []
+
+    # squared norms of the remaining parts of the columns, and their values when last computed from the elements
+    norms = [sum(map(mul, column, column)) for column in qr_] if pivoting else None
+    computed = list(norms) if pivoting else None
+
+    for k in range(min(n_rows, n_cols)):
+        if pivoting:
+            pivot = max(range(k, n_cols), key=norms.__getitem__)
+            if pivot != k:
+                for list_ in (qr_, permutation, norms, computed):
+                    list_[k], list_[pivot] = list_[pivot], list_[k]
+
+        column = qr_[k]
+        x_ = column[k:]
+        norm = sqrt(sum(map(mul, x_, x_)))
+        if norm == 0:
+            tau.append(0)
+            continue
+
+        alpha = x_[0]
+        beta = -copysign(norm, alpha)
+        scale = 1 / (alpha - beta)
+
+        column[k] = beta
+        column[k + 1:] = [x * scale for x in x_[1:]]
+        tau_ = (beta - alpha) / beta
+        tau.append(tau_)
+
+        v_ = [1] + column[k + 1:]
+        for j in range(k + 1, n_cols):
+            other = qr_[j]
+            w_ = tau_ * sum(map(mul, v_, other[k:]))
+            if w_:
+                other[k:] = [x - w_ * y for x, y in zip(other[k:], v_)]
+
+            if pivoting:
+                # downdating the norm loses its accuracy once most of it is removed, it is then computed again
+                norms[j] -= other[k] * other[k]
+                if norms[j] <= _NORM_RECOMPUTE * computed[j]:
+                    norms[j] = computed[j] = sum(map(mul, other[k + 1:], other[k + 1:]))
+
+    return qr_, tau, permutation
+
+
+def apply_householder(qr_: LList, tau: list, vectors: LList, transpose: bool = True) -> LList:
+    """
+    Multiply vectors by Q^T, or Q, given as the compact Householder factors of ``householder_qr``.
+
+    Parameters
+    ----------
+    qr_:
+        The compact factors.
+    tau:
+        The scalar factors of the reflections.
+    vectors:
+        The vectors, of m elements each.
+    transpose:
+        Whether to multiply by Q^T = H_(k-1) ... H_0, or by Q = H_0 ... H_(k-1). Default is True.
+
+    Returns
+    -------
+        The products, as new lists.
+    """
+
+    vectors = [list(vector) for vector in vectors]
+    reflections = list(enumerate(tau))
+
+    for k, tau_ in (reflections if transpose else reversed(reflections)):
+        if not tau_:
+            continue
+
+        v_ = [1] + qr_[k][k + 1:]
+        for vector in vectors:
+            w_ = tau_ * sum(map(mul, v_, vector[k:]))
+            vector[k:] = [x - w_ * y for x, y in zip(vector[k:], v_)]
+
+    return vectors
+
+
+def lu_solve(lu_: LList, permutation: list, columns: LList) -> LList:
+    """
+    Solve LUx = Pb through forward and back substitution.
+
+    Parameters
+    ----------
+    lu_:
+        The compact LU factors, as given by ``lu_factor``.
+    permutation:
+        The row permutation, as given by ``lu_factor``.
+    columns:
+        The right-hand sides, as a list of columns.
+
+    Returns
+    -------
+        The solutions, as a list of columns.
+    """
+
+    permuted = [[column[i] for i in permutation] for column in columns]
+
+    return back_substitution(lu_, forward_substitution(lu_, permuted, unit_diagonal=True))
+
+
+def lu_determinant(elements: LList) -> IFloat:
+    """
+    Calculate the determinant using LU elimination with partial pivoting.
+
+    Parameters
+    ----------
+    elements:
+        The nested list of a square matrix.
+
+    Returns
+    -------
+        Determinant of the matrix, as the product of the pivots of U.
+    """
+
+    lu_, _, sign_ = lu_factor(elements)
+
+    return sign_ * prod(row[i] for i, row in enumerate(lu_))
+
+
+def _integer_rows(elements: LList) -> tuple[LList, IFloat]:
+    """Scale every row of a rational matrix to integers, returns the integer rows and the total scale."""
+    rows_, scale_ = [], 1
+
+    for row in elements:
+        row_lcm = lcm(*(Fraction(element).denominator for element in row)) if row else 1
+        rows_.append([int(element * row_lcm) for element in row])
+        scale_ *= row_lcm
+
+    return rows_, scale_
+
+
+def bareiss_determinant(elements: LList) -> IFloat:
+    """
+    Calculate the exact determinant using fraction-free Bareiss elimination.
+
+    Rows containing fractions are scaled to integers beforehand, so the elimination itself only ever performs exact
+    integer divisions and the size of the intermediate values stays bounded by the size of the minors.
+
+    Parameters
+    ----------
+    elements:
+        The nested list of a square matrix with integer or fraction elements.
+
+    Returns
+    -------
+        Exact determinant, an int for integer input and a Fraction otherwise.
+    """
+
+    n_rows = len(elements)
+    rows_, scale_ = _integer_rows(elements)
+    sign_, previous = 1, 1
+
+    for k in range(n_rows - 1):
+        if rows_[k][k] == 0:
+            swap = next((r for r in range(k + 1, n_rows) if rows_[r][k] != 0), None)
+            if swap is None:
+                return 0
+            rows_[k], rows_[swap] = rows_[swap], rows_[k]
+            sign_ = -sign_
+
+        pivot_row, pivot_value = rows_[k], rows_[k][k]
+
+        for i in range(k + 1, n_rows):
+            row_, factor = rows_[i], rows_[i][k]
+            row_[k + 1:] = [(x * pivot_value - factor * y) // previous
+                            for x, y in zip(row_[k + 1:], pivot_row[k + 1:])]
+
+        previous = pivot_value
+
+    det_ = sign_ * rows_[-1][-1] if n_rows else 1
+
+    return det_ if scale_ == 1 else Fraction(det_, scale_)
+
+
+def cofactor_determinant(elements: LList) -> IFloat:
+    """
+    Calculate the determinant through recursive cofactor expansion along the first row.
+
+    Parameters
+    ----------
+    elements:
+        The nested list of a square matrix, with at most ``COFACTOR_MAX_SIZE`` rows.
+
+    Returns
+    -------
+        Determinant of the matrix.
+    """
+
+    if len(elements) > COFACTOR_MAX_SIZE:
+        raise ValueError(f'Cofactor expansion is only allowed up to {COFACTOR_MAX_SIZE}x{COFACTOR_MAX_SIZE} '
+                         f'matrices, use the "lu" or "bareiss" method instead.')
+
+    def calculate_determinant(mat: LList) -> IFloat:
+        len_mat, det = len(mat), 0
+
+        if len_mat == 1:
+            return mat[0][0]
+
+        for element in range(len_mat):
+            sub_matrix = [row[:element] + row[element + 1:] for row in mat[1:]]
+            cofactor = mat[0][element] * ((-1)**element)
+            det += cofactor * calculate_determinant(sub_matrix)
+
+        return det
+
+    return calculate_determinant(elements)
+
+
+def _exact(value: Fraction) -> IFloat:
+    """Gives an integral fraction as an int."""
+    return value.numerator if value.denominator == 1 else value
+
+
+def _bareiss_jordan(elements: LList, columns: LList) -> tuple[LList, IFloat, int, IFloat]:
+    """
+    Reduce the augmented matrix [A | B] with fraction-free Gauss-Jordan elimination.
+
+    Every row is scaled to integers beforehand, then each step replaces the rows other than the pivot row by
+    ``(pivot * row - factor * pivot_row) // previous_pivot``. The divisions are exact, and every intermediate value is
+    a minor of the scaled augmented matrix, so the integers grow linearly with the size instead of exponentially.
+
+    Returns
+    -------
+        The right-hand part of the reduced rows, the last pivot ``d``, which is the determinant of the row permuted
+        scaled A, so that the solutions are the right-hand part divided by ``d``, the sign of the row permutation and
+        the total scale of the rows.
+    """
+
+    n_rows = len(elements)
+    augmented = [list(row) + [column[i] for column in columns] for i, row in enumerate(elements)]
+    rows_, scale_ = _integer_rows(augmented)
+    sign_, previous = 1, 1
+
+    for k in range(n_rows):
+        if rows_[k][k] == 0:
+            swap = next((r for r in range(k + 1, n_rows) if rows_[r][k] != 0), None)
+            if swap is None:
+                raise DeterminantIsZero("The given matrix is singular and has no exact inverse or unique solution.")
+            rows_[k], rows_[swap] = rows_[swap], rows_[k]
+            sign_ = -sign_
+
+        pivot_row, pivot_value = rows_[k], rows_[k][k]
+        pivot_tail = pivot_row[k + 1:]
+
+        for i in range(n_rows):
+            if i == k:
+                continue
+
+            row_, factor = rows_[i], rows_[i][k]
+            if factor:
+                row_[k + 1:] = [(x * pivot_value - factor * y) // previous for x, y in zip(row_[k + 1:], pivot_tail)]
+            elif pivot_value != previous:
+                row_[k + 1:] = [x * pivot_value // previous for x in row_[k + 1:]]
+
+        previous = pivot_value
+
+    return [row[n_rows:] for row in rows_], previous, sign_, scale_
+
+
+def bareiss_solve(elements: LList, columns: LList) -> LList:
+    """
+    Solve Ax = b exactly using fraction-free Gauss-Jordan elimination.
+
+    Parameters
+    ----------
+    elements:
+        The nested list of a non-singular square matrix with integer or fraction elements.
+    columns:
+        The right-hand sides with integer or fraction elements, as a list of columns.
+
+    Returns
+    -------
+        The exact solutions, as a list of columns of ints and Fractions.
+    """
+
+    right, pivot_value, _, _ = _bareiss_jordan(elements, columns)
+
+    return [[_exact(Fraction(row[j], pivot_value)) for row in right] for j in range(len(columns))]
+
+
+def bareiss_inverse(elements: LList) -> LList:
+    """
+    Calculate the exact inverse using fraction-free Gauss-Jordan elimination.
+
+    Parameters
+    ----------
+    elements:
+        The nested list of a non-singular square matrix with integer or fraction elements.
+
+    Returns
+    -------
+        The exact inverse, as a nested list of ints and Fractions.
+    """
+
+    n_rows = len(elements)
+    right, pivot_value, _, _ = _bareiss_jordan(elements, [[int(i == j) for i in range(n_rows)] for j in range(n_rows)])
+
+    return [[_exact(Fraction(x, pivot_value)) for x in row] for row in right]
+
+
+def bareiss_adjugate(elements: LList) -> LList:
+    """
+    Calculate the exact adjugate, det(A) inverse(A), using fraction-free Gauss-Jordan elimination.
+
+    Eliminating [A | I] leaves ``d`` times the inverse of the row scaled A on the right, where ``d`` is its determinant
+    up to the sign of the row permutation, so the adjugate is read off without dividing by ``d``.
+
+    Parameters
+    ----------
+    elements:
+        The nested list of a non-singular square matrix with integer or fraction elements.
+
+    Returns
+    -------
+        The exact adjugate, as a nested list of ints for integer input and of ints and Fractions otherwise.
+    """
+
+    n_rows = len(elements)
+    right, _, sign_, scale_ = _bareiss_jordan(elements, [[int(i == j) for i in range(n_rows)] for j in range(n_rows)])
+
+    if scale_ == 1:
+        return [[sign_ * x for x in row] for row in right]
+
+    return [[_exact(Fraction(sign_ * x, scale_)) for x in row] for row in right]
@@ -0,0 +1,211 @@
+"""Multiplication kernels
+
+This module contains the matrix-matrix multiplication kernels used by :class:`matrix`. All kernels take the rows of the
+left and the right operand as nested lists and return the rows of the product. The kernels include,
+
+- naive_multiply: Row by column dot products, the right operand is transposed only once.
+- blocked_multiply: Same dot products, but tiled over rows, columns and the inner dimension for cache locality.
+- strassen_multiply: Strassen-Winograd recursion (7 multiplications per level) down to a size threshold.
+- multiply: Dispatches to one of the kernels above, either explicitly or automatically.
+
+Created on Oct 18 11:20:05 2026
+"""
+
+from operator import mul
+
+from .. import LList
+
+ALGORITHMS = ('auto', 'naive', 'blocked', 'strassen')
+
+BLOCK_SIZE = 64
+STRASSEN_THRESHOLD = 128
+
+
+def _columns(rows: LList) -> LList:
+    return [list(column) for column in zip(*rows)]
+
+
+def naive_multiply(a_rows: LList, b_rows: LList) -> LList:
+    """
+    Multiply two matrices through row by column dot products.
+
+    Parameters
+    ----------
+    a_rows:
+        Rows of the left matrix.
+    b_rows:
+        Rows of the right matrix.
+
+    Returns
+    -------
+        Rows of the product.
+    """
+
+    columns = _columns(b_rows)
+
+    return [[sum(map(mul, row, column)) for column in columns] for row in a_rows]
+
+
+def blocked_multiply(a_rows: LList, b_rows: LList, block_size: int = BLOCK_SIZE) -> LList:
+    """
+    Multiply two matrices by tiling the rows, the columns and the inner dimension into blocks.
+
+    Parameters
+    ----------
+    a_rows:
+        Rows of the left matrix.
+    b_rows:
+        Rows of the right matrix.
+    block_size:
+        Size of the square tiles. Default is ``BLOCK_SIZE``.
+
+    Returns
+    -------
+        Rows of the product.
+    """
+
+    n_rows, n_inner, n_cols = len(a_rows), len(b_rows), len(b_rows[0])
+    columns = _columns(b_rows)
+    result = [[0] * n_cols for _ in range(n_rows)]
+
+    for k_0 in range(0, n_inner, block_size):
+        k_1 = k_0 + block_size
+        a_tile = [row[k_0:k_1] for row in a_rows]
+        c_tile = [column[k_0:k_1] for column in columns]
+
+        for i_0 in range(0, n_rows, block_size):
+            for j_0 in range(0, n_cols, block_size):
+                columns_ = c_tile[j_0:j_0 + block_size]
+                for row, out in zip(a_tile[i_0:i_0 + block_size], result[i_0:i_0 + block_size]):
+                    out[j_0:j_0 + len(columns_)] = [value + sum(map(mul, row, column))
+                                                    for value, column in zip(out[j_0:j_0 + block_size], columns_)]
+
+    return result
+
+
+def _add(x_rows: LList, y_rows: LList) -> LList:
+    return [[x + y for x, y in zip(x_row, y_row)] for x_row, y_row in zip(x_rows, y_rows)]
+
+
+def _sub(x_rows: LList, y_rows: LList) -> LList:
+    return [[x - y for x, y in zip(x_row, y_row)] for x_row, y_row in zip(x_rows, y_rows)]
+
+
+def _pad(rows: LList, n_rows: int, n_cols: int) -> LList:
+    padded = [row + [0] * (n_cols - len(row)) for row in rows]
+    return padded + [[0] * n_cols for _ in range(n_rows - len(rows))]
+
+
+def _quadrants(rows: LList, half_rows: int, half_cols: int) -> tuple:
+    top, bottom = rows[:half_rows], rows[half_rows:]
+    return ([row[:half_cols] for row in top], [row[half_cols:] for row in top],
+            [row[:half_cols] for row in bottom], [row[half_cols:] for row in bottom])
+
+
+def strassen_multiply(a_rows: LList, b_rows: LList, threshold: int = STRASSEN_THRESHOLD) -> LList:
+    """
+    Multiply two matrices with the Winograd variant of Strassen's recursion.
+
+    Every level splits both operands into quadrants, padding odd dimensions with zeros, and forms the product with 7
+    multiplications and 15 additions. Once any dimension drops to ``threshold`` or below, the naive kernel is used.
+
+    Parameters
+    ----------
+    a_rows:
+        Rows of the left matrix.
+    b_rows:
+        Rows of the right matrix.
+    threshold:
+        The size at or below which the recursion stops. Default is ``STRASSEN_THRESHOLD``.
+
+    Returns
+    -------
+        Rows of the product.
+    """
+
+    n_rows, n_inner, n_cols = len(a_rows), len(b_rows), len(b_rows[0])
+
+    if min(n_rows, n_inner, n_cols) <= max(threshold, 1):
+        return naive_multiply(a_rows, b_rows)
+
+    h_rows, h_inner, h_cols = (n_rows + 1) // 2, (n_inner + 1) // 2, (n_cols + 1) // 2
+    a_rows = _pad(a_rows, 2 * h_rows, 2 * h_inner)
+    b_rows = _pad(b_rows, 2 * h_inner, 2 * h_cols)
+
+    a11, a12, a21, a22 = _quadrants(a_rows, h_rows, h_inner)
+    b11, b12, b21, b22 = _quadrants(b_rows, h_inner, h_cols)
+
+    s_1 = _add(a21, a22)
+    s_2 = _sub(s_1, a11)
+    s_3 = _sub(a11, a21)
+    s_4 = _sub(a12, s_2)
+    t_1 = _sub(b12, b11)
+    t_2 = _sub(b22, t_1)
+    t_3 = _sub(b22, b12)
+    t_4 = _sub(t_2, b21)
+
+    p_1 = strassen_multiply(a11, b11, threshold)
+    p_2 = strassen_multiply(a12, b21, threshold)
+    p_3 = strassen_multiply(s_4, b22, threshold)
+    p_4 = strassen_multiply(a22, t_4, threshold)
+    p_5 = strassen_multiply(s_1, t_1, threshold)
+    p_6 = strassen_multiply(s_2, t_2, threshold)
+    p_7 = strassen_multiply(s_3, t_3, threshold)
+
+    u_2 = _add(p_1, p_6)
+    u_3 = _add(u_2, p_7)
+
+    c11 = _add(p_1, p_2)
+    c12 = _add(_add(u_2, p_5), p_3)
+    c21 = _sub(u_3, p_4)
+    c22 = _add(u_3, p_5)
+
+    top = [left + right for left, right in zip(c11, c12)]
+    bottom = [left + right for left, right in zip(c21, c22)]
+
+    return [row[:n_cols] for row in (top + bottom)[:n_rows]]
+
+
+def multiply(a_rows: LList, b_rows: LList, algorithm: str = 'auto', block_size: int = None,
+             strassen_threshold: int = None) -> LList:
+    """
+    Multiply two matrices with the requested kernel.
+
+    Parameters
+    ----------
+    a_rows:
+        Rows of the left matrix.
+    b_rows:
+        Rows of the right matrix.
+    algorithm:
+        One of 'auto', 'naive', 'blocked' or 'strassen'. Default is 'auto', which uses the Strassen-Winograd recursion
+        when all the dimensions exceed the Strassen threshold, the blocked kernel when any dimension exceeds four
+        blocks and the naive kernel otherwise.
+    block_size:
+        Tile size for the blocked kernel. Default is ``BLOCK_SIZE``.
+    strassen_threshold:
+        Size at or below which the Strassen recursion stops. Default is ``STRASSEN_THRESHOLD``.
+
+    Returns
+    -------
+        Rows of the product.
+    """
+
+    block_size = BLOCK_SIZE if block_size is None else block_size
+    strassen_threshold = STRASSEN_THRESHOLD if strassen_threshold is None else strassen_threshold
+
+    if algorithm == 'auto':
+        dimensions = len(a_rows), len(b_rows), len(b_rows[0])
+        if min(dimensions) > strassen_threshold:
+            algorithm = 'strassen'
+        else:
+            algorithm = 'blocked' if max(dimensions) > 4 * block_size else 'naive'
+
+    if algorithm == 'naive':
+        return naive_multiply(a_rows, b_rows)
+    elif algorithm == 'blocked':
+        return blocked_multiply(a_rows, b_rows, block_size)
+    elif algorithm == 'strassen':
+        return strassen_multiply(a_rows, b_rows, strassen_threshold)
+    else:
+        raise ValueError(f"Unknown multiplication algorithm '{algorithm}', use one of {', '.join(ALGORITHMS)}.")
@@ -0,0 +1,198 @@
+"""NPY files
+
+This module reads and writes the flat buffers of :class:`matrix` in the NumPy ``.npy`` format, without requiring
+NumPy. A file holds a short text header, with the dtype, the order and the shape, followed by the raw elements, so
+files written here are read by ``numpy.load`` and the other way around. The module provides,
+
+- write: Writes the header and the elements, given as a sequence of row-major chunks.
+- create: Creates a file of the given shape, without writing the elements, to be filled through a memory mapping.
+- read_header: Parses the header of a file.
+- read: Gives the flat buffer of a file, either memory mapped or read into an ``array``.
+
+The int64 and float64 elements of a file in native byte order are memory mapped directly, as a ``memoryview`` with
+format 'q' or 'd', so the elements are only paged in when they are accessed. Every other dtype, i.e., the smaller or
+unsigned integers, float32 and booleans, and the files in the other byte order, are read and converted into an
+``array('q')`` or ``array('d')``.
+
+Created on Oct 18 22:05:31 2026
+"""
+
+import mmap as mmap_
+import sys
+from array import array
+from ast import literal_eval
+
+MAGIC = b'\x93NUMPY'
+
+# the header, including the magic string and its length, is padded to a multiple of this
+ALIGNMENT = 64
+
+# numpy dtype kind and size to the array typecodes of the same size
+_TYPECODES = {}
+for typecode_ in 'bBhHiIqQlLfd':
+    _TYPECODES.setdefault(('u' if typecode_.isupper() else 'f' if typecode_ in 'fd' else 'i',
+                           array(typecode_).itemsize), typecode_)
+
+# access and file mode for every memory mapping mode
+_MODES = {'r': (mmap_.ACCESS_READ, 'rb'), 'r+': (mmap_.ACCESS_WRITE, 'r+b'), 'c': (mmap_.ACCESS_COPY, 'rb')}
+
+_NATIVE = '<' if sys.byteorder == 'little' else '>'
+
+
+def write(path: str, typecode: str, shape: tuple, chunks):
+    """
+    Write the elements into an ``.npy`` file.
+
+    Parameters
+    ----------
+    path:
+        The file to write.
+    typecode:
+        The typecode of the elements, 'q' or 'd'.
+    shape:
+        The shape of the elements, ``(n_cols,)`` for a row vector.
+    chunks:
+        Iterable of arrays of the given typecode, holding the elements in row-major order.
+    """
+
+    with open(path, 'wb') as file_:
+        file_.write(_header(typecode, shape))
+        for chunk in chunks:
+            file_.write(chunk)
+
+
+def create(path: str, typecode: str, shape: tuple):
+    """
+    Create an ``.npy`` file of the given shape, with all the elements zero.
+
+    The file is only extended to its full size, so on most file systems the elements take no disk space until they are
+    written, e.g., through the buffer of ``read(path, mode='r+')``.
+
+    Parameters
+    ----------
+    path:
+        The file to create.
+    typecode:
+        The typecode of the elements, 'q' or 'd'.
+    shape:
+        The shape of the elements, ``(n_cols,)`` for a row vector.
+    """
+
+    header = _header(typecode, shape)
+    size = shape[0] if len(shape) == 1 else shape[0] * shape[1]
+
+    with open(path, 'wb') as file_:
+        file_.write(header)
+        file_.truncate(len(header) + size * array(typecode).itemsize)
+
+
+def _header(typecode: str, shape: tuple) -> bytes:
+    """Gives the magic string, the version and the header, padded to ``ALIGNMENT`` bytes."""
+    descr = f"{_NATIVE}{'i' if typecode == 'q' else 'f'}8"
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': {tuple(shape)}, }}"
+
+    # magic, version and the length of the header, the header is terminated by a newline
+    padding = -(len(MAGIC) + 4 + len(header) + 1) % ALIGNMENT
+    header = (header + ' ' * padding + '\n').encode('latin1')
+
+    return MAGIC + bytes([1, 0]) + len(header).to_bytes(2, 'little') + header
+
+
+def read_header(file_) -> tuple[str, bool, tuple, int]:
+    """
+    Parse the header of an ``.npy`` file.
+
+    Parameters
+    ----------
+    file_:
+        The file, opened in binary mode and positioned at its start.
+
+    Returns
+    -------
+        The dtype description, e.g., '<f8', whether the elements are in column-major order, the shape and the offset
+        of the elements in the file.
+    """
+
+    prefix = file_.read(len(MAGIC) + 2)
+    if prefix[:len(MAGIC)] != MAGIC:
+        raise ValueError('The file is not in the .npy format.')
+
+    major = prefix[-2]
+    if major not in (1, 2, 3):
+        raise ValueError(f'Unsupported .npy format version {major}.')
+
+    n_bytes = 2 if major == 1 else 4
+    length = int.from_bytes(file_.read(n_bytes), 'little')
+    header = literal_eval(file_.read(length).decode('latin1' if major < 3 else 'utf8'))
+
+    return header['descr'], header['fortran_order'], tuple(header['shape']), len(MAGIC) + 2 + n_bytes + length
+
+
+def _typecode(descr) -> tuple[str, str]:
+    """Gives the array typecode and the byte order of a dtype description."""
+    if not isinstance(descr, str) or len(descr) < 3 or descr[1] not in 'iufb':
+        raise ValueError(f"Unsupported dtype {descr!r}, only integer, float and boolean elements can be loaded.")
+
+    kind, size = ('u', 1) if descr[1] == 'b' else (descr[1], int(descr[2:]))
+    if (kind, size) not in _TYPECODES:
+        raise ValueError(f"Unsupported dtype {descr!r}, only integer, float and boolean elements can be loaded.")
+
+    return _TYPECODES[kind, size], _NATIVE if descr[0] in '|=' else descr[0]
+
+
+def read(path: str, mmap: bool = True, mode: str = 'r') -> tuple:
+    """
+    Read the elements of an ``.npy`` file.
+
+    Parameters
+    ----------
+    path:
+        The file to read.
+    mmap:
+        Whether to memory map the int64/float64 elements instead of reading them. Default is True.
+    mode:
+        The memory mapping mode, 'r' for read-only, 'r+' for writing the assignments through to the file or 'c' for
+        keeping the assignments in memory only. Default is 'r'.
+
+    Returns
+    -------
+        The flat buffer, with format 'q' or 'd', its shape and its strides.
+    """
+
+    if mode not in _MODES:
+        raise ValueError(f"Unknown mode '{mode}', use 'r', 'r+' or 'c'.")
+
+    access, file_mode = _MODES[mode]
+
+    with open(path, file_mode) as file_:
+        descr, fortran_order, shape, offset = read_header(file_)
+        if len(shape) not in (1, 2):
+            raise ValueError('Only one- and two-dimensional arrays can be loaded as matrices.')
+
+        typecode, byte_order = _typecode(descr)
+        size = shape[0] if len(shape) == 1 else shape[0] * shape[1]
+        n_bytes = size * array(typecode).itemsize
+
+        if mmap and size and typecode in 'qd' and byte_order == _NATIVE:
+            map_ = mmap_.mmap(file_.fileno(), 0, access=access)
+            if len(map_) < offset + n_bytes:
+                raise ValueError('The file is truncated.')
+            buffer = memoryview(map_)[offset:offset + n_bytes].cast(typecode)
+        else:
+            buffer = array(typecode)
+            buffer.frombytes(file_.read(n_bytes))
+            if byte_order != _NATIVE:
+                buffer.byteswap()
+
+    if typecode not in 'qd':
+        try:
+            buffer = array('d' if typecode in 'fd' else 'q', buffer)
+        except OverflowError:
+            raise ValueError(f'The {descr!r} elements do not fit in an int64 array storage.') from None
+
+    if len(buffer) != size:
+        raise ValueError('The file is truncated.')
+
+    strides = (1, shape[0]) if fortran_order and len(shape) == 2 else None
+
+    return buffer, shape, strides
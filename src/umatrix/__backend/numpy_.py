@@ -0,0 +1,194 @@
+"""NumPy kernels
+
+This module contains the vectorized ndarray kernels used by :class:`matrix` when NumPy is installed. NumPy is an
+optional dependency, if it can't be imported, ``available`` returns False and none of the kernels are used. The
+module provides,
+
+- available: Whether NumPy can be used or not.
+- from_buffer: Wraps a flat storage buffer as an ndarray without copying.
+- from_rows: Creates an ndarray from a nested list.
+- to_buffer: Gives a flat buffer sharing the memory of a C-contiguous ndarray.
+- to_rows: Gives the nested list of an ndarray.
+- is_numeric: Whether the ndarray holds plain int/float elements or not.
+- matmul, inverse, determinant, hadamard, apply: The vectorized kernels.
+
+Created on Oct 18 12:41:36 2026
+"""
+
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .. import LList
+
+_INT_LIMIT = 2**63 - 1
+
+# the ufuncs replacing the scalar builtins, which don't accept ndarrays
+_UFUNC_NAMES = {abs: 'abs', math.sqrt: 'sqrt', math.exp: 'exp', math.expm1: 'expm1', math.log: 'log',
+                math.log1p: 'log1p', math.log2: 'log2', math.log10: 'log10', math.sin: 'sin', math.cos: 'cos',
+                math.tan: 'tan', math.asin: 'arcsin', math.acos: 'arccos', math.atan: 'arctan', math.sinh: 'sinh',
+                math.cosh: 'cosh', math.tanh: 'tanh', math.asinh: 'arcsinh', math.acosh: 'arccosh',
+                math.atanh: 'arctanh', math.fabs: 'fabs', math.degrees: 'degrees', math.radians: 'radians'}
+
+
+def available() -> bool:
+    """Whether NumPy is importable or not."""
+    return numpy is not None
+
+
+def _dtype(typecode: str):
+    return numpy.float64 if typecode == 'd' else numpy.int64
+
+
+def from_buffer(buffer, typecode: str, shape: tuple, strides: tuple, offset: int):
+    """
+    Wraps a flat storage buffer as an ndarray, sharing its memory.
+
+    Parameters
+    ----------
+    buffer:
+        The ``array`` or ``memoryview`` holding the elements.
+    typecode:
+        The typecode of the buffer, 'q' or 'd'.
+    shape:
+        Shape of the storage.
+    strides:
+        Strides of the storage, in elements.
+    offset:
+        Offset of the first element of the storage inside the buffer.
+
+    Returns
+    -------
+        An ndarray view of the storage.
+    """
+
+    flat_ = numpy.frombuffer(buffer, dtype=_dtype(typecode))
+    byte_strides = tuple(stride * flat_.itemsize for stride in strides)
+
+    return numpy.lib.stride_tricks.as_strided(flat_[offset:], shape=shape, strides=byte_strides)
+
+
+def from_rows(rows: LList):
+    """Creates an ndarray from a nested list."""
+    return numpy.array(rows)
+
+
+def to_buffer(ndarray) -> tuple:
+    """
+    Gives a flat buffer for the ndarray, sharing its memory whenever the ndarray is already C-contiguous.
+
+    Parameters
+    ----------
+    ndarray:
+        The ndarray to convert.
+
+    Returns
+    -------
+        The flat ``memoryview`` with format 'q' or 'd', and the shape of the ndarray.
+    """
+
+    if ndarray.dtype == object:
+        raise OverflowError('The elements do not fit in an int64 or float64 array storage.')
+
+    if ndarray.dtype.kind in 'iub':
+        ndarray, typecode = ndarray.astype(numpy.int64, copy=False), 'q'
+    else:
+        ndarray, typecode = ndarray.astype(numpy.float64, copy=False), 'd'
+
+    ndarray = numpy.ascontiguousarray(ndarray)
+
+    return memoryview(ndarray.reshape(-1)).cast('B').cast(typecode), ndarray.shape
+
+
+def to_rows(ndarray) -> LList:
+    """Gives the nested list of an ndarray, with Python scalars as elements."""
+    return ndarray.tolist()
+
+
+def is_numeric(ndarray) -> bool:
+    """Whether the ndarray holds int/float elements, arrays of Python objects (e.g., fractions) are not numeric."""
+    return ndarray.dtype.kind in 'iubf'
+
+
+def _exact_dtype(a_, b_, inner: int = 1):
+    """Promote integer operands to Python objects when the int64 result could overflow."""
+    if a_.dtype.kind in 'iub' and b_.dtype.kind in 'iub' and a_.size and b_.size:
+        bound = int(numpy.abs(a_).max()) * int(numpy.abs(b_).max()) * inner
+        if bound > _INT_LIMIT:
+            return a_.astype(object), b_.astype(object)
+
+    return a_, b_
+
+
+def matmul(a_, b_):
+    """Matrix product of two ndarrays."""
+    a_, b_ = _exact_dtype(a_, b_, a_.shape[-1])
+    return a_ @ b_
+
+
+def inverse(a_):
+    """Inverse of a square ndarray, raises ValueError if it is singular."""
+    try:
+        return numpy.linalg.inv(a_)
+    except numpy.linalg.LinAlgError as error:
+        raise ValueError("Matrix is singular (no unique inverse).") from error
+
+
+def determinant(a_) -> float:
+    """Determinant of a square ndarray, through LAPACK's LU factorization."""
+    return float(numpy.linalg.det(a_))
+
+
+def hadamard(a_, b_):
+    """Element wise product of two ndarrays."""
+    a_, b_ = _exact_dtype(a_, b_)
+    return a_ * b_
+
+
+def apply(a_, function, apply_to: str = 'full'):
+    """
+    Apply a function on the whole ndarray at once.
+
+    Parameters
+    ----------
+    a_:
+        The ndarray to be mapped.
+    function:
+        The function to apply, it must accept an ndarray and return an ndarray of the same shape, e.g., arithmetic
+        lambdas or NumPy ufuncs. ``abs`` and the ``math`` functions are replaced by the equivalent ufuncs. Only
+        floating point ndarrays are mapped, since integer ndarrays silently wrap around on overflow.
+    apply_to:
+        Where to apply the function, either 'diagonal', 'off-diagonal' or 'full'.
+
+    Returns
+    -------
+        The mapped ndarray, or None if the function can't be vectorized, in which case the caller has to apply it
+        element by element.
+    """
+
+    if a_.dtype.kind != 'f':
+        return None
+
+    try:
+        function = getattr(numpy, _UFUNC_NAMES[function], function)
+    except (KeyError, TypeError):
+        pass
+
+    try:
+        with numpy.errstate(all='raise'):
+            result = function(a_)
+    except (TypeError, ValueError, ArithmeticError):
+        return None
+
+    if not isinstance(result, numpy.ndarray) or result.shape != a_.shape or result.dtype == object:
+        return None
+
+    if apply_to == 'full':
+        return result
+
+    mask_ = numpy.eye(*a_.shape, dtype=bool)
+
+    return numpy.where(mask_, result, a_) if apply_to == 'diagonal' else numpy.where(mask_, a_, result)
@@ -0,0 +1,227 @@
+"""Parallel kernels
+
+This module contains the process pool kernels used by :class:`matrix` for opt-in multi-core execution. The operands are
+partitioned into row (or column) blocks, each block is shipped to a worker process packed as a flat ``array`` buffer,
+and the results are packed the same way on the way back. Work below ``THRESHOLD`` scalar operations always runs
+serially, since starting the worker processes costs more than it saves. The module provides,
+
+- parallel: Context manager enabling parallel execution for all the supported operations inside it.
+- resolve_workers: Gives the number of workers to use for an operation of a given size.
+- parallel_multiply: Matrix product, with the rows of the left operand split across the workers.
+- parallel_lu_inverse: Inverse from LU factors, with the columns of the identity split across the workers.
+- parallel_map: Element wise function application, with the rows split across the workers.
+- can_ship: Whether a function can be sent to the worker processes or not.
+
+Created on Oct 18 14:22:09 2026
+"""
+
+import pickle
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+from multiprocessing import get_start_method
+from os import cpu_count
+
+from . import elementwise_ as elem_, elimination_ as elim_, multiplication_ as mult_
+from .. import LList
+
+THRESHOLD = 2_000_000
+
+_SETTINGS = {'workers': 1, 'threshold': THRESHOLD}
+
+# state of the worker processes, set once per pool by the initializer
+_WORKER = {}
+
+
+@contextmanager
+def parallel(workers: int = None, threshold: int = None):
+    """
+    Enable parallel execution of products, inverses and ``map_to_matrix`` inside the context.
+
+    Parameters
+    ----------
+    workers:
+        Number of worker processes. Default is the number of CPUs.
+    threshold:
+        Minimum number of scalar operations for an operation to run in parallel. Default is ``THRESHOLD``.
+    """
+
+    previous = dict(_SETTINGS)
+    _SETTINGS['workers'] = (cpu_count() or 1) if workers is None else workers
+    _SETTINGS['threshold'] = THRESHOLD if threshold is None else threshold
+
+    try:
+        yield
+    finally:
+        _SETTINGS.update(previous)
+
+
+def resolve_workers(workers: int, n_operations: int) -> int:
+    """
+    Gives the number of workers to use.
+
+    Parameters
+    ----------
+    workers:
+        The explicitly requested number of workers, None to use the one set by ``parallel``.
+    n_operations:
+        Estimated number of scalar operations of the computation.
+
+    Returns
+    -------
+        The number of workers, 1 means the computation has to run serially.
+    """
+
+    workers = _SETTINGS['workers'] if workers is None else workers
+
+    return workers if workers > 1 and n_operations >= _SETTINGS['threshold'] else 1
+
+
+def _pack(rows: LList) -> tuple:
+    """Packs the rows in a flat int64/float64 buffer, falls back to the rows themselves for other elements."""
+    values = list(chain.from_iterable(rows))
+    n_cols = len(rows[0]) if rows else 0
+
+    for typecode, types_ in (('q', int), ('d', (int, float))):
+        if all(isinstance(value, types_) for value in values):
+            try:
+                return typecode, n_cols, array(typecode, values).tobytes()
+            except OverflowError:
+                break
+
+    return None, n_cols, rows
+
+
+def _unpack(payload: tuple) -> LList:
+    typecode, n_cols, data = payload
+    if typecode is None or n_cols == 0:
+        return data if typecode is None else []
+
+    values = array(typecode)
+    values.frombytes(data)
+
+    return [values[i:i + n_cols].tolist() for i in range(0, len(values), n_cols)]
+
+
+def _blocks(n_items: int, workers: int) -> list:
+    """Splits ``range(n_items)`` into twice as many contiguous blocks as there are workers, for load balancing."""
+    size_ = max(1, -(-n_items // (2 * workers)))
+    return [(start, min(start + size_, n_items)) for start in range(0, n_items, size_)]
+
+
+def _initialize(state: dict, packed: dict):
+    _WORKER.clear()
+    _WORKER.update(state)
+    _WORKER.update({key: _unpack(payload) for key, payload in packed.items()})
+
+
+def _run(workers: int, task, payloads: list, state: dict = None, packed: dict = None) -> list:
+    """Runs the task over the payloads in a process pool, the packed state is unpacked once per worker."""
+    initargs = (state or {}, packed or {})
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize, initargs=initargs) as executor:
+        return list(executor.map(task, payloads))
+
+
+def _multiply_block(payload: tuple) -> tuple:
+    return _pack(mult_.multiply(_unpack(payload), _WORKER['b_rows']))
+
+
+def parallel_multiply(a_rows: LList, b_rows: LList, workers: int) -> LList:
+    """
+    Matrix product, with the row blocks of the left operand computed in separate processes.
+
+    Parameters
+    ----------
+    a_rows:
+        Rows of the left matrix.
+    b_rows:
+        Rows of the right matrix, shipped once to every worker.
+    workers:
+        Number of worker processes.
+
+    Returns
+    -------
+        Rows of the product.
+    """
+
+    payloads = [_pack(a_rows[start:stop]) for start, stop in _blocks(len(a_rows), workers)]
+    results = _run(workers, _multiply_block, payloads, packed={'b_rows': _pack(b_rows)})
+
+    return list(chain.from_iterable(_unpack(result) for result in results))
+
+
+def _solve_block(payload: tuple) -> tuple:
+    start, stop, n_rows = payload
+    columns = [[int(i == j) for i in range(n_rows)] for j in range(start, stop)]
+
+    return _pack(elim_.lu_solve(_WORKER['lu'], _WORKER['permutation'], columns))
+
+
+def parallel_lu_inverse(lu_: LList, permutation: list, workers: int) -> LList:
+    """
+    Inverse from the compact LU factors, with the identity columns solved in separate processes.
+
+    Parameters
+    ----------
+    lu_:
+        The compact LU factors, as given by ``elimination_.lu_factor``.
+    permutation:
+        The row permutation, as given by ``elimination_.lu_factor``.
+    workers:
+        Number of worker processes.
+
+    Returns
+    -------
+        Rows of the inverse.
+    """
+
+    n_rows = len(lu_)
+    payloads = [(start, stop, n_rows) for start, stop in _blocks(n_rows, workers)]
+    results = _run(workers, _solve_block, payloads, {'permutation': permutation}, {'lu': _pack(lu_)})
+    columns = list(chain.from_iterable(_unpack(result) for result in results))
+
+    return [list(row) for row in zip(*columns)]
+
+
+def _map_block(payload: tuple) -> tuple:
+    start, block = payload
+    function, apply_to = _WORKER['function'], _WORKER['apply_to']
+
+    return _pack(elem_.map_rows(function, [_unpack(block)], apply_to, start))
+
+
+def can_ship(function) -> bool:
+    """Whether the function can reach the worker processes, either pickled or inherited through ``fork``."""
+    try:
+        pickle.dumps(function)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return get_start_method() == 'fork'
+
+    return True
+
+
+def parallel_map(rows: LList, function, apply_to: str, workers: int) -> LList:
+    """
+    Apply a function element wise, with the row blocks mapped in separate processes.
+
+    Parameters
+    ----------
+    rows:
+        Rows of the matrix to be mapped.
+    function:
+        The function to apply, see ``can_ship``.
+    apply_to:
+        Where to apply the function, either 'diagonal', 'off-diagonal' or 'full'.
+    workers:
+        Number of worker processes.
+
+    Returns
+    -------
+        Rows of the mapped matrix.
+    """
+
+    payloads = [(start, _pack(rows[start:stop])) for start, stop in _blocks(len(rows), workers)]
+    results = _run(workers, _map_block, payloads, {'function': function, 'apply_to': apply_to})
+
+    return list(chain.from_iterable(_unpack(result) for result in results))
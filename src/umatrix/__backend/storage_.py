@@ -0,0 +1,227 @@
+"""Flat storage
+
+This module contains the array backed storage of :class:`matrix`. Instead of a list of Python lists, the elements are
+kept in a single contiguous ``array('q')`` (integers) or ``array('d')`` (floats) buffer, along with the shape, the
+strides and the offset of the matrix inside that buffer. A flat ``memoryview`` with format 'q' or 'd' can be used as
+the buffer as well, e.g., to share the memory of an ndarray. The module provides,
+
+- FlatStorage: The flat buffer along with its shape, strides and offset.
+- infer_typecode: Gives the array typecode that can hold the given values.
+- result_typecode: Gives the typecode of the result of an operation between buffers.
+
+Transposing, indexing or slicing a storage only changes its offset, shape and strides, the returned storage is a view
+that shares the buffer of the original one. ``FlatStorage.copy`` materializes a view into a new contiguous buffer.
+
+A one-dimensional storage, with shape ``(n_cols,)``, corresponds to a row vector, while a two-dimensional storage, with
+shape ``(n_rows, n_cols)``, corresponds to every other matrix.
+
+Created on Oct 18 10:02:17 2026
+"""
+
+from array import array
+from itertools import chain
+
+INT_TYPECODE = 'q'
+FLOAT_TYPECODE = 'd'
+
+_INT_TYPES, _NUMBER_TYPES = {int, bool}, {int, bool, float}
+
+
+def infer_typecode(values) -> str:
+    """
+    Gives the typecode of the array that can hold all the given values.
+
+    Parameters
+    ----------
+    values:
+        The values to be stored.
+
+    Returns
+    -------
+        'q' if all the values are integers, 'd' if all the values are integers or floats.
+    """
+
+    # the exact types are checked first, as it is much faster than an isinstance check per value
+    types = set(map(type, values))
+    if types <= _INT_TYPES:
+        return INT_TYPECODE
+    if types <= _NUMBER_TYPES:
+        return FLOAT_TYPECODE
+
+    if all(isinstance(value, int) for value in values):
+        return INT_TYPECODE
+
+    if all(isinstance(value, (int, float)) for value in values):
+        return FLOAT_TYPECODE
+
+    raise ValueError('Array storage only supports int and float elements.')
+
+
+def result_typecode(*operands) -> str:
+    """
+    Gives the typecode of the result of an element wise operation between storages and/or scalars.
+
+    Parameters
+    ----------
+    operands:
+        The typecodes of the storages, or the scalar values, taking part in the operation.
+
+    Returns
+    -------
+        'q' if all the operands are integers, 'd' otherwise.
+    """
+
+    for operand in operands:
+        if operand == FLOAT_TYPECODE or isinstance(operand, float):
+            return FLOAT_TYPECODE
+
+    return INT_TYPECODE
+
+
+def contiguous_strides(shape: tuple) -> tuple:
+    """Gives the row-major strides, in elements, for the given shape."""
+    return (1,) if len(shape) == 1 else (shape[1], 1)
+
+
+class FlatStorage:
+    """Flat, strided, array backed storage for the elements of a matrix."""
+
+    __slots__ = ('buffer', 'shape', 'strides', 'offset')
+
+    def __init__(self, buffer: array, shape: tuple, strides: tuple = None, offset: int = 0):
+        self.buffer = buffer
+        self.shape = tuple(shape)
+        self.strides = contiguous_strides(self.shape) if strides is None else tuple(strides)
+        self.offset = offset
+
+    @classmethod
+    def from_elements(cls, elements, typecode: str = None):
+        """Creates the storage from a nested list, or from a flat list for a row vector."""
+        if elements and isinstance(elements[0], list):
+            shape, values = (len(elements), len(elements[0])), list(chain.from_iterable(elements))
+        else:
+            shape, values = (len(elements),), list(elements)
+
+        return cls.from_values(values, shape, typecode)
+
+    @classmethod
+    def from_values(cls, values, shape: tuple, typecode: str = None):
+        """Creates a contiguous storage from the row-major values."""
+        values = values if isinstance(values, list) else list(values)
+        typecode = infer_typecode(values) if typecode is None else typecode
+
+        return cls(array(typecode, values), shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return self.shape[0] if self.ndim == 1 else self.shape[0] * self.shape[1]
+
+    @property
+    def typecode(self) -> str:
+        return self.buffer.typecode if isinstance(self.buffer, array) else self.buffer.format
+
+    @property
+    def is_contiguous(self) -> bool:
+        return self.strides == contiguous_strides(self.shape) or self.size <= 1
+
+    def position(self, row: int, col: int = None) -> int:
+        """Gives the position of the element inside the buffer."""
+        if col is None:
+            return self.offset + row * self.strides[0]
+
+        return self.offset + row * self.strides[0] + col * self.strides[1]
+
+    def _line(self, start: int, length: int, stride: int) -> array:
+        stop = start + length * stride
+        return self.buffer[start:stop if stop >= 0 else None:stride] if length else self.buffer[0:0]
+
+    def values(self) -> list:
+        """Gives all the elements in row-major order."""
+        if self.ndim == 1:
+            return self._line(self.offset, self.shape[0], self.strides[0]).tolist()
+
+        if self.is_contiguous:
+            return self.buffer[self.offset:self.offset + self.size].tolist()
+
+        return list(chain.from_iterable(self.rows()))
+
+    def rows(self) -> list:
+        """Gives the elements as a list of rows, a row vector is returned as a single row."""
+        if self.ndim == 1:
+            return [self.values()]
+
+        (n_rows, n_cols), (row_stride, col_stride) = self.shape, self.strides
+
+        return [self._line(self.offset + i * row_stride, n_cols, col_stride).tolist() for i in range(n_rows)]
+
+    def to_elements(self) -> list:
+        """Gives the elements in the nested list layout used by :class:`matrix`."""
+        return self.values() if self.ndim == 1 else self.rows()
+
+    def sliced(self, row_index, col_index=None):
+        """
+        Gives a view of the storage for the given indices.
+
+        Parameters
+        ----------
+        row_index:
+            An integer or a slice along the first axis.
+        col_index:
+            An integer or a slice along the second axis, only for two-dimensional storages.
+
+        Returns
+        -------
+            A storage sharing the buffer, every integer index drops its axis. If all the axes are dropped, the element
+            itself is returned.
+        """
+
+        indices = (row_index,) if col_index is None else (row_index, col_index)
+        if len(indices) > self.ndim:
+            raise IndexError('Too many indices for the storage.')
+
+        indices += (slice(None),) * (self.ndim - len(indices))
+        offset, shape, strides = self.offset, [], []
+
+        for index, length, stride in zip(indices, self.shape, self.strides):
+            if isinstance(index, slice):
+                start, stop, step = index.indices(length)
+                offset += start * stride
+                shape.append(len(range(start, stop, step)))
+                strides.append(stride * step)
+            else:
+                if not -length <= index < length:
+                    raise IndexError('Index out of range for the storage.')
+                offset += (index % length) * stride
+
+        if not shape:
+            return self.buffer[offset]
+
+        return FlatStorage(self.buffer, tuple(shape), tuple(strides), offset)
+
+    def transposed(self):
+        """Gives a storage sharing the buffer with the axes swapped, a row vector becomes a column."""
+        if self.ndim == 1:
+            if self.shape[0] == 1:
+                return FlatStorage(self.buffer, self.shape, self.strides, self.offset)
+
+            return FlatStorage(self.buffer, (self.shape[0], 1), (self.strides[0], 1), self.offset)
+
+        if self.shape[1] == 1:
+            return FlatStorage(self.buffer, (self.shape[0],), (self.strides[0],), self.offset)
+
+        return FlatStorage(self.buffer, self.shape[::-1], self.strides[::-1], self.offset)
+
+    def copy(self):
+        """Gives a contiguous copy of the storage."""
+        if self.is_contiguous and isinstance(self.buffer, array):
+            start = self.offset
+            return FlatStorage(self.buffer[start:start + self.size], self.shape)
+
+        return FlatStorage(array(self.typecode, self.values()), self.shape)
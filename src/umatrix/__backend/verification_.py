@@ -0,0 +1,145 @@
+"""Verification kernels
+
+This module contains the checks of the matrix identities used by ``Matrix.is_orthogonal``, ``is_orthogonal_to`` and
+``is_multiplicative_inverse_of``, and the element wise comparison used by ``allclose``. The module provides,
+
+- allclose: Compares the rows of two matrices element wise within a tolerance, stopping at the first mismatch.
+- is_identity: Compares the rows of a matrix with the identity within a tolerance, stopping at the first mismatch.
+- freivalds: Randomized check of AB = I through matrix-vector products, in O(trials n^2) instead of O(n^3).
+
+Freivalds' check compares A(Bx) with x for random vectors x. If AB = I it always passes, up to the round-off of the
+float elements, and otherwise every trial catches the difference except for vectors in the null space of AB - I,
+which the random vectors hit with probability 0 for floats and at most 1/2^32 for the random integers used with the
+integer and fraction matrices. These are compared exactly, without any tolerance.
+
+The float results are compared within ``atol + rtol * s``, with s the same products computed on the absolute values,
+|A|(|B||x|), which bounds the magnitude of the terms summed into every element and therefore their round-off.
+
+Created on Oct 19 02:31:50 2026
+"""
+
+import random
+from operator import mul
+
+from .. import LList
+
+# default number of random vectors of the randomized checks
+TRIALS = 10
+
+# default tolerances of the identity checks, relative to the magnitude of the summed terms
+RTOL = 1e-09
+ATOL = 1e-12
+
+# the random integers of the exact checks are drawn from [-_EXACT_RANGE, _EXACT_RANGE)
+_EXACT_RANGE = 2**31
+
+
+def allclose(rows_x: LList, rows_y: LList, rtol: float, atol: float) -> bool:
+    """
+    Check whether the elements of two matrices are equal within the tolerance.
+
+    Parameters
+    ----------
+    rows_x:
+        The rows of the first matrix.
+    rows_y:
+        The rows of the second matrix, having the same dimensions.
+    rtol:
+        The tolerance relative to the elements of the second matrix.
+    atol:
+        The absolute tolerance.
+
+    Returns
+    -------
+        True if ``|x - y| <= atol + rtol * |y|`` for every pair of elements.
+    """
+
+    for row_x, row_y in zip(rows_x, rows_y):
+        # the equal rows are skipped without any Python level frame per element
+        if row_x == row_y:
+            continue
+
+        for x, y in zip(row_x, row_y):
+            if abs(x - y) > atol + rtol * abs(y):
+                return False
+
+    return True
+
+
+def is_identity(rows_: LList, rtol: float, atol: float) -> bool:
+    """Check whether a square matrix is the identity within the tolerance, see ``allclose``."""
+    n_rows = len(rows_)
+    for i, row in enumerate(rows_):
+        if len(row) != n_rows or abs(row[i] - 1) > atol + rtol:
+            return False
+
+        if any(abs(element) > atol for element in row[:i]) or any(abs(element) > atol for element in row[i + 1:]):
+            return False
+
+    return True
+
+
+def _matvec(kernels, a_, vector: list) -> list:
+    """Gives the product of A, rows or an array of the backend, and a vector."""
+    if kernels is None:
+        return [sum(map(mul, row, vector)) for row in a_]
+
+    return [row[0] for row in kernels.to_rows(kernels.matmul(a_, kernels.from_rows([[x] for x in vector])))]
+
+
+def _absolute(kernels, a_):
+    if kernels is None:
+        return [list(map(abs, row)) for row in a_]
+
+    return kernels.apply(a_, abs)
+
+
+def freivalds(a_, b_, trials: int = TRIALS, rtol: float = RTOL, atol: float = ATOL, exact: bool = False,
+              kernels=None) -> bool:
+    """
+    Check whether AB = I through Freivalds' randomized algorithm.
+
+    Parameters
+    ----------
+    a_:
+        The square matrix A, as rows or as an array of the backend.
+    b_:
+        The square matrix B, as rows or as an array of the backend.
+    trials:
+        Number of random vectors, every trial costs four matrix-vector products. Default is ``TRIALS``.
+    rtol:
+        The tolerance relative to the magnitude of the summed terms. Default is ``RTOL``.
+    atol:
+        The absolute tolerance. Default is ``ATOL``.
+    exact:
+        Whether the elements are integers or fractions, which are checked exactly with random integer vectors.
+        Default is False.
+    kernels:
+        The accelerated backend kernels computing the products, for arrays of the backend. Default is None.
+
+    Returns
+    -------
+        False as soon as a trial fails, True if every trial passes.
+    """
+
+    n_rows = len(a_)
+    abs_a = abs_b = None
+
+    for _ in range(trials):
+        if exact:
+            x_ = [random.randrange(-_EXACT_RANGE, _EXACT_RANGE) for _ in range(n_rows)]
+            if _matvec(kernels, a_, _matvec(kernels, b_, x_)) != x_:
+                return False
+            continue
+
+        x_ = [random.uniform(-1, 1) for _ in range(n_rows)]
+        y_ = _matvec(kernels, a_, _matvec(kernels, b_, x_))
+
+        if abs_a is None:
+            abs_a, abs_b = _absolute(kernels, a_), _absolute(kernels, b_)
+
+        scale = _matvec(kernels, abs_a, _matvec(kernels, abs_b, list(map(abs, x_))))
+        if any(abs(y - x) > atol + rtol * s for y, x, s in zip(y_, x_, scale)):
+            return False
+
+    return True
@@ -0,0 +1,244 @@
+"""Matrix batch module
+
+This module provides a stack of small same-shape matrices processed together. The class is,
+
+- :class:`MatrixBatch`
+
+which keeps the elements of all of its matrices in one contiguous ``array('q')``/``array('d')`` buffer, matrix after
+matrix in row-major order. Every operation processes the whole stack in a single call, without creating a
+:class:`matrix` per element of the stack, and 2x2, 3x3 and 4x4 matrices use unrolled closed-form kernels, e.g., for
+transforming many points or composing many transformations at once. The batches have the following associated
+properties,
+
+- n_rows: Number of rows of every matrix.
+- n_cols: Number of columns of every matrix.
+- dim: String describing the size of the stack and the dimensions of its matrices.
+- shape: Number of matrices, rows and columns.
+- t: Short form for transpose of the matrices.
+- transpose: Transpose of every matrix.
+
+Along with these properties, the batch object has the following functions,
+
+- determinant: Determinant of every matrix.
+- inverse: Inverse of every matrix.
+- matvec: Product of every matrix with a vector.
+- to_matrices: Gives the matrices of the stack as separate :class:`matrix` objects.
+
+Indexing a batch gives a :class:`matrix` view sharing the buffer of the batch. Batches can be multiplied by scalars,
+by other batches of the same length, and by a single matrix, which is then used for every matrix of the stack.
+
+Created on Oct 18 17:46:05 2026
+"""
+
+from array import array
+
+from .__backend import batch_, custom_exceptions_ as c_ex_, storage_ as stor_
+from .matrix import Matrix
+
+
+class MatrixBatch:
+
+    __slots__ = ('_buffer', '_shape')
+
+    def __init__(self, matrices):
+        """
+        Creates the stack from matrices of the same shape.
+
+        Parameters
+        ----------
+        matrices:
+            The matrices, either :class:`matrix` objects or nested lists, with int or float elements.
+        """
+
+        matrices = [matrix_ if isinstance(matrix_, Matrix) else Matrix(matrix_) for matrix_ in matrices]
+        if not matrices:
+            raise ValueError('A matrix batch needs at least one matrix.')
+
+        n_rows, n_cols = matrices[0].n_rows, matrices[0].n_cols
+        values = []
+
+        for matrix_ in matrices:
+            if (matrix_.n_rows, matrix_.n_cols) != (n_rows, n_cols):
+                raise c_ex_.MatrixDimensionsMismatch('All the matrices of a batch must have the same dimensions.')
+            values += matrix_._values()
+
+        self._buffer = array(stor_.infer_typecode(values), values)
+        self._shape = (len(matrices), n_rows, n_cols)
+
+    @classmethod
+    def _from_values(cls, values: list, shape: tuple, typecode: str = None):
+        batch = cls.__new__(cls)
+        batch._buffer = array(stor_.infer_typecode(values) if typecode is None else typecode, values)
+        batch._shape = tuple(shape)
+
+        return batch
+
+    def __len__(self):
+        return self._shape[0]
+
+    def __getitem__(self, index: int) -> Matrix:
+        count, n_rows, n_cols = self._shape
+        if not -count <= index < count:
+            raise c_ex_.IndexOutOfBounds()
+
+        shape = (n_cols,) if n_rows == 1 else (n_rows, n_cols)
+
+        return Matrix(stor_.FlatStorage(self._buffer, shape, offset=(index % count) * n_rows * n_cols))
+
+    def __iter__(self):
+        return (self[index] for index in range(len(self)))
+
+    def __repr__(self):
+        return f'MatrixBatch({self.dim})'
+
+    def __eq__(self, other):
+        if not isinstance(other, MatrixBatch):
+            return NotImplemented
+
+        return self._shape == other._shape and self._buffer.tolist() == other._buffer.tolist()
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            values = [value * other for value in self._buffer]
+            return self._from_values(values, self._shape, stor_.result_typecode(self.typecode, other))
+
+        count, n_rows, n_inner = self._shape
+
+        if isinstance(other, MatrixBatch):
+            if len(self) != len(other) and 1 not in (len(self), len(other)):
+                raise c_ex_.MatrixDimensionsMismatch(f'Can\'t multiply batches of {len(self)} and {len(other)} '
+                                                     f'matrices.')
+            o_count, o_buffer = len(other), other._buffer
+        elif isinstance(other, Matrix):
+            o_count, o_buffer = 1, other._values()
+        else:
+            return NotImplemented
+
+        if n_inner != other.n_rows:
+            raise c_ex_.MatrixDimensionsMismatch(f'Inner CxR={n_inner}x{other.n_rows}, not allowed.')
+
+        shape = (n_rows, n_inner, other.n_cols)
+        a_step = 0 if count == 1 else n_rows * n_inner
+        b_step = 0 if o_count == 1 else n_inner * other.n_cols
+        product = batch_.multiply(self._buffer, o_buffer, max(count, o_count), shape, a_step, b_step)
+
+        return self._from_values(product, (max(count, o_count), n_rows, other.n_cols))
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float)):
+            return self.__mul__(other)
+
+        if not isinstance(other, Matrix):
+            return NotImplemented
+
+        count, n_inner, n_cols = self._shape
+        if other.n_cols != n_inner:
+            raise c_ex_.MatrixDimensionsMismatch(f'Inner CxR={other.n_cols}x{n_inner}, not allowed.')
+
+        shape = (other.n_rows, n_inner, n_cols)
+        product = batch_.multiply(other._values(), self._buffer, count, shape, 0, n_inner * n_cols)
+
+        return self._from_values(product, (count, other.n_rows, n_cols))
+
+    @property
+    def n_rows(self) -> int:
+        return self._shape[1]
+
+    @property
+    def n_cols(self) -> int:
+        return self._shape[2]
+
+    @property
+    def shape(self) -> tuple:
+        return self._shape
+
+    @property
+    def dim(self) -> str:
+        return f'{len(self)} x RxC: {self.n_rows}x{self.n_cols}'
+
+    @property
+    def typecode(self) -> str:
+        return self._buffer.typecode
+
+    @property
+    def is_square(self) -> bool:
+        return self.n_rows == self.n_cols
+
+    @property
+    def t(self):
+        return self._transpose()
+
+    @property
+    def transpose(self):
+        return self._transpose()
+
+    def _transpose(self):
+        count, n_rows, n_cols = self._shape
+        transposed = batch_.transpose(self._buffer, (n_rows, n_cols))
+
+        return self._from_values(transposed, (count, n_cols, n_rows), self.typecode)
+
+    def determinant(self) -> list:
+        """
+        Calculate the determinant of every matrix.
+
+        Returns
+        -------
+            The determinants, in the order of the stack.
+        """
+
+        if not self.is_square:
+            raise c_ex_.NotASquareMatrix('The matrices of the batch are not square, the determinant is not defined.')
+
+        return batch_.determinants(self._buffer, self.n_rows)
+
+    def inverse(self):
+        """
+        Calculate the inverse of every matrix.
+
+        Returns
+        -------
+            The batch of the inverses, raises DeterminantIsZero if any of the matrices is singular.
+        """
+
+        if not self.is_square:
+            raise c_ex_.NotASquareMatrix('The matrices of the batch are not square, the inverse is not defined.')
+
+        return self._from_values(batch_.inverses(self._buffer, self.n_rows), self._shape, stor_.FLOAT_TYPECODE)
+
+    def matvec(self, vectors) -> list:
+        """
+        Multiply the matrices with vectors.
+
+        Parameters
+        ----------
+        vectors:
+            Either one vector per matrix, or any number of vectors for a batch holding a single matrix, or a single
+            vector used for every matrix. Vectors can be lists, tuples or row vector matrices.
+
+        Returns
+        -------
+            The resulting vectors, as lists.
+        """
+
+        vectors = [vector._values() if isinstance(vector, Matrix) else vector for vector in vectors]
+        count, n_rows, n_cols = self._shape
+
+        if count != len(vectors) and 1 not in (count, len(vectors)):
+            raise c_ex_.MatrixDimensionsMismatch(f'Can\'t multiply a batch of {count} matrices with {len(vectors)} '
+                                                 f'vectors.')
+
+        if any(len(vector) != n_cols for vector in vectors):
+            raise c_ex_.MatrixDimensionsMismatch(f'The vectors must have {n_cols} elements.')
+
+        step = 0 if count == 1 else n_rows * n_cols
+
+        return batch_.matvec(self._buffer, vectors, max(count, len(vectors)), (n_rows, n_cols), step)
+
+    def to_matrices(self) -> list:
+        """Gives the matrices of the stack as separate matrices owning their elements."""
+        return [matrix_.copy().with_storage('list') for matrix_ in self]
@@ -0,0 +1,384 @@
+"""Lazy matrix module
+
+This module provides deferred evaluation of matrix expressions. The class is,
+
+- :class:`LazyMatrix`
+
+which records the arithmetic applied to it in an expression tree instead of computing it. Wrapping any operand with
+``lazy`` makes the whole expression lazy, e.g., ``lazy(a) * b + c - 2 * d`` only builds a tree. The tree is evaluated
+on ``evaluate``, on the first element access, or on the first use of any other :class:`matrix` attribute, and the
+result is kept for later uses. During the evaluation,
+
+- every sub-expression used more than once is computed only once,
+- matrix products are computed with the usual :class:`matrix` kernels,
+- every connected group of element wise stages, i.e., additions, subtractions, negations, Hadamard products and
+  multiplications or divisions by scalars, is fused into a single chain of iterators applied in one pass over every
+  row, so none of the intermediate matrices of the group are ever created, except between the parts of chains longer
+  than ``_FUSED_DEPTH`` stages,
+- the result of a fused group is written into the buffer of a product computed for the same expression whenever
+  possible, instead of into a new one.
+
+The operands are read when the expression is evaluated, not when it is built. Additionally, the module provides the
+following function,
+
+- lazy: Wraps a matrix as the leaf of a lazy expression.
+
+Created on Oct 18 19:02:37 2026
+"""
+
+from itertools import repeat
+from operator import add, itemgetter, mul, neg, sub, truediv
+
+from .__backend import custom_exceptions_ as c_ex_, storage_ as stor_
+from .matrix import Matrix
+
+# python operators of the element wise stages
+_ELEMENTWISE = {'add': add, 'sub': sub, 'mul': mul, 'div': truediv, 'neg': neg}
+
+# the deepest chain of element wise stages fused into a single function, deeper chains are evaluated in several passes
+_FUSED_DEPTH = 64
+
+
+class LazyMatrix:
+
+    __slots__ = ('_operator', '_operands', '_shape', '_value')
+
+    def __init__(self, operator_: str, operands: tuple, shape: tuple):
+        self._operator = operator_
+        self._operands = operands
+        self._shape = shape
+        self._value = None
+
+    @classmethod
+    def _leaf(cls, matrix_: Matrix):
+        return cls(None, (matrix_,), (matrix_.n_rows, matrix_.n_cols))
+
+    def __repr__(self):
+        return repr(self.evaluate())
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        return getattr(self.evaluate(), name)
+
+    def __getitem__(self, index):
+        return self.evaluate()[index]
+
+    def __len__(self):
+        return len(self.evaluate())
+
+    def __eq__(self, other):
+        other = other.evaluate() if isinstance(other, LazyMatrix) else other
+        return self.evaluate() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def _elementwise(self, operator_: str, other, reflected: bool = False):
+        if isinstance(other, (int, float)):
+            operands = (other, self) if reflected else (self, other)
+            return LazyMatrix(operator_, operands, self._shape)
+
+        other = _as_lazy(other)
+        if other is None:
+            return NotImplemented
+
+        if self._shape != other._shape:
+            raise c_ex_.MatrixDimensionsMismatch()
+
+        operands = (other, self) if reflected else (self, other)
+        return LazyMatrix(operator_, operands, self._shape)
+
+    def __add__(self, other):
+        return self._elementwise('add', other)
+
+    def __radd__(self, other):
+        return self._elementwise('add', other, reflected=True)
+
+    def __sub__(self, other):
+        return self._elementwise('sub', other)
+
+    def __rsub__(self, other):
+        return self._elementwise('sub', other, reflected=True)
+
+    def __neg__(self):
+        return LazyMatrix('neg', (self,), self._shape)
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return LazyMatrix('mul', (self, other), self._shape)
+
+        other = _as_lazy(other)
+        if other is None:
+            return NotImplemented
+
+        return _product(self, other)
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float)):
+            return LazyMatrix('mul', (other, self), self._shape)
+
+        other = _as_lazy(other)
+        if other is None:
+            return NotImplemented
+
+        return _product(other, self)
+
+    def __truediv__(self, other):
+        if isinstance(other, (Matrix, LazyMatrix)):
+            raise c_ex_.DivisionByMatrix()
+
+        return LazyMatrix('div', (self, other), self._shape)
+
+    def hadamard_product(self, other):
+        return self._elementwise('mul', other)
+
+    def elementwise_product(self, other):
+        return self.hadamard_product(other)
+
+    @property
+    def n_rows(self) -> int:
+        return self._shape[0]
+
+    @property
+    def n_cols(self) -> int:
+        return self._shape[1]
+
+    @property
+    def dim(self) -> str:
+        return f'RxC: {self.n_rows}x{self.n_cols}'
+
+    @property
+    def is_evaluated(self) -> bool:
+        return self._value is not None
+
+    def evaluate(self) -> Matrix:
+        """
+        Evaluate the expression, fusing its element wise stages.
+
+        Returns
+        -------
+            The resulting matrix, the same one for every call.
+        """
+
+        if self._value is None:
+            self._value = _evaluate(self)
+
+        return self._value
+
+    def to_matrix(self) -> Matrix:
+        return self.evaluate()
+
+
+def lazy(matrix_) -> LazyMatrix:
+    """
+    Wraps a matrix as the leaf of a lazy expression.
+
+    Parameters
+    ----------
+    matrix_:
+        The matrix, either a :class:`matrix` or a nested list.
+
+    Returns
+    -------
+        The lazy matrix, any arithmetic with it builds an expression tree instead of computing the result.
+    """
+
+    if isinstance(matrix_, LazyMatrix):
+        return matrix_
+
+    return LazyMatrix._leaf(matrix_ if isinstance(matrix_, Matrix) else Matrix(matrix_))
+
+
+def _as_lazy(other):
+    if isinstance(other, LazyMatrix):
+        return other
+
+    return LazyMatrix._leaf(other) if isinstance(other, Matrix) else None
+
+
+def _product(left: LazyMatrix, right: LazyMatrix) -> LazyMatrix:
+    if left.n_cols != right.n_rows:
+        raise c_ex_.MatrixDimensionsMismatch(f'Inner CxR={left.n_cols}x{right.n_rows}, not allowed.')
+
+    return LazyMatrix('matmul', (left, right), (left.n_rows, right.n_cols))
+
+
+def _evaluate(root: LazyMatrix):
+    order, references = _post_order(root)
+    fused = _fused_nodes(order, references)
+    # the values of the nodes evaluated so far, so that every shared node is evaluated only once
+    values = {}
+
+    for node in order:
+        if id(node) in fused:
+            continue
+
+        if node._value is not None:
+            value = node._value
+        elif node._operator is None:
+            value = node._operands[0]
+        elif node._operator == 'matmul':
+            left, right = node._operands
+            value = values[id(left)] * values[id(right)]
+        else:
+            value = _fuse(node, values, fused, references)
+
+        values[id(node)] = value
+
+    return values[id(root)]
+
+
+def _post_order(root: LazyMatrix):
+    """Gives the nodes of the expression with every node after its operands, and the number of uses of every node."""
+    order, references, stack = [], {id(root): 0}, [(root, False)]
+
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+            continue
+
+        stack.append((node, True))
+        if node._value is not None:
+            continue
+
+        for operand in node._operands:
+            if not isinstance(operand, LazyMatrix):
+                continue
+
+            if id(operand) not in references:
+                references[id(operand)] = 0
+                stack.append((operand, False))
+
+            references[id(operand)] += 1
+
+    return order, references
+
+
+def _fused_nodes(order: list, references: dict) -> set:
+    """
+    Gives the element wise stages that are fused into the stage using them, instead of being evaluated on their own.
+
+    A stage is evaluated on its own if it is an operand of a product, if it is used more than once, so that it is
+    computed only once, or if it would make the chain of stages fused together deeper than ``_FUSED_DEPTH``.
+    """
+
+    fused, depths = set(), {}
+    # the operands of the products are always evaluated on their own
+    multiplied = {id(operand) for node in order if node._operator == 'matmul' for operand in node._operands}
+
+    for node in order:
+        if node._value is not None or node._operator not in _ELEMENTWISE:
+            continue
+
+        depth = 1 + max((depths[id(operand)] for operand in node._operands if id(operand) in fused), default=0)
+        if references[id(node)] == 1 and depth < _FUSED_DEPTH and id(node) not in multiplied:
+            fused.add(id(node))
+            depths[id(node)] = depth
+
+    return fused
+
+
+def _fuse(root: LazyMatrix, values: dict, fused: set, references: dict):
+    """
+    Evaluates a group of element wise stages in a single pass over the elements.
+
+    Parameters
+    ----------
+    root:
+        The last stage of the group.
+    values:
+        The values of the nodes evaluated so far, containing every operand of the group.
+    fused:
+        The ids of the stages fused into the stage using them.
+    references:
+        The number of uses of every node.
+
+    Returns
+    -------
+        The resulting matrix, or scalar if the group has no matrix operand.
+    """
+
+    arguments, indices, owned = [], {}, []
+    # the function of every stage, giving an iterator over its elements from the corresponding rows of the arguments
+    functions = {}
+    stack = [(root, False)]
+
+    while stack:
+        node, expanded = stack.pop()
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((operand, False) for operand in node._operands if id(operand) in fused)
+            continue
+
+        operands = []
+        for operand in node._operands:
+            if id(operand) in fused:
+                operands.append((functions[id(operand)], None))
+                continue
+
+            value = values[id(operand)] if isinstance(operand, LazyMatrix) else operand
+            if not isinstance(value, Matrix):
+                # a scalar, or a row vector times a column vector
+                operands.append((None, value))
+                continue
+
+            if id(value) not in indices:
+                indices[id(value)] = len(arguments)
+                arguments.append(value)
+                # the values computed for this group alone can be overwritten
+                if references[id(operand)] == 1 and operand._value is None and operand._operator is not None:
+                    owned.append(value)
+
+            operands.append((itemgetter(indices[id(value)]), None))
+
+        functions[id(node)] = _stage(_ELEMENTWISE[node._operator], operands)
+
+    if not arguments:
+        return next(functions[id(root)](()))
+
+    return _apply(functions[id(root)], arguments, owned, root._shape)
+
+
+def _stage(operator_, operands: list):
+    """Gives the function of a single stage, from the functions or the constant values of its operands."""
+    if all(function is None for function, _ in operands):
+        value = operator_(*(constant for _, constant in operands))
+        return lambda rows_: repeat(value)
+
+    if len(operands) == 1:
+        function = operands[0][0]
+        return lambda rows_: map(operator_, function(rows_))
+
+    (left, left_constant), (right, right_constant) = operands
+    if left is None:
+        return lambda rows_: map(operator_, repeat(left_constant), right(rows_))
+
+    if right is None:
+        return lambda rows_: map(operator_, left(rows_), repeat(right_constant))
+
+    return lambda rows_: map(operator_, left(rows_), right(rows_))
+
+
+def _apply(function, arguments: list, owned: list, shape: tuple) -> Matrix:
+    """Applies the fused function over the rows of the arguments, writing into an owned product if there is one."""
+    rows_ = [argument._rows() for argument in arguments]
+    target = next((matrix_ for matrix_ in owned if matrix_.storage == 'list' and matrix_._multi_rows()), None)
+
+    if target is not None:
+        for target_row, row_group in zip(target._rows(), zip(*rows_)):
+            target_row[:] = function(row_group)
+
+        target._touch()
+        return target
+
+    result = [list(function(row_group)) for row_group in zip(*rows_)]
+
+    if arguments[0].storage == 'array':
+        values = [value for row in result for value in row]
+        return Matrix(stor_.FlatStorage.from_values(values, shape if arguments[0]._multi_rows() else shape[1:]))
+
+    return Matrix(result if arguments[0]._multi_rows() else result[0])
+
@@ -15,15 +15,20 @@ which gives the functionality of generating the matrices. All the matrices have
 - in_fractions: Gives the output of the matrix in fractions.
 - t: Short form for transpose of the matrix.
 - transpose: Transpose of the matrix.
+- storage: The storage backing the matrix, either 'list' (nested Python lists) or 'array' (flat ``array`` buffer).
 
 Along with these properties, the matrix object has the following functions,
 
 - is_symmetric: Whether the matrix is symmetric or not.
-- is_orthogonal: Whether the matrix is orthogonal or not.
-- is_positive_definite: Whether the matrix is positive definite or not.
+- is_orthogonal: Whether the matrix is orthogonal or not, through a randomized O(n^2) check by default.
+- is_positive_definite: Whether the matrix is symmetric positive definite or not, through its Cholesky factorization.
 - determinant: The determinant of the matrix.
-- inverse: The inverse of the matrix.
-- adjoint_matrix: The adjoint of the matrix.
+- inverse: The inverse of the matrix, exact for integer/fraction matrices with ``exact=True``.
+- lu: The reusable partial-pivoting LU factorization of the matrix.
+- cholesky: The reusable Cholesky factorization of a symmetric positive definite matrix.
+- qr: The reusable Householder QR factorization of the matrix, optionally with column pivoting.
+- rank: The numerical rank of the matrix, through the QR factorization with column pivoting.
+- adjoint_matrix: The adjoint of the matrix, computed exactly for integer/fraction matrices.
 - diagonal: The diagonal elements of the matrix as a vector.
 - diagonal_of_matrix: The diagonal elements of the matrix in a square matrix.
 - hadamard_product: Performs element wise multiplication for two given matrices.
@@ -31,41 +36,243 @@ Along with these properties, the matrix object has the following functions,
 - is_multiplicative_inverse_of: Whether the self matrix is a multiplicative inverse of the other matrix or not.
 - is_orthogonal_to: Whether the self matrix is orthogonal to another matrix or not.
 - get_numpy_compatible_matrix: Gives the numpy compatible matrix.
+- save: Saves the matrix into a NumPy compatible ``.npy`` file.
 - dot: Dot product of two matrices.
+- matmul: Matrix product with an explicit choice of the naive, blocked or Strassen-Winograd kernel.
+- add, subtract, divide: Element wise arithmetic, optionally written into an existing matrix through ``out``.
+- with_storage: Gives a copy of the matrix backed by the requested storage.
+- from_rows: Creates a matrix from an iterable of rows, consuming them one by one.
+- iter_row_blocks: Iterates over the matrix in blocks of rows sharing its elements.
+- copy: Gives a copy of the matrix that owns its elements.
+
+Passing ``storage='array'`` on creation keeps the elements in a single flat ``array('q')``/``array('d')`` buffer with a
+shape and strides instead of a list of Python lists, which takes several times less memory for large matrices. For
+such matrices, transposing, indexing and slicing return views sharing the same buffer in O(1) time and memory, writing
+into a view writes into the original matrix, and ``copy`` materializes the view. ``save`` writes the elements into a
+NumPy compatible ``.npy`` file, and ``load`` memory maps such a file into an array-backed matrix, whose elements are
+only read from the disk when they are accessed.
+
+When NumPy is installed, products, inverses and LU determinants of matrices with at least ``set_backend``'s threshold
+elements are computed with vectorized ndarray kernels. Hadamard products and ``map_to_matrix`` are dispatched as well
+for array-backed matrices, whose buffers are shared with NumPy without copying. Everything else, and everything when
+NumPy is missing, uses the pure Python implementation.
+
+The in-place operators ``+=``, ``-=``, ``*=`` and ``/=`` overwrite the elements of the matrix instead of creating a new
+one, as do ``add``, ``subtract``, ``divide``, ``matmul``, ``hadamard_product`` and ``map_to_matrix`` when given an
+``out`` matrix. The rows, or the buffer and the views sharing it, are kept, except for an integer array buffer that has
+to hold floats, which is replaced by a float one. ``*=`` with a matrix is only in place if the product has the
+dimensions of the left operand.
+
+Integer and fraction matrices are handled exactly, without any floating point round trip, by the Bareiss determinant,
+``adjoint_matrix``, ``inverse(exact=True)`` and ``solve(..., exact=True)``. These use fraction-free elimination, whose
+intermediate integers are minors of the matrix, and give ints and Fractions.
+
+The shape, trace, determinant, inverse, LU and Cholesky factorizations and symmetry of a matrix are computed once
+and cached. Every assignment through indexing, including through rows and views sharing the elements, invalidates
+the cache of the matrix. Mutating the lists returned by ``elements``, or an ndarray sharing the buffer, bypasses this
+bookkeeping.
 
 Additionally, the module provides the following functions,
 
-- determinant: Calculate the determinant of the given matrix.
+- determinant: Calculate the determinant of the given matrix, through LU, Bareiss or cofactor expansion.
+- allclose: Whether two matrices are equal element wise within a tolerance.
 - identity_matrix: Generates identity matrix for given rows and columns.
 - null_matrix: Generates null matrix for given rows and columns.
 - vector_mag: Gives the magnitude of the given vector.
 - matrix_copy: Makes a deepcopy of matrix to avoid destructive manipulation of the original matrix.
 - map_to_matrix: Provides an interface to map a function to the matrix, fully, diagonally or off-diagonally.
-
-And two classes,
+- map_to_matrices: Maps a function taking one element of every matrix across several matrices.
+- solve: Solves the linear system Ax = b through the LU factorization of A, without forming its inverse, or exactly
+  through fraction-free elimination.
+- solve_triangular: Solves a lower or upper triangular linear system through forward or back substitution.
+- lstsq: Solves the linear least squares problem of a rectangular system through its Householder QR factorization.
+- matrix_power: Raises a square matrix to an integer power through repeated squaring, optionally modulo a number.
+- expm: Calculates the matrix exponential through scaling and squaring with Pade approximants.
+- matrix_from_numpy: Creates a matrix from an ndarray, sharing its memory for the array storage.
+- load: Loads a matrix from an ``.npy`` file, memory mapping it by default.
+- set_backend: Selects the accelerated backend, e.g., NumPy, and the size above which matrices are dispatched to it.
+- get_backend: Gives the name of the selected backend.
+- register_backend: Registers a new accelerated backend.
+- parallel: Context manager running large products, inverses and ``map_to_matrix`` calls in a process pool.
+
+And five classes,
 
 - InFractions: Provides functionality to turn matrices from decimal to fractions.
 - Inverse: Class for calculation of inverse of the given matrix.
+- LUDecomposition: Factorizes a matrix once, then solves systems and gives the determinant or inverse from the factors.
+- CholeskyDecomposition: Factorizes a symmetric positive definite matrix once, then solves systems and gives the
+  determinant, its logarithm or the inverse from the factor.
+- QRDecomposition: Factorizes a rectangular matrix once through Householder reflections, then solves least squares
+  problems and gives the rank from the factors.
 
 Created on Oct 07 17:48:12 2023
 """
 
+from array import array
 from copy import deepcopy
 from fractions import Fraction
 from itertools import chain
-from math import sqrt
+from functools import partial
+from math import ceil, exp, log, log2, prod, sqrt
+from numbers import Rational
+from operator import add, mul, neg, sub, truediv
+from sys import float_info
 
 from . import IFloat, LList, OptIFloat
-from .__backend import custom_exceptions_ as c_ex_
+from .__backend import backends_, custom_exceptions_ as c_ex_, elementwise_ as elem_, elimination_ as elim_
+from .__backend import multiplication_ as mult_, numpy_
+from .__backend import npy_, parallel_ as par_, storage_ as stor_, verification_ as verif_
+from .__backend.backends_ import get_backend, register_backend, set_backend
+from .__backend.parallel_ import parallel
+
+__all__ = ['Matrix', 'determinant', 'allclose', 'matrix_from_numpy', 'load', 'solve', 'solve_triangular', 'lstsq',
+           'matrix_power', 'expm', 'identity_matrix', 'null_matrix', 'vector_mag', 'matrix_copy', 'map_to_matrix',
+           'map_to_matrices', 'InFractions', 'Inverse', 'LUDecomposition', 'CholeskyDecomposition', 'QRDecomposition',
+           'get_backend', 'register_backend', 'set_backend', 'parallel']
 
 
 # TODO: Check the setting of values inside column matrices, they're acting up
 
 class Matrix:
 
-    def __init__(self, elements, n_decimal=-1):
-        self.elements = elements
+    __slots__ = ('_elements', '_storage', 'n_decimal', '_version', '_cache')
+
+    def __init__(self, elements, n_decimal=-1, storage: str = 'list'):
+        if isinstance(elements, stor_.FlatStorage):
+            self._elements, self._storage = None, elements
+        elif storage == 'list':
+            self._elements, self._storage = elements, None
+        elif storage == 'array':
+            self._elements, self._storage = None, stor_.FlatStorage.from_elements(elements)
+        else:
+            raise ValueError(f"Unknown storage '{storage}', use 'list' or 'array'.")
+
         self.n_decimal = n_decimal
+        self._version, self._cache = [0], None
+
+    @property
+    def elements(self):
+        if self._storage is None:
+            return self._elements
+
+        return self._storage.to_elements()
+
+    @elements.setter
+    def elements(self, value):
+        if self._storage is None:
+            self._elements = value
+        else:
+            self._storage = stor_.FlatStorage.from_elements(value)
+
+        self._touch()
+
+    def _touch(self):
+        """Marks the elements as mutated, invalidating the cached properties of the matrix and its views."""
+        self._version[0] += 1
+
+    def _cached(self, key, compute):
+        """Gives the cached value for the key, computing it again if the elements were mutated since."""
+        cache_, version = self._cache, self._version[0]
+
+        if cache_ is None:
+            cache_ = self._cache = {}
+        elif key in cache_ and cache_[key][0] == version:
+            return cache_[key][1]
+
+        value = compute()
+        cache_[key] = (version, value)
+
+        return value
+
+    def _child(self, data):
+        """Gives a matrix sharing the elements, and therefore the mutation counter, of self."""
+        child = Matrix(data)
+        child._version = self._version
+
+        return child
+
+    @property
+    def storage(self) -> str:
+        return 'list' if self._storage is None else 'array'
+
+    def copy(self):
+        """Gives a copy of the matrix that owns its elements, materializing the views of array-backed matrices."""
+        return matrix_copy(self)
+
+    def with_storage(self, storage: str):
+        """Gives a copy of the matrix using either the 'list' or the flat 'array' storage."""
+        if storage == 'array' and self._storage is not None:
+            return Matrix(self._storage.copy())
+
+        return Matrix(deepcopy(self.elements), storage=storage)
+
+    @classmethod
+    def from_rows(cls, rows, storage: str = 'list'):
+        """
+        Creates a matrix by consuming an iterable of rows, e.g., a generator reading them from a file.
+
+        Parameters
+        ----------
+        rows:
+            Iterable of rows, every row being an iterable of the same number of elements.
+        storage:
+            The storage of the matrix. For 'array', every row is appended to the flat buffer as it is consumed, so the
+            rows are never held as lists all at once. Default is 'list'.
+
+        Returns
+        -------
+            The matrix with the given rows, two-dimensional even for a single row.
+        """
+
+        if storage not in ('list', 'array'):
+            raise ValueError(f"Unknown storage '{storage}', use 'list' or 'array'.")
+
+        elements, buffer, n_rows, n_cols = [], None, 0, None
+        for row in rows:
+            row = row if isinstance(row, list) else list(row)
+            if n_cols is None:
+                n_cols = len(row)
+            elif len(row) != n_cols:
+                raise c_ex_.MatrixDimensionsMismatch(f'Row {n_rows} has {len(row)} elements instead of {n_cols}.')
+
+            if storage == 'list':
+                elements.append(row)
+            else:
+                typecode = stor_.infer_typecode(row)
+                if buffer is None or (typecode == stor_.FLOAT_TYPECODE and buffer.typecode != typecode):
+                    buffer = array(typecode, buffer or [])
+                buffer.extend(row)
+
+            n_rows += 1
+
+        if not n_rows:
+            raise ValueError('No rows to create the matrix from.')
+
+        return cls(elements) if storage == 'list' else cls(stor_.FlatStorage(buffer, (n_rows, n_cols)))
+
+    def iter_row_blocks(self, block_size: int):
+        """
+        Iterate over the matrix in blocks of rows.
+
+        Parameters
+        ----------
+        block_size:
+            The number of rows of every block, the last block can have fewer rows.
+
+        Returns
+        -------
+            Generator of the blocks, as matrices sharing the elements of self, e.g., views for the array storage.
+        """
+
+        if block_size < 1:
+            raise ValueError('The block size must be at least 1.')
+
+        if not self._multi_rows():
+            yield self
+            return
+
+        for start in range(0, self.n_rows, block_size):
+            yield self[start:start + block_size]
 
     def __repr__(self):
         elements = self.elements
@@ -90,13 +297,20 @@ class Matrix:
         return repr(self)
 
     def __len__(self):
-        return len(self.elements)
+        return len(self._elements) if self._storage is None else len(self._storage)
 
     def __eq__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+
+        if self._storage is not None and other._storage is not None:
+            return self._storage.shape == other._storage.shape and self._storage.values() == other._storage.values()
+
         return self.elements == other.elements
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
 
     def __add__(self, other):
         if isinstance(other, Matrix):
@@ -106,6 +320,9 @@ class Matrix:
             if not cond:
                 raise c_ex_.MatrixDimensionsMismatch()
 
+            if self._storage is not None:
+                return self._storage_elementwise(add, other)
+
             if self._multi_rows() and other._multi_rows():
                 row = [[self_element + other_element
                         for self_element, other_element in zip(self_row, other_row)]
@@ -117,6 +334,9 @@ class Matrix:
             return self._give_output(row)
 
         elif isinstance(other, (int, float)):
+            if self._storage is not None:
+                return self._storage_scalar(add, other)
+
             if self._multi_rows():
                 result_elements = [[element + other for element in row] for row in self.elements]
             else:
@@ -124,11 +344,15 @@ class Matrix:
 
             return self._give_output(result_elements)
 
+        elif hasattr(other, 'to_matrix'):
+            # sparse matrices implement the reflected operation themselves
+            return NotImplemented
+
         else:
             raise ValueError("Unsupported operand type for addition.")
 
     def __sub__(self, other):
-        return self.__add__(other=-1 * other)
+        return self + -1 * other
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
@@ -138,6 +362,15 @@ class Matrix:
             if self.n_cols != other.n_rows:
                 raise c_ex_.MatrixDimensionsMismatch(f'Inner CxR={self.n_cols}x{other.n_rows}, not allowed.')
 
+            kernels = self._backend(other)
+            if kernels is not None:
+                a_, b_ = self._to_native(kernels), other._to_native(kernels)
+                if kernels.is_numeric(a_) and kernels.is_numeric(b_):
+                    return self._from_native(kernels, kernels.matmul(a_, b_))
+
+            if self._storage is not None or par_.resolve_workers(None, self.n_rows * self.n_cols * other.n_cols) > 1:
+                return self.matmul(other)
+
             if self._multi_rows():
                 if other.n_cols == 1:
                     return self._multi_row_v_col_matrix(other)
@@ -149,16 +382,39 @@ class Matrix:
                 else:
                     return self._row_v_col(other)
 
+        return NotImplemented
+
     __radd__ = __add__
 
     __rsub__ = __sub__
 
     __rmul__ = __mul__
 
+    def __iadd__(self, other):
+        return self.add(other, out=self)
+
+    def __isub__(self, other):
+        return self.subtract(other, out=self)
+
+    def __imul__(self, other):
+        if isinstance(other, (int, float)):
+            return self._elementwise_out(mul, other, self)
+
+        if isinstance(other, Matrix) and self.n_cols == other.n_rows == other.n_cols and self._multi_rows():
+            return self.matmul(other, out=self)
+
+        return self * other
+
+    def __itruediv__(self, other):
+        return self.divide(other, out=self)
+
     def __truediv__(self, other):
         if isinstance(other, Matrix):
             raise c_ex_.DivisionByMatrix()
 
+        if self._storage is not None:
+            return self._storage_scalar(truediv, other)
+
         if self._multi_rows():
             answer = [[element / other for element in row] for row in self.elements]
         else:
@@ -167,14 +423,15 @@ class Matrix:
         return self._give_output(answer)
 
     def __neg__(self):
+        if self._storage is not None:
+            storage_ = self._storage
+            return Matrix(stor_.FlatStorage.from_values(map(neg, storage_.values()), storage_.shape, storage_.typecode))
+
         negated_elements = [[-element for element in row] for row in self.elements]
         return self._give_output(negated_elements)
 
     def __pow__(self, power, modulo=None):
-        if modulo is None:
-            return map_to_matrix(self, lambda _: _**power)
-        else:
-            return map_to_matrix(self, lambda _: _**power % modulo)
+        return map_to_matrix(self, elem_.power(power, modulo))
 
     def __initialize_slicing(self, slice_object):
         start, stop, step = slice_object.indices(len(self))
@@ -189,6 +446,9 @@ class Matrix:
         return start, stop, step
 
     def __getitem__(self, index):
+        if self._storage is not None:
+            return self._storage_getitem(index)
+
         if isinstance(index, slice):
             start, stop, step = self.__initialize_slicing(index)
             output = [self.elements[i] for i in range(start, stop, step)]
@@ -209,26 +469,40 @@ class Matrix:
                 if index > len(self.elements):
                     raise c_ex_.IndexOutOfBounds()
 
-            return self._give_output(self.elements[index]) if self._multi_rows() else self.elements[index]
+            return self._child(self.elements[index]) if self._multi_rows() else self.elements[index]
 
-        return self._give_output(output)
+        return self._child(output)
 
     def __setitem__(self, index, value):
-        if index >= len(self.elements):
-            raise c_ex_.IndexOutOfBounds()
-
         if isinstance(index, (slice, tuple)):
             raise c_ex_.SlicingNotAllowed()
 
-        self.elements[index] = value
+        if index >= len(self):
+            raise c_ex_.IndexOutOfBounds()
+
+        if self._storage is not None:
+            self._storage_setitem(index, value)
+        else:
+            self._elements[index] = value
+
+        self._touch()
+
+    def _shape(self) -> tuple:
+        if self._storage is not None:
+            return (self._storage.shape[0] if self._storage.ndim == 2 else 1), self._storage.shape[-1]
+
+        if self._multi_rows():
+            return len(self._elements), len(self._elements[0])
+
+        return 1, len(self._elements)
 
     @property
     def n_rows(self) -> int:
-        return len(self.elements) if self._multi_rows() else 1
+        return self._cached('shape', self._shape)[0]
 
     @property
     def n_cols(self) -> int:
-        return len(self.elements[0]) if self._multi_rows() else len(self.elements)
+        return self._cached('shape', self._shape)[1]
 
     @property
     def dim(self):
@@ -240,11 +514,15 @@ class Matrix:
 
     @property
     def is_singular(self):
-        return determinant(self.elements) == 0
+        return self.determinant() == 0
 
     @property
     def trace(self):
-        return sum([self.elements[i][i] for i in range(self.n_rows)])
+        def _trace():
+            elements = self.elements
+            return sum([elements[i][i] for i in range(self.n_rows)])
+
+        return self._cached('trace', _trace)
 
     @property
     def in_fractions(self):
@@ -257,9 +535,177 @@ class Matrix:
         return Matrix(output)
 
     def _multi_rows(self):
-        return isinstance(self.elements[0], list)
+        if self._storage is not None:
+            return self._storage.ndim == 2
+
+        return isinstance(self._elements[0], list)
+
+    def _values(self) -> list:
+        """Gives all the elements in row-major order, regardless of the storage."""
+        if self._storage is not None:
+            return self._storage.values()
+
+        return list(chain.from_iterable(self._elements)) if self._multi_rows() else list(self._elements)
+
+    def _storage_scalar(self, operator_, other):
+        storage_ = self._storage
+        typecode = stor_.FLOAT_TYPECODE if operator_ is truediv else stor_.result_typecode(storage_.typecode, other)
+        values = [operator_(element, other) for element in storage_.values()]
+
+        return Matrix(stor_.FlatStorage.from_values(values, storage_.shape, typecode))
+
+    def _backend(self, *others, zero_copy: bool = False):
+        """Gives the accelerated backend kernels for an operation of self with others, None for pure Python."""
+        if not self._multi_rows():
+            return None
+
+        if zero_copy and any(matrix_._storage is None for matrix_ in (self,) + others):
+            return None
+
+        return backends_.select(max(matrix_.n_rows * matrix_.n_cols for matrix_ in (self,) + others))
+
+    def _to_native(self, kernels):
+        """Converts the matrix to the two-dimensional array type of the backend, without copying array storage."""
+        if self._storage is None:
+            return kernels.from_rows(self._rows())
+
+        storage_ = self._storage
+        shape_, strides_ = storage_.shape, storage_.strides
+        if storage_.ndim == 1:
+            shape_, strides_ = (1,) + shape_, (0,) + strides_
+
+        return kernels.from_buffer(storage_.buffer, storage_.typecode, shape_, strides_, storage_.offset)
+
+    def _from_native(self, kernels, native):
+        """Wraps an array of the backend as a matrix in the storage of self."""
+        if self._storage is None:
+            return self._give_output(kernels.to_rows(native))
+
+        return Matrix(stor_.FlatStorage(*kernels.to_buffer(native)))
+
+    def _rows(self) -> list:
+        """Gives the rows of the matrix as lists, regardless of the storage."""
+        if self._storage is not None:
+            return self._storage.rows()
+
+        return self._elements if self._multi_rows() else [self._elements]
+
+    def _columns(self) -> list:
+        """Gives the columns of the matrix as lists, regardless of the storage."""
+        if self._storage is not None:
+            return self._storage.transposed().rows()
+
+        return [list(column) for column in zip(*self._rows())]
+
+    def _storage_elementwise(self, operator_, other):
+        storage_ = self._storage
+        values = list(map(operator_, storage_.values(), other._values()))
+
+        if other._storage is None:
+            typecode = stor_.infer_typecode(values)
+        else:
+            typecode = stor_.result_typecode(storage_.typecode, other._storage.typecode)
+
+        return Matrix(stor_.FlatStorage.from_values(values, storage_.shape, typecode))
+
+    def _write_rows(self, rows_):
+        """Overwrites the elements of self, row by row, keeping the same lists or buffer whenever possible."""
+        if self._storage is None:
+            if self._multi_rows():
+                for row, new_row in zip(self._elements, rows_):
+                    row[:] = new_row
+            else:
+                self._elements[:] = next(iter(rows_))
+
+            self._touch()
+            return
+
+        storage_ = self._storage
+        rows_, typecode = [list(row) for row in rows_], storage_.typecode
+
+        if typecode == stor_.INT_TYPECODE and not all(isinstance(value, int) for row in rows_ for value in row):
+            # an integer buffer can't hold the floats, the matrix gets its own float buffer instead
+            self._storage = stor_.FlatStorage.from_values(list(chain.from_iterable(rows_)), storage_.shape)
+            self._touch()
+            return
+
+        n_cols, col_stride = storage_.shape[-1], storage_.strides[-1]
+        for i, row in enumerate(rows_):
+            start = storage_.position(i, 0) if storage_.ndim == 2 else storage_.offset
+            stop = start + n_cols * col_stride
+            storage_.buffer[start:stop if stop >= 0 else None:col_stride] = array(typecode, row)
+
+        self._touch()
+
+    def _check_out(self, out, n_rows: int, n_cols: int):
+        if not isinstance(out, Matrix):
+            raise ValueError('The out must be a Matrix object')
+
+        if (out.n_rows, out.n_cols) != (n_rows, n_cols):
+            raise c_ex_.MatrixDimensionsMismatch(f'The out is {out.n_rows}x{out.n_cols}, the result is '
+                                                 f'{n_rows}x{n_cols}.')
+
+    def _elementwise_out(self, operator_, other, out):
+        """Writes ``operator_(self, other)`` into out, element by element, for a matrix or a scalar other."""
+        self._check_out(out, self.n_rows, self.n_cols)
+
+        if isinstance(other, Matrix):
+            if (self.n_rows, self.n_cols) != (other.n_rows, other.n_cols):
+                raise c_ex_.MatrixDimensionsMismatch()
+            rows_ = (map(operator_, row, other_row) for row, other_row in zip(self._rows(), other._rows()))
+        elif not isinstance(other, (int, float)):
+            raise ValueError("Unsupported operand type for the operation.")
+        else:
+            rows_ = ([operator_(element, other) for element in row] for row in self._rows())
+
+        out._write_rows(rows_)
+
+        return out
+
+    def _product_output(self, rows_, other):
+        """Wraps the rows of ``self * other`` as a scalar, a row vector or a matrix, in the storage of ``self``."""
+        if not self._multi_rows():
+            if other.n_cols == 1:
+                return rows_[0][0]
+            rows_ = rows_[0]
+
+        if self._storage is not None:
+            return Matrix(stor_.FlatStorage.from_elements(rows_))
+
+        return self._give_output(rows_)
+
+    def _storage_getitem(self, index):
+        storage_ = self._storage
+        row_index, col_index = index if isinstance(index, tuple) else (index, None)
+
+        try:
+            view_ = storage_.sliced(row_index, col_index)
+        except IndexError as error:
+            raise c_ex_.IndexOutOfBounds() from error
+
+        if not isinstance(view_, stor_.FlatStorage):
+            return view_
+
+        if isinstance(row_index, slice) and not isinstance(col_index, (slice, type(None))):
+            view_ = view_.transposed()
+
+        return self._child(view_)
+
+    def _storage_setitem(self, index, value):
+        storage_ = self._storage
+        index = index + len(storage_) if index < 0 else index
+
+        if storage_.ndim == 1:
+            storage_.buffer[storage_.position(index)] = value
+        else:
+            position, stride = storage_.position(index), storage_.strides[1]
+            for col, element in enumerate(value):
+                storage_.buffer[position + col * stride] = element
 
     def _scalar_vector_multiplication(self, other):
+        if self._storage is not None:
+            return self._storage_scalar(mul, other)
+
         if self._multi_rows():
             result_elements = [[element * other for element in row] for row in self.elements]
         else:
@@ -273,14 +719,7 @@ class Matrix:
         return self._give_output(row_v_col)
 
     def _multi_matrix(self, other):
-        result = []
-        for row in self.elements:
-            r_temp = []
-            for c_row in other.t.elements:
-                r_temp.append(sum([r_elem * c_elem for r_elem, c_elem in zip(row, c_row)]))
-            result.append(r_temp)
-
-        return self._give_output(result)
+        return self._give_output(mult_.multiply(self.elements, other._rows()))
 
     def _row_v_multi_row(self, other):
         if other.n_cols == 1:
@@ -295,18 +734,22 @@ class Matrix:
         return self._give_output(mul_) if isinstance(mul_, list) and len(mul_) > 1 else mul_
 
     def _multi_row_v_col_matrix(self, other):
-        multi_row_v_col_matrix = [[sum([self.elements[row][col] * other.elements[col][0]
+        elements, o_elements = self.elements, other.elements
+        multi_row_v_col_matrix = [[sum([elements[row][col] * o_elements[col][0]
                                         for col in range(self.n_cols)])] for row in range(self.n_rows)]
         return self._give_output(multi_row_v_col_matrix)
 
     def _transpose(self):
-        n_rows, n_cols, elements, give_output = self.n_rows, self.n_cols, self.elements, self._give_output
+        if self._storage is not None:
+            return self._child(self._storage.transposed())
+
+        n_cols, elements, give_output = self.n_cols, self.elements, self._give_output
 
         if len(self) == 0:
             return give_output([])
 
         if self._multi_rows():
-            answer = [[elements[row][col] for row in range(n_rows)] for col in range(n_cols)]
+            answer = [list(column) for column in zip(*elements)]
 
             if n_cols == 1:
                 answer = answer[0]
@@ -321,33 +764,165 @@ class Matrix:
         return give_output(transposed_elements)
 
     def is_symmetric(self):
-        return self == self.t
+        return self._cached('is_symmetric', self._is_symmetric)
+
+    def _is_symmetric(self) -> bool:
+        """Compares every row with the column of the same index, up to the diagonal, stopping at the first mismatch."""
+        if not self.is_square:
+            return False
+
+        rows_ = self._rows()
+        return all(row[:i] == [rows_[j][i] for j in range(i)] for i, row in enumerate(rows_))
+
+    def is_orthogonal(self, method: str = 'randomized', trials: int = verif_.TRIALS, rtol: float = verif_.RTOL,
+                      atol: float = verif_.ATOL) -> bool:
+        """
+        Check whether the matrix times its transpose is the identity.
+
+        Parameters
+        ----------
+        method:
+            Either 'randomized', checking A(A^T x) = x for random vectors x through Freivalds' algorithm in
+            O(trials n^2), or 'full', comparing the full product A A^T with the identity in O(n^3). Default is
+            'randomized'.
+        trials:
+            Number of random vectors of the randomized check. Default is ``TRIALS`` of the verification kernels, 10.
+        rtol:
+            The tolerance relative to the magnitude of the summed terms, ignored for integer and fraction matrices,
+            which are compared exactly. Default is 1e-09.
+        atol:
+            The absolute tolerance, ignored for integer and fraction matrices. Default is 1e-12.
+
+        Returns
+        -------
+            True if the matrix is orthogonal, False for non-square matrices.
+        """
 
-    def is_orthogonal(self):
-        return self * self.t == identity_matrix(self.n_rows, self.n_cols)
+        return self._is_identity_product(self, True, method, trials, rtol, atol)
 
     def is_positive_definite(self) -> bool:
-        zero_ = null_matrix(self.n_rows, 1) + 1
+        """
+        Check whether the matrix is symmetric positive definite, by attempting its Cholesky factorization, which stops
+        at the first non-positive pivot. The factorization is cached and reused by ``cholesky``.
+        """
 
-        if not self.is_symmetric():
-            return False
+        return self.is_symmetric() and self._cached('cholesky', self._cholesky) is not None
 
-        return vector_mag(zero_.t * self * zero_) > 0
+    def determinant(self, method: str = 'auto'):
+        return self._cached(('determinant', method), lambda: determinant(self, method=method))
 
-    def determinant(self):
-        return determinant(self.elements)
+    def inverse(self, workers: int = None, exact: bool = False):
+        return matrix_copy(self._cached(('inverse', exact), lambda: self._inverse(workers, exact)))
 
-    def inverse(self):
-        inv_ = Inverse(self.elements).inverse()
+    def _inverse(self, workers: int = None, exact: bool = False):
+        if exact:
+            return self._give_output(elim_.bareiss_inverse(self._exact_elements()))
+
+        kernels = self._backend() if self.is_square else None
+        if kernels is not None:
+            native = self._to_native(kernels)
+            if kernels.is_numeric(native):
+                return self._from_native(kernels, kernels.inverse(native))
+
+        inv_ = Inverse(self.elements).inverse(workers=workers)
         return self._give_output(inv_)
 
+    def lu(self):
+        if not self.is_square:
+            raise c_ex_.NotASquareMatrix()
+
+        return self._cached('lu', lambda: LUDecomposition(self.elements))
+
+    def cholesky(self):
+        """
+        Gives the Cholesky factorization, A = LL^T, of a symmetric positive definite matrix.
+
+        Only the elements on and below the diagonal are read, the matrix is taken as symmetric. The factorization
+        costs half of the LU factorization, and is computed once and cached.
+
+        Returns
+        -------
+            The :class:`CholeskyDecomposition`, raising ``NotPositiveDefinite`` if the matrix is not positive definite.
+        """
+
+        if not self.is_square:
+            raise c_ex_.NotASquareMatrix("Matrix must be square for Cholesky Decomposition.")
+
+        decomposition = self._cached('cholesky', self._cholesky)
+        if decomposition is None:
+            raise c_ex_.NotPositiveDefinite()
+
+        return decomposition
+
+    def qr(self, pivoting: bool = False):
+        """
+        Gives the Householder QR factorization, AP = QR, of the matrix, which can be rectangular.
+
+        Parameters
+        ----------
+        pivoting:
+            Whether to exchange the columns so that the magnitude of the diagonal of R is non-increasing, revealing
+            the rank of the matrix. Default is False, for which P is the identity.
+
+        Returns
+        -------
+            The reusable :class:`QRDecomposition`, computed once and cached.
+        """
+
+        return self._cached(('qr', pivoting), lambda: QRDecomposition(self._columns(), pivoting))
+
+    def rank(self, tolerance: float = None) -> int:
+        """
+        Gives the numerical rank of the matrix, through its QR factorization with column pivoting.
+
+        Parameters
+        ----------
+        tolerance:
+            The magnitude below which the diagonal elements of R are taken as zeros. Default is None, for
+            max(m, n) times the machine precision times the largest of them.
+
+        Returns
+        -------
+            The number of diagonal elements of R above the tolerance.
+        """
+
+        return self.qr(pivoting=True).rank(tolerance)
+
+    def _cholesky(self):
+        """The Cholesky factorization, or None if the matrix is not positive definite."""
+        try:
+            return CholeskyDecomposition(self.elements)
+        except c_ex_.NotPositiveDefinite:
+            return None
+
     def adjoint_matrix(self):
+        if elim_.is_exact(self.elements):
+            return self._give_output(elim_.bareiss_adjugate(self._exact_elements()))
+
         return (self.inverse() * self.determinant()).in_fractions
 
+    def _is_exact(self) -> bool:
+        """Whether every element is an integer or a fraction."""
+        if self._storage is not None:
+            return self._storage.typecode == stor_.INT_TYPECODE
+
+        return elim_.is_exact(self._rows())
+
+    def _exact_elements(self) -> LList:
+        """The elements of a square integer/fraction matrix, for the exact elimination."""
+        if not self.is_square:
+            raise c_ex_.NotASquareMatrix()
+
+        elements = self.elements
+        if not elim_.is_exact(elements):
+            raise ValueError('The exact mode requires a matrix of integer or fraction elements.')
+
+        return elements
+
     def diagonal(self):
-        null_ = null_matrix(self.n_rows)
+        elements, null_ = self.elements, null_matrix(self.n_rows)
         for i in range(self.n_rows):
-            null_[i] = self.elements[i][i]
+            null_[i] = elements[i][i]
 
         return null_
 
@@ -368,7 +943,20 @@ class Matrix:
     def transpose(self):
         return self._transpose()
 
-    def hadamard_product(self, other):
+    def hadamard_product(self, other, out=None):
+        if out is not None:
+            return self._elementwise_out(mul, other, out)
+
+        if hasattr(other, 'to_matrix'):
+            return other.hadamard_product(self)
+
+        kernels = self._backend(other, zero_copy=True)
+        if kernels is not None:
+            return self._from_native(kernels, kernels.hadamard(self._to_native(kernels), other._to_native(kernels)))
+
+        if self._storage is not None:
+            return self._storage_elementwise(mul, other)
+
         elements, o_elements = self.elements, other.elements
 
         result = [[i * j for i, j in zip(self_rows, other_rows)] for self_rows, other_rows in
@@ -379,101 +967,640 @@ class Matrix:
     def elementwise_product(self, other):
         return self.hadamard_product(other)
 
-    def is_multiplicative_inverse_of(self, other):
-        return self * other == identity_matrix(self.n_rows, self.n_cols)
+    def is_multiplicative_inverse_of(self, other, method: str = 'randomized', trials: int = verif_.TRIALS,
+                                     rtol: float = verif_.RTOL, atol: float = verif_.ATOL) -> bool:
+        """Check whether self times other is the identity, see ``is_orthogonal`` for the parameters."""
+        if self.n_cols != other.n_rows:
+            raise c_ex_.MatrixDimensionsMismatch(f'Inner CxR={self.n_cols}x{other.n_rows}, not allowed.')
 
-    def is_orthogonal_to(self, other):
+        return self._is_identity_product(other, False, method, trials, rtol, atol)
+
+    def is_orthogonal_to(self, other, method: str = 'randomized', trials: int = verif_.TRIALS,
+                         rtol: float = verif_.RTOL, atol: float = verif_.ATOL) -> bool:
+        """Check whether self times the transpose of other is the identity, see ``is_orthogonal`` for the parameters."""
         if self.dim != other.dim:
             raise c_ex_.MatrixDimensionsMismatch()
 
-        return self * other.t == identity_matrix(self.n_rows, self.n_cols)
+        return self._is_identity_product(other, True, method, trials, rtol, atol)
 
-    def dot(self, other):
-        if not isinstance(other, Matrix):
-            raise ValueError('The other must be a Matrix object')
+    def _is_identity_product(self, other, transposed: bool, method: str, trials: int, rtol: float,
+                             atol: float) -> bool:
+        """Checks whether self times other, or its transpose, is the identity."""
+        if method not in ('randomized', 'full'):
+            raise ValueError(f"Unknown method '{method}', use 'randomized' or 'full'.")
 
-        return sum([i * j for i, j in zip(self.elements, other.elements)])
+        if not (self.is_square and other.is_square and self.n_rows == other.n_rows):
+            return False
 
+        exact = self._is_exact() and other._is_exact()
+        if exact:
+            rtol = atol = 0
 
-def determinant(matrix: Matrix or LList) -> float:
-    """
-    Calculate determinant of a given matrix.
+        if method == 'randomized':
+            other_ = other.t if transposed else other
 
-    Parameters
-    ----------
-    matrix:
-        The matrix for which the determinant is to be calculated.
+            kernels = self._backend(other)
+            if kernels is not None:
+                a_, b_ = self._to_native(kernels), other_._to_native(kernels)
+                if kernels.is_numeric(a_) and kernels.is_numeric(b_):
+                    return verif_.freivalds(a_, b_, trials, rtol, atol, exact, kernels)
 
-    Returns
-    -------
-        Determinant of matrix.
-    """
+            return verif_.freivalds(self._rows(), other_._rows(), trials, rtol, atol, exact)
+
+        product = self * (other.t if transposed else other)
+
+        return verif_.is_identity(product._rows(), rtol, atol)
 
-    def calculate_determinant(mat: Matrix or LList) -> IFloat:
+    def add(self, other, out=None):
         """
-        Calculates the determinant.
+        Element wise sum of self and other.
 
         Parameters
         ----------
-        mat:
-            Matrix or sub-matrix
+        other:
+            A matrix of the same dimensions, or a scalar.
+        out:
+            A matrix of the same dimensions to write the sum into, e.g., self. Default is None, for a new matrix.
 
         Returns
         -------
-            Determinant of the matrix or sub-matrix given.
+            The sum, out itself if it is given.
         """
 
-        len_mat, det = len(mat), 0
+        if out is None:
+            return self + other
 
-        if len_mat == 1:
-            return mat[0][0]
+        other = other.to_matrix() if hasattr(other, 'to_matrix') else other
 
-        for element in range(len_mat):
-            sub_matrix = [row[:element] + row[element + 1:] for row in mat[1:]]
-            cofactor = mat[0][element] * ((-1)**element)
-            det += cofactor * calculate_determinant(sub_matrix)
+        return self._elementwise_out(add, other, out)
 
-        return det
+    def subtract(self, other, out=None):
+        """
+        Element wise difference of self and other.
 
-    matrix = matrix.elements if isinstance(matrix, Matrix) else matrix
+        Parameters
+        ----------
+        other:
+            A matrix of the same dimensions, or a scalar.
+        out:
+            A matrix of the same dimensions to write the difference into, e.g., self. Default is None, for a new
+            matrix.
 
-    n_rows, n_cols = len(matrix), len(matrix[0])
+        Returns
+        -------
+            The difference, out itself if it is given.
+        """
 
-    if n_rows != n_cols:
-        raise c_ex_.NotASquareMatrix("Matrix must be square for determinant calculation.")
+        if out is None:
+            return self - other
 
-    return calculate_determinant(matrix)
+        other = other.to_matrix() if hasattr(other, 'to_matrix') else other
 
+        return self._elementwise_out(sub, other, out)
 
-def identity_matrix(n_rows: int, n_cols: OptIFloat = None, value: IFloat = 1) -> Matrix:
-    """
-    Generates an identity matrix of given number of rows and columns.
+    def divide(self, other, out=None):
+        """
+        Division of self by a scalar.
 
-    Parameters
-    ----------
-    n_rows:
-        Number of rows for the null matrix.
-    n_cols:
-        Number of columns for the null matrix.
-    value:
-        The value to set on diagonals. Defaults to 1.
+        Parameters
+        ----------
+        other:
+            The scalar divisor.
+        out:
+            A matrix of the same dimensions to write the quotient into, e.g., self. Default is None, for a new matrix.
 
-    Returns
-    -------
-        Identity matrix.
-    """
+        Returns
+        -------
+            The quotient, out itself if it is given.
+        """
 
-    if n_cols is not None and n_cols != n_rows:
-        raise c_ex_.NotASquareMatrix('The identity matrix can not be rectangular.')
+        if out is None:
+            return self / other
 
-    n_cols = n_rows if n_cols is None else n_cols
+        if isinstance(other, Matrix):
+            raise c_ex_.DivisionByMatrix()
 
-    identity_ = null_matrix(n_rows, n_cols)
+        return self._elementwise_out(truediv, other, out)
 
-    if n_rows == n_cols == 1:
-        return Matrix([1])
-    else:
-        for i in range(n_rows):
+    def matmul(self, other, algorithm: str = 'auto', block_size: int = None, strassen_threshold: int = None,
+               workers: int = None, out=None):
+        """
+        Matrix product of self and other, with an explicit choice of the multiplication kernel.
+
+        Parameters
+        ----------
+        other:
+            The right operand of the product.
+        algorithm:
+            One of 'auto', 'naive', 'blocked' or 'strassen'. Default is 'auto', which is also what ``*`` uses.
+        block_size:
+            Tile size for the blocked kernel.
+        strassen_threshold:
+            Size at or below which the Strassen-Winograd recursion falls back to the naive kernel.
+        workers:
+            Number of processes to split the rows of self across. Default is the number set by ``parallel``, which is
+            1 (serial) outside of it. Products below the parallel threshold always run serially.
+        out:
+            A matrix with the dimensions of the product to write it into, it can be self or other as well. Default is
+            None, for a new matrix.
+
+        Returns
+        -------
+            The product, a scalar for a row vector times a column vector, or out itself if it is given.
+        """
+
+        if not isinstance(other, Matrix):
+            raise ValueError('The other must be a Matrix object')
+
+        if self.n_cols != other.n_rows:
+            raise c_ex_.MatrixDimensionsMismatch(f'Inner CxR={self.n_cols}x{other.n_rows}, not allowed.')
+
+        n_workers = par_.resolve_workers(workers, self.n_rows * self.n_cols * other.n_cols)
+        if n_workers > 1:
+            rows_ = par_.parallel_multiply(self._rows(), other._rows(), n_workers)
+        else:
+            rows_ = mult_.multiply(self._rows(), other._rows(), algorithm, block_size, strassen_threshold)
+
+        if out is not None:
+            self._check_out(out, self.n_rows, other.n_cols)
+            out._write_rows(rows_)
+            return out
+
+        return self._product_output(rows_, other)
+
+    def save(self, path: str):
+        """
+        Save the matrix into a NumPy compatible ``.npy`` file.
+
+        Parameters
+        ----------
+        path:
+            The file to write, a row vector is saved as a one-dimensional array.
+        """
+
+        if self._storage is not None:
+            storage_ = self._storage
+            if not storage_.is_contiguous or storage_.offset or len(storage_.buffer) != storage_.size:
+                storage_ = storage_.copy()
+
+            npy_.write(path, storage_.typecode, storage_.shape, [storage_.buffer])
+            return
+
+        rows_ = self._rows()
+        typecode = stor_.result_typecode(*(stor_.infer_typecode(row) for row in rows_))
+        shape = (self.n_rows, self.n_cols) if self._multi_rows() else (self.n_cols,)
+
+        npy_.write(path, typecode, shape, (array(typecode, row) for row in rows_))
+
+    def get_numpy_compatible_matrix(self):
+        """Gives the matrix as an ndarray, sharing the memory of array-backed matrices instead of copying it."""
+        if not numpy_.available():
+            raise ImportError('NumPy is required for converting matrices to ndarrays.')
+
+        if self._storage is None:
+            return numpy_.from_rows(self.elements)
+
+        storage_ = self._storage
+        return numpy_.from_buffer(storage_.buffer, storage_.typecode, storage_.shape, storage_.strides, storage_.offset)
+
+    def dot(self, other):
+        if not isinstance(other, Matrix):
+            raise ValueError('The other must be a Matrix object')
+
+        return sum([i * j for i, j in zip(self.elements, other.elements)])
+
+
+def determinant(matrix: Matrix or LList, method: str = 'auto') -> IFloat:
+    """
+    Calculate determinant of a given matrix.
+
+    Parameters
+    ----------
+    matrix:
+        The matrix for which the determinant is to be calculated.
+    method:
+        The algorithm to use, either 'lu', 'bareiss', 'cofactor' or 'auto'. Default is 'auto', which uses the exact
+        Bareiss elimination for integer/fraction matrices and the partial-pivoting LU elimination otherwise. The
+        'cofactor' expansion is O(n!) and is only allowed for tiny matrices.
+
+    Returns
+    -------
+        Determinant of matrix.
+    """
+
+    if hasattr(matrix, 'to_matrix') and hasattr(matrix, 'determinant'):
+        # structured matrices use the kernel of their structure
+        return matrix.determinant()
+
+    matrix_, matrix = (matrix, matrix.elements) if isinstance(matrix, Matrix) else (None, matrix)
+
+    n_rows, n_cols = len(matrix), len(matrix[0])
+
+    if n_rows != n_cols:
+        raise c_ex_.NotASquareMatrix("Matrix must be square for determinant calculation.")
+
+    if method == 'auto':
+        method = 'bareiss' if elim_.is_exact(matrix) else 'lu'
+
+    kernels = backends_.select(n_rows * n_cols) if method == 'lu' else None
+    if kernels is not None:
+        native = matrix_._to_native(kernels) if matrix_ is not None else kernels.from_rows(matrix)
+        if kernels.is_numeric(native):
+            return kernels.determinant(native)
+
+    if method == 'lu':
+        return elim_.lu_determinant(matrix)
+    elif method == 'bareiss':
+        return elim_.bareiss_determinant(matrix)
+    elif method == 'cofactor':
+        return elim_.cofactor_determinant(matrix)
+    else:
+        raise ValueError(f"Unknown determinant method '{method}', use 'auto', 'lu', 'bareiss' or 'cofactor'.")
+
+
+def allclose(matrix: Matrix or LList, other: Matrix or LList, rtol: float = 1e-05, atol: float = 1e-08) -> bool:
+    """
+    Check whether two matrices are equal element wise within a tolerance, stopping at the first mismatch.
+
+    Parameters
+    ----------
+    matrix:
+        The first matrix.
+    other:
+        The second matrix.
+    rtol:
+        The tolerance relative to the elements of the second matrix. Default is 1e-05.
+    atol:
+        The absolute tolerance. Default is 1e-08.
+
+    Returns
+    -------
+        True if the matrices have the same dimensions and ``|x - y| <= atol + rtol * |y|`` for every pair of elements.
+    """
+
+    matrix = matrix if isinstance(matrix, Matrix) else Matrix(matrix)
+    other = other if isinstance(other, Matrix) else Matrix(other)
+
+    if matrix.n_rows != other.n_rows or matrix.n_cols != other.n_cols:
+        return False
+
+    return verif_.allclose(matrix._rows(), other._rows(), rtol, atol)
+
+
+def matrix_from_numpy(ndarray, storage: str = 'array') -> Matrix:
+    """
+    Creates a matrix from a one- or two-dimensional ndarray.
+
+    Parameters
+    ----------
+    ndarray:
+        The ndarray to convert, a one-dimensional ndarray gives a row vector.
+    storage:
+        The storage of the matrix, 'array' shares the memory of C-contiguous int64/float64 ndarrays without copying,
+        'list' copies the elements into nested lists. Default is 'array'.
+
+    Returns
+    -------
+        The matrix holding the elements of the ndarray.
+    """
+
+    if not numpy_.available():
+        raise ImportError('NumPy is required for converting ndarrays to matrices.')
+
+    if ndarray.ndim not in (1, 2):
+        raise ValueError('Only one- and two-dimensional ndarrays can be converted to matrices.')
+
+    if storage == 'list':
+        return Matrix(numpy_.to_rows(ndarray))
+
+    return Matrix(stor_.FlatStorage(*numpy_.to_buffer(ndarray)))
+
+
+def load(path: str, mmap: bool = True, mode: str = 'r') -> Matrix:
+    """
+    Loads a matrix from an ``.npy`` file, as written by ``Matrix.save`` or ``numpy.save``.
+
+    Parameters
+    ----------
+    path:
+        The file to read, holding a one- or two-dimensional array of integers, floats or booleans.
+    mmap:
+        Whether to memory map the file instead of reading it, so the elements are only read from the disk when they
+        are accessed. Only int64 and float64 files in the native byte order are mapped, the other ones are read and
+        converted. Default is True.
+    mode:
+        The memory mapping mode, 'r' for read-only, 'r+' for writing the assignments through to the file, or 'c' for
+        keeping the assignments in memory only. Default is 'r'.
+
+    Returns
+    -------
+        The array-backed matrix, a one-dimensional array gives a row vector.
+    """
+
+    return Matrix(stor_.FlatStorage(*npy_.read(path, mmap, mode)))
+
+
+def _dense_output(rows_: LList, storage: str = 'list') -> Matrix:
+    """Wraps dense rows as a matrix, single rows as row vectors like the rest of :class:`matrix`."""
+    return Matrix(rows_[0] if len(rows_) == 1 else rows_, storage=storage)
+
+
+def _rhs_columns(b, n_rows: int) -> tuple[LList, bool]:
+    """Gives the right-hand sides as a list of columns, and whether ``b`` was a row vector."""
+    b = b if isinstance(b, Matrix) else Matrix(b)
+    as_vector = b.n_rows == 1 and b.n_cols == n_rows
+
+    if not as_vector and b.n_rows != n_rows:
+        raise c_ex_.MatrixDimensionsMismatch(f'Expected {n_rows} rows in the right-hand side, got {b.n_rows}.')
+
+    return ([b._values()] if as_vector else b._columns()), as_vector
+
+
+def _solution_output(solutions: LList, as_vector: bool) -> Matrix:
+    """Wraps the solution columns in the shape of the right-hand side."""
+    if as_vector:
+        return Matrix(solutions[0])
+
+    return Matrix([list(row) for row in zip(*solutions)])
+
+
+def solve(matrix: Matrix or LList, b, exact: bool = False) -> Matrix:
+    """
+    Solve the linear system Ax = b, without forming the inverse of A.
+
+    Parameters
+    ----------
+    matrix:
+        The square matrix A.
+    b:
+        The right-hand side, either a column vector, a row vector or a matrix whose columns are the right-hand sides.
+    exact:
+        Whether to solve exactly, through fraction-free elimination, for integer/fraction A and b. Default is False.
+
+    Returns
+    -------
+        The solution x, with the same shape as ``b``.
+    """
+
+    if hasattr(matrix, 'to_matrix') and hasattr(matrix, 'solve'):
+        # structured matrices use the kernel of their structure, the exact mode goes through the dense matrix
+        if not exact:
+            return matrix.solve(b)
+        matrix = matrix.to_matrix()
+
+    matrix = matrix if isinstance(matrix, Matrix) else Matrix(matrix)
+
+    if exact:
+        columns, as_vector = _rhs_columns(b, matrix.n_rows)
+        if not elim_.is_exact(columns):
+            raise ValueError('The exact mode requires a right-hand side of integer or fraction elements.')
+
+        return _solution_output(elim_.bareiss_solve(matrix._exact_elements(), columns), as_vector)
+
+    return matrix.lu().solve(b)
+
+
+def solve_triangular(matrix: Matrix or LList, b, lower: bool = False, unit_diagonal: bool = False) -> Matrix:
+    """
+    Solve the triangular linear system Tx = b through forward or back substitution.
+
+    Parameters
+    ----------
+    matrix:
+        The square triangular matrix T, the elements in the other triangle are never read.
+    b:
+        The right-hand side, either a column vector, a row vector or a matrix whose columns are the right-hand sides.
+    lower:
+        Whether T is lower triangular or not. Default is False.
+    unit_diagonal:
+        Whether the diagonal of T is taken as ones, without reading it. Default is False.
+
+    Returns
+    -------
+        The solution x, with the same shape as ``b``.
+    """
+
+    matrix = matrix if isinstance(matrix, Matrix) else Matrix(matrix)
+
+    if not matrix.is_square:
+        raise c_ex_.NotASquareMatrix("Matrix must be square for solving a triangular system.")
+
+    rows_ = matrix._rows()
+    if not unit_diagonal and any(row[i] == 0 for i, row in enumerate(rows_)):
+        raise c_ex_.DeterminantIsZero("The given triangular matrix has a zero on its diagonal.")
+
+    columns, as_vector = _rhs_columns(b, matrix.n_rows)
+    substitution = elim_.forward_substitution if lower else elim_.back_substitution
+
+    return _solution_output(substitution(rows_, columns, unit_diagonal), as_vector)
+
+
+def lstsq(matrix: Matrix or LList, b, tolerance: float = None) -> tuple[Matrix, list, int]:
+    """
+    Solve the linear least squares problem, minimizing ||Ax - b||, through the Householder QR factorization of A.
+
+    Unlike the normal equations, (A^T A)x = A^T b, this never forms A^T A, whose condition number is the square of the
+    one of A. Q^T b is computed by applying the reflections to b, and R x = Q^T b is solved by back substitution.
+
+    Parameters
+    ----------
+    matrix:
+        The m x n matrix A, e.g., a tall matrix of observations for a regression.
+    b:
+        The right-hand side, either a column vector, a row vector or a matrix whose columns are the right-hand sides,
+        of m elements each.
+    tolerance:
+        The magnitude below which the diagonal elements of R are taken as zeros, see ``Matrix.rank``. Default is None.
+
+    Returns
+    -------
+        The solution x, with n rows, with the same shape as ``b``, the squared norm of the residual Ax - b for every
+        right-hand side, and the rank of A. For a rank deficient A, the columns found dependent by the pivoting are
+        given zero coefficients, which is a least squares solution but not the one of minimum norm.
+    """
+
+    matrix = matrix if isinstance(matrix, Matrix) else Matrix(matrix)
+    return matrix.qr(pivoting=True).lstsq(b, tolerance)
+
+
+def matrix_power(matrix: Matrix or LList, power: int, modulo: int = None) -> Matrix:
+    """
+    Raise a square matrix to an integer power through binary exponentiation, i.e., repeated squaring.
+
+    Parameters
+    ----------
+    matrix:
+        The square matrix.
+    power:
+        The exponent. A negative exponent raises the inverse, computed exactly through fraction-free elimination for
+        integer/fraction matrices and through the LU factorization otherwise.
+    modulo:
+        A positive integer to reduce every element by after every product, for integer matrices. A negative exponent
+        then raises the inverse modulo ``modulo``, which exists if the determinant is invertible modulo ``modulo``.
+        Default is None.
+
+    Returns
+    -------
+        The power of the matrix, computed with at most 2 log2(power) products.
+    """
+
+    matrix = matrix if isinstance(matrix, Matrix) else Matrix(matrix)
+
+    if not matrix.is_square:
+        raise c_ex_.NotASquareMatrix("Matrix must be square for raising it to a power.")
+
+    if not isinstance(power, int):
+        raise ValueError('The power of a matrix must be an integer, use ** for the element wise power.')
+
+    if matrix.n_rows == 1:
+        value = matrix._values()[0]
+        return Matrix([pow(value, power, modulo) if modulo is not None else value**power])
+
+    if modulo is not None:
+        if not all(isinstance(value, int) for value in matrix._values()):
+            raise ValueError('The modular power requires a matrix of integer elements.')
+
+        reduce_ = partial(map_to_matrix, function=lambda element: element % modulo)
+        if power < 0:
+            try:
+                inverse_determinant = pow(determinant(matrix), -1, modulo)
+            except ValueError:
+                raise c_ex_.DeterminantIsZero('The determinant of the matrix is not invertible modulo '
+                                              f'{modulo}.') from None
+
+            matrix = Matrix(elim_.bareiss_adjugate(matrix.elements)) * inverse_determinant
+    else:
+        reduce_ = None
+        if power < 0:
+            matrix = matrix.inverse(exact=True) if elim_.is_exact(matrix.elements) else matrix.lu().inverse()
+
+    base, power = (matrix if reduce_ is None else reduce_(matrix)), abs(power)
+    result = None
+
+    while power:
+        if power & 1:
+            result = base if result is None else result * base
+            result = result if reduce_ is None else reduce_(result)
+
+        power >>= 1
+        if power:
+            base = base * base if reduce_ is None else reduce_(base * base)
+
+    if result is None:
+        result = identity_matrix(matrix.n_rows) if reduce_ is None else reduce_(identity_matrix(matrix.n_rows))
+
+    return result
+
+
+# degrees of the Pade approximants of expm, with the largest 1-norm for which each one is accurate to double precision
+_PADE_THETAS = ((3, 1.495585217958292e-2), (5, 2.539398330063230e-1), (7, 9.504178996162932e-1),
+                (9, 2.097847961257068e0), (13, 5.371920351148152e0))
+
+_PADE_COEFFICIENTS = {3: (120, 60, 12, 1),
+                      5: (30240, 15120, 3360, 420, 30, 1),
+                      7: (17297280, 8648640, 1995840, 277200, 25200, 1512, 56, 1),
+                      9: (17643225600, 8821612800, 2075673600, 302702400, 30270240, 2162160, 110880, 3960, 90, 1),
+                      13: (64764752532480000, 32382376266240000, 7771770303897600, 1187353796428800,
+                           129060195264000, 10559470521600, 670442572800, 33522128640, 1323241920, 40840800, 960960,
+                           16380, 182, 1)}
+
+
+def _linear_combination(coefficients, matrices) -> Matrix:
+    """Gives the sum of the matrices scaled by the coefficients."""
+    rows_lists = [matrix._rows() for matrix in matrices]
+    return Matrix([[sum(map(mul, coefficients, elements)) for elements in zip(*rows)] for rows in zip(*rows_lists)])
+
+
+def expm(matrix: Matrix or LList) -> Matrix:
+    """
+    Calculate the matrix exponential through scaling and squaring with Pade approximants.
+
+    The degree of the approximant, 3, 5, 7, 9 or 13, is the lowest one that is accurate to double precision for the
+    1-norm of the matrix. Above the limit of the degree 13, the matrix is scaled by 2^-s, and the result squared s
+    times. The approximant r(A) = q(A)^-1 p(A) is evaluated with a single linear solve, through the LU factorization.
+
+    Parameters
+    ----------
+    matrix:
+        The square matrix.
+
+    Returns
+    -------
+        The matrix exponential, e^A.
+    """
+
+    matrix = matrix if isinstance(matrix, Matrix) else Matrix(matrix)
+
+    if not matrix.is_square:
+        raise c_ex_.NotASquareMatrix("Matrix must be square for its exponential.")
+
+    n_rows = matrix.n_rows
+    if n_rows == 1:
+        return Matrix([exp(matrix._values()[0])])
+
+    norm_ = max(sum(map(abs, column)) for column in matrix._columns())
+    identity_ = identity_matrix(n_rows)
+    squarings = 0
+
+    degree = next((degree for degree, theta in _PADE_THETAS if norm_ <= theta), 13)
+    if norm_ > _PADE_THETAS[-1][1]:
+        squarings = ceil(log2(norm_ / _PADE_THETAS[-1][1]))
+        matrix = matrix * 2.0**-squarings
+
+    b_ = _PADE_COEFFICIENTS[degree]
+    a2_ = matrix * matrix
+
+    if degree < 13:
+        powers = [identity_, a2_]
+        for _ in range(2, degree // 2 + 1):
+            powers.append(powers[-1] * a2_)
+
+        u_ = matrix * _linear_combination(b_[1::2], powers)
+        v_ = _linear_combination(b_[0::2], powers)
+    else:
+        a4_ = a2_ * a2_
+        a6_ = a4_ * a2_
+        powers = [a6_, a4_, a2_, identity_]
+
+        u_ = matrix * (a6_ * _linear_combination(b_[13:8:-2], powers) + _linear_combination(b_[7::-2], powers))
+        v_ = a6_ * _linear_combination(b_[12:7:-2], powers) + _linear_combination(b_[6::-2], powers)
+
+    result = solve(v_ - u_, v_ + u_)
+    for _ in range(squarings):
+        result = result * result
+
+    return result
+
+
+def identity_matrix(n_rows: int, n_cols: OptIFloat = None, value: IFloat = 1) -> Matrix:
+    """
+    Generates an identity matrix of given number of rows and columns.
+
+    Parameters
+    ----------
+    n_rows:
+        Number of rows for the null matrix.
+    n_cols:
+        Number of columns for the null matrix.
+    value:
+        The value to set on diagonals. Defaults to 1.
+
+    Returns
+    -------
+        Identity matrix.
+    """
+
+    if n_cols is not None and n_cols != n_rows:
+        raise c_ex_.NotASquareMatrix('The identity matrix can not be rectangular.')
+
+    n_cols = n_rows if n_cols is None else n_cols
+
+    identity_ = null_matrix(n_rows, n_cols)
+
+    if n_rows == n_cols == 1:
+        return Matrix([1])
+    else:
+        for i in range(n_rows):
             identity_[i][i] = value
 
         return identity_
@@ -550,47 +1677,119 @@ def matrix_copy(matrix: Matrix, overwrite: bool = False) -> Matrix:
     """
 
     temp_ = Matrix(matrix) if not isinstance(matrix, Matrix) else matrix
-    return temp_ if overwrite else Matrix(deepcopy(temp_.elements[:]))
+
+    if overwrite:
+        return temp_
+
+    return Matrix(temp_._storage.copy()) if temp_._storage is not None else Matrix(deepcopy(temp_.elements[:]))
 
 
-def map_to_matrix(matrix: Matrix, function, apply_to: str = 'full'):
+def map_to_matrix(matrix: Matrix, function, apply_to: str = 'full', workers: int = None, out: Matrix = None):
     """
     Apply a given function element-wise to a matrix.
 
     Parameters
     ----------
     matrix:
-        The matrix to be mapped.
+        The matrix to be mapped, it is never modified unless it is given as ``out`` as well.
     function:
         A function that takes a single float as input and returns a float.
     apply_to:
         Where to apply the function, either 'diagonal', 'off-diagonal' or 'full'. Default is full.
+    workers:
+        Number of processes to split the rows across. Default is the number set by ``parallel``, which is 1 (serial)
+        outside of it. The function has to be picklable, unless the processes are started with ``fork``.
+    out:
+        A matrix of the same dimensions to write the mapped elements into, it can be the matrix itself. Default is
+        None.
+
+    Returns
+    -------
+    Matrix
+        A new matrix where the function has been applied element-wise, with the storage of the given matrix, or out
+        itself if it is given.
+    """
+
+    return map_to_matrices(function, matrix, apply_to=apply_to, workers=workers, out=out)
+
+
+def map_to_matrices(function, *matrices: Matrix, apply_to: str = 'full', workers: int = None, out: Matrix = None):
+    """
+    Apply a given function element-wise across several matrices, like ``map`` does across iterables.
+
+    Parameters
+    ----------
+    function:
+        A function taking one element of every matrix, e.g., ``max`` or ``math.hypot`` for two matrices.
+    matrices:
+        The matrices to be mapped, all with the same dimensions.
+    apply_to:
+        Where to apply the function, either 'diagonal', 'off-diagonal' or 'full'. The other elements are taken from
+        the first matrix. Default is full.
+    workers:
+        Number of processes to split the rows across, for a single matrix, see ``map_to_matrix``.
+    out:
+        A matrix of the same dimensions to write the mapped elements into, it can be any of the matrices. Default is
+        None.
 
     Returns
     -------
     Matrix
-        A new matrix where the function has been applied element-wise.
+        A new matrix with the storage of the first matrix, or out itself if it is given.
     """
 
-    matrix_ = matrix_copy(matrix, True)
+    if not matrices:
+        raise ValueError('At least one matrix is needed for mapping a function.')
+
+    if apply_to not in elem_.APPLY_TO:
+        raise ValueError(f"Unknown apply_to '{apply_to}', use 'full', 'diagonal' or 'off-diagonal'.")
+
+    matrices = [matrix_copy(matrix, True) for matrix in matrices]
+    matrix_, n_rows, n_cols = matrices[0], matrices[0].n_rows, matrices[0].n_cols
+
+    for other in matrices[1:]:
+        if (other.n_rows, other.n_cols) != (n_rows, n_cols):
+            raise c_ex_.MatrixDimensionsMismatch(f'Can not map across {matrix_.dim} and {other.dim} matrices.')
+
+    if out is not None:
+        matrix_._check_out(out, n_rows, n_cols)
+        out._write_rows(elem_.map_rows(function, [matrix._rows() for matrix in matrices], apply_to))
+        return out
+
+    if len(matrices) == 1:
+        kernels = matrix_._backend(zero_copy=True)
+        if kernels is not None:
+            native = kernels.apply(matrix_._to_native(kernels), function, apply_to)
+            if native is not None:
+                return matrix_._from_native(kernels, native)
+
+        n_workers = par_.resolve_workers(workers, n_rows * n_cols) if matrix_._multi_rows() else 1
+        if n_workers > 1 and par_.can_ship(function):
+            rows_ = par_.parallel_map(matrix_._rows(), function, apply_to, n_workers)
+            return Matrix(rows_, storage=matrix_.storage)
+
+    if matrix_.storage == 'array':
+        typecodes = [matrix._storage.typecode if matrix._storage is not None else None for matrix in matrices]
+        typecode = elem_.result_typecode(function, typecodes) if None not in typecodes else None
+
+        if apply_to == 'full':
+            values = elem_.map_values(function, [matrix._values() for matrix in matrices])
+        else:
+            values = list(chain.from_iterable(elem_.map_rows(function, [matrix._rows() for matrix in matrices],
+                                                             apply_to)))
+
+        return Matrix(stor_.FlatStorage.from_values(values, matrix_._storage.shape, typecode))
 
-    for i in range(matrix_.n_rows):
-        for j in range(matrix_.n_cols):
-            if apply_to == 'diagonal':
-                if i == j:
-                    matrix_[i][j] = function(matrix[i][j])
-            elif apply_to == 'off-diagonal':
-                if i != j:
-                    matrix_[i][j] = function(matrix[i][j])
-            elif apply_to == 'full':
-                matrix_[i][j] = function(matrix[i][j])
+    rows_ = elem_.map_rows(function, [matrix._rows() for matrix in matrices], apply_to)
 
-    return matrix_
+    return Matrix(rows_ if matrix_._multi_rows() else rows_[0])
 
 
 class InFractions:
     def __init__(self, decimal_value: IFloat):
-        self.fraction = Fraction(decimal_value).limit_denominator()
+        # integers and fractions are already exact, only the floats are approximated
+        fraction_ = Fraction(decimal_value)
+        self.fraction = fraction_ if isinstance(decimal_value, Rational) else fraction_.limit_denominator()
 
     def __repr__(self) -> str:
         return str(self.fraction)
@@ -636,13 +1835,21 @@ class Inverse:
         scaled_row = [x * factor for x in matrix[source_row]]
         matrix[target_row] = [x + y for x, y in zip(matrix[target_row], scaled_row)]
 
-    def inverse(self):
+    def inverse(self, workers: int = None):
         n_rows = len(self.elements)
         n_cols = len(self.elements[0])
 
         if n_rows != n_cols:
             raise c_ex_.NotASquareMatrix("Matrix must be square for inverse calculation.")
 
+        n_workers = par_.resolve_workers(workers, n_rows**3)
+        if n_workers > 1:
+            lu_, permutation, _ = elim_.lu_factor(self.elements)
+            if any(row[i] == 0 for i, row in enumerate(lu_)):
+                raise ValueError("Matrix is singular (no unique inverse).")
+
+            return par_.parallel_lu_inverse(lu_, permutation, n_workers)
+
         augmented_matrix = [row[:] + [int(i == j) for j in range(n_rows)] for i, row in enumerate(self.elements)]
 
         for col in range(n_rows):
@@ -663,3 +1870,233 @@ class Inverse:
         inverse_matrix = [row[n_rows:] for row in augmented_matrix]
 
         return inverse_matrix
+
+
+class LUDecomposition:
+    """
+    Partial-pivoting LU factorization, PA = LU, of a square matrix.
+
+    The factors are stored compactly in a single nested list, with the multipliers of the unit lower triangular L below
+    the diagonal and U on and above it. Factorizing costs O(n^3) once, after which every solve costs O(n^2) per
+    right-hand side.
+    """
+
+    def __init__(self, matrix_elements: LList):
+        self.lu_elements, self.permutation, self.sign = elim_.lu_factor(matrix_elements)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.lu_elements)
+
+    @property
+    def is_singular(self) -> bool:
+        """Whether any pivot of U vanishes, relative to the largest pivot and the machine precision."""
+        pivots = [abs(row[i]) for i, row in enumerate(self.lu_elements)]
+        return min(pivots) <= self.n_rows * float_info.epsilon * max(pivots)
+
+    @property
+    def permutation_matrix(self) -> Matrix:
+        """The permutation matrix."""
+        n_rows = self.n_rows
+        return Matrix([[int(j == self.permutation[i]) for j in range(n_rows)] for i in range(n_rows)])
+
+    @property
+    def lower(self) -> Matrix:
+        """The unit lower triangular factor."""
+        return Matrix([row[:i] + [1] + [0] * (self.n_rows - i - 1) for i, row in enumerate(self.lu_elements)])
+
+    @property
+    def upper(self) -> Matrix:
+        """The upper triangular factor."""
+        return Matrix([[0] * i + row[i:] for i, row in enumerate(self.lu_elements)])
+
+    def det(self) -> IFloat:
+        return self.sign * prod(row[i] for i, row in enumerate(self.lu_elements))
+
+    def solve(self, b):
+        """
+        Solve Ax = b with the stored factors.
+
+        Parameters
+        ----------
+        b:
+            The right-hand side, either a column vector, a row vector or a matrix whose columns are the right-hand
+            sides, as a Matrix or as a list.
+
+        Returns
+        -------
+            The solution, with the same shape as ``b``.
+        """
+
+        if self.is_singular:
+            raise c_ex_.DeterminantIsZero("The given matrix is singular and the system has no unique solution.")
+
+        columns, as_vector = _rhs_columns(b, self.n_rows)
+
+        return _solution_output(elim_.lu_solve(self.lu_elements, self.permutation, columns), as_vector)
+
+    def inverse(self) -> Matrix:
+        n_rows = self.n_rows
+        return self.solve([[int(i == j) for j in range(n_rows)] for i in range(n_rows)])
+
+
+class CholeskyDecomposition:
+    """
+    Cholesky factorization, A = LL^T, of a symmetric positive definite matrix.
+
+    The lower triangular factor is stored packed, as the i + 1 elements of its row i. Factorizing costs O(n^3 / 3)
+    once, half of the LU factorization, after which every solve costs O(n^2) per right-hand side.
+    """
+
+    def __init__(self, matrix_elements: LList):
+        self.lower_elements = elim_.cholesky_factor(matrix_elements)
+        if self.lower_elements is None:
+            raise c_ex_.NotPositiveDefinite()
+
+        self._upper_elements = None
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.lower_elements)
+
+    @property
+    def lower(self) -> Matrix:
+        """The lower triangular factor L."""
+        return Matrix([row + [0] * (self.n_rows - i - 1) for i, row in enumerate(self.lower_elements)])
+
+    @property
+    def upper(self) -> Matrix:
+        """The upper triangular factor L^T."""
+        return Matrix([[0] * i + row for i, row in enumerate(self._upper())])
+
+    def _upper(self) -> LList:
+        """The packed rows of L^T, from the diagonal on, computed once."""
+        if self._upper_elements is None:
+            lower_, n_rows = self.lower_elements, self.n_rows
+            self._upper_elements = [[lower_[k][i] for k in range(i, n_rows)] for i in range(n_rows)]
+
+        return self._upper_elements
+
+    def det(self) -> IFloat:
+        return prod(row[-1] for row in self.lower_elements)**2
+
+    def logdet(self) -> float:
+        """The natural logarithm of the determinant, which does not overflow for large matrices."""
+        return 2 * sum(log(row[-1]) for row in self.lower_elements)
+
+    def solve(self, b):
+        """
+        Solve Ax = b with the stored factor, through forward substitution with L and back substitution with L^T.
+
+        Parameters
+        ----------
+        b:
+            The right-hand side, either a column vector, a row vector or a matrix whose columns are the right-hand
+            sides, as a Matrix or as a list.
+
+        Returns
+        -------
+            The solution, with the same shape as ``b``.
+        """
+
+        columns, as_vector = _rhs_columns(b, self.n_rows)
+        columns = elim_.forward_substitution(self.lower_elements, columns)
+
+        return _solution_output(elim_.back_substitution(self._upper(), columns, packed=True), as_vector)
+
+    def inverse(self) -> Matrix:
+        n_rows = self.n_rows
+        return self.solve([[int(i == j) for j in range(n_rows)] for i in range(n_rows)])
+
+
+class QRDecomposition:
+    """
+    Householder QR factorization, AP = QR, of an m x n matrix, optionally with column pivoting.
+
+    The factors are stored compactly, column by column: R on and above the diagonal and the Householder vectors below
+    it, in place of the elements of A, with the scalar factors of the reflections in ``tau``. Factorizing costs
+    O(m n^2) once. Q is never formed for the solutions, the reflections are applied to the right-hand sides instead,
+    in O(m n) each, and ``q`` gives the economy m x min(m, n) factor.
+    """
+
+    def __init__(self, matrix_columns: LList, pivoting: bool = False):
+        self.qr_columns, self.tau, self.permutation = elim_.householder_qr(matrix_columns, pivoting)
+        self.pivoting = pivoting
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.qr_columns[0])
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.qr_columns)
+
+    @property
+    def q(self) -> Matrix:
+        """The economy orthogonal factor, with orthonormal columns, m x min(m, n)."""
+        n_rows, n_reflections = self.n_rows, len(self.tau)
+        identity_ = [[int(i == j) for i in range(n_rows)] for j in range(n_reflections)]
+        columns = elim_.apply_householder(self.qr_columns, self.tau, identity_, transpose=False)
+
+        return Matrix([list(row) for row in zip(*columns)])
+
+    @property
+    def r(self) -> Matrix:
+        """The upper triangular factor, min(m, n) x n."""
+        n_cols = self.n_cols
+        return Matrix([[0] * i + [self.qr_columns[j][i] for j in range(i, n_cols)] for i in range(len(self.tau))])
+
+    @property
+    def permutation_matrix(self) -> Matrix:
+        """The column permutation matrix P."""
+        n_cols = self.n_cols
+        return Matrix([[int(self.permutation[j] == i) for j in range(n_cols)] for i in range(n_cols)])
+
+    def _diagonal(self) -> list:
+        return [abs(self.qr_columns[i][i]) for i in range(len(self.tau))]
+
+    def _tolerance(self, tolerance: float = None) -> float:
+        if tolerance is not None:
+            return tolerance
+
+        return max(self.n_rows, self.n_cols) * float_info.epsilon * max(self._diagonal(), default=0)
+
+    def rank(self, tolerance: float = None) -> int:
+        """
+        Gives the number of diagonal elements of R above the tolerance, see ``Matrix.rank``.
+
+        This is the numerical rank with column pivoting, without it a zero can only be told apart from the rank
+        deficiency of the leading columns.
+        """
+
+        diagonal, tolerance = self._diagonal(), self._tolerance(tolerance)
+        if self.pivoting:
+            # the magnitudes are non-increasing, up to round-off
+            return next((i for i, value in enumerate(diagonal) if value <= tolerance), len(diagonal))
+
+        return sum(value > tolerance for value in diagonal)
+
+    def lstsq(self, b, tolerance: float = None) -> tuple[Matrix, list, int]:
+        """Solve the least squares problem with the stored factors, see ``lstsq``."""
+        rank_ = self.rank(tolerance)
+        if not self.pivoting and rank_ < len(self.tau):
+            raise c_ex_.DeterminantIsZero("The matrix is rank deficient, use the QR factorization with pivoting.")
+
+        columns, as_vector = _rhs_columns(b, self.n_rows)
+        columns = elim_.apply_householder(self.qr_columns, self.tau, columns)
+        residuals = [sum(x * x for x in column[rank_:]) for column in columns]
+
+        # the packed rows of the leading rank x rank block of R
+        qr_ = self.qr_columns
+        packed = [[qr_[j][i] for j in range(i, rank_)] for i in range(rank_)]
+        solutions = elim_.back_substitution(packed, [column[:rank_] for column in columns], packed=True)
+
+        n_cols = self.n_cols
+        unpermuted = []
+        for solution in solutions:
+            x_ = [0] * n_cols
+            for j, value in zip(self.permutation, solution):
+                x_[j] = value
+            unpermuted.append(x_)
+
+        return _solution_output(unpermuted, as_vector), residuals, rank_
@@ -0,0 +1,240 @@
+"""Out-of-core module
+
+This module provides operations on matrices larger than the memory. The operands are usually ``.npy`` files, given by
+their path or memory mapped through ``load``, and the result is written into a new ``.npy`` file, so neither the
+operands nor the result are ever held in memory as a whole. The module provides,
+
+- multiply: Matrix product, tiled over the rows, the columns and the inner dimension.
+- transpose: Transpose, tile by tile.
+- add: Element wise sum.
+- subtract: Element wise difference.
+- hadamard_product: Element wise product.
+- tile_size: The side of the square tiles fitting in a memory budget.
+
+Every function reads its operands in tiles, which are converted to lists of Python numbers, combines them and writes
+the resulting tile into the memory mapped output file. The ``memory`` budget bounds the size of the tiles held at the
+same time, counting ``ELEMENT_BYTES`` per element for the number object and its slot in the list, and is independent of
+the size of the matrices. The tile products are dispatched to the accelerated backend, e.g., NumPy, when the tiles
+reach its threshold, see ``set_backend``. The pages of the memory mapped files are cached by the operating system,
+which evicts them under memory pressure.
+
+The functions give the result as an array-backed matrix, memory mapped with the 'r+' mode, so assignments into it are
+written through to the file. Operands held in memory, with either storage, are accepted as well.
+
+Created on Oct 18 22:41:09 2026
+"""
+
+from array import array
+from operator import add as add_, mul, sub
+
+from .__backend import backends_, custom_exceptions_ as c_ex_, npy_, storage_ as stor_
+from .matrix import Matrix, load
+
+# default memory budget of the tiles, in bytes
+MEMORY = 64 * 2**20
+
+# approximate memory taken by an element of a tile, a float object and its pointer in the list
+ELEMENT_BYTES = 32
+
+
+def tile_size(memory: int = MEMORY, n_tiles: int = 3) -> int:
+    """
+    Gives the side of the square tiles fitting in the memory budget.
+
+    Parameters
+    ----------
+    memory:
+        The memory budget, in bytes. Default is ``MEMORY``.
+    n_tiles:
+        The number of tiles held at the same time. Default is 3.
+
+    Returns
+    -------
+        The side of the tiles, at least 1.
+    """
+
+    return max(int((memory / (n_tiles * ELEMENT_BYTES))**0.5), 1)
+
+
+def multiply(a, b, path: str, memory: int = MEMORY) -> Matrix:
+    """
+    Multiply two matrices, writing the product into an ``.npy`` file.
+
+    Parameters
+    ----------
+    a:
+        The left operand, a matrix or the path of an ``.npy`` file.
+    b:
+        The right operand, a matrix or the path of an ``.npy`` file.
+    path:
+        The file to write the product into.
+    memory:
+        The memory budget of the tiles, in bytes. Default is ``MEMORY``.
+
+    Returns
+    -------
+        The product, memory mapped from the file.
+    """
+
+    a, b = _operand(a), _operand(b)
+    if a.n_cols != b.n_rows:
+        raise c_ex_.MatrixDimensionsMismatch(f'Inner CxR={a.n_cols}x{b.n_rows}, not allowed.')
+
+    n_rows, n_inner, n_cols = a.n_rows, a.n_cols, b.n_cols
+    out_ = _create(path, stor_.result_typecode(_typecode(a), _typecode(b)), n_rows, n_cols)
+    # the tiles of a and b, the accumulated tile of the result, and the product of the tiles or the previous tile of b
+    size_ = tile_size(memory, 4)
+    kernels = backends_.select(size_ * size_)
+
+    for i0 in range(0, n_rows, size_):
+        i1 = min(i0 + size_, n_rows)
+        for j0 in range(0, n_cols, size_):
+            j1 = min(j0 + size_, n_cols)
+
+            tile_ = [[0] * (j1 - j0) for _ in range(i1 - i0)]
+            for k0 in range(0, n_inner, size_):
+                k1 = min(k0 + size_, n_inner)
+                # the tiles are read inline, so the ones of the previous step are released before reading the next
+                if kernels is not None:
+                    product = kernels.matmul(kernels.from_rows(_tile(a, i0, i1, k0, k1)),
+                                             kernels.from_rows(_tile(b, k0, k1, j0, j1)))
+                    for row, product_row in zip(tile_, kernels.to_rows(product)):
+                        row[:] = map(add_, row, product_row)
+                    continue
+
+                # the products are accumulated row by row, so the product of the tiles is never created
+                columns = _tile(b, k0, k1, j0, j1, transposed=True)
+                for row, a_row in zip(tile_, _tile(a, i0, i1, k0, k1)):
+                    row[:] = [value + sum(map(mul, a_row, column)) for value, column in zip(row, columns)]
+
+            _write(out_, i0, j0, tile_)
+
+    return out_
+
+
+def transpose(a, path: str, memory: int = MEMORY) -> Matrix:
+    """
+    Transpose a matrix, writing the transpose into an ``.npy`` file.
+
+    Parameters
+    ----------
+    a:
+        The matrix, or the path of an ``.npy`` file.
+    path:
+        The file to write the transpose into.
+    memory:
+        The memory budget of the tiles, in bytes. Default is ``MEMORY``.
+
+    Returns
+    -------
+        The transpose, memory mapped from the file.
+    """
+
+    a = _operand(a)
+    n_rows, n_cols = a.n_rows, a.n_cols
+    out_ = _create(path, _typecode(a), n_cols, n_rows)
+    size_ = tile_size(memory, 2)
+
+    for i0 in range(0, n_rows, size_):
+        i1 = min(i0 + size_, n_rows)
+        for j0 in range(0, n_cols, size_):
+            j1 = min(j0 + size_, n_cols)
+            _write(out_, j0, i0, [list(column) for column in zip(*_tile(a, i0, i1, j0, j1))])
+
+    return out_
+
+
+def add(a, b, path: str, memory: int = MEMORY) -> Matrix:
+    """
+    Add two matrices element wise, writing the sum into an ``.npy`` file.
+
+    Parameters
+    ----------
+    a:
+        The left operand, a matrix or the path of an ``.npy`` file.
+    b:
+        The right operand, a matrix or the path of an ``.npy`` file.
+    path:
+        The file to write the sum into.
+    memory:
+        The memory budget of the tiles, in bytes. Default is ``MEMORY``.
+
+    Returns
+    -------
+        The sum, memory mapped from the file.
+    """
+
+    return _elementwise(add_, a, b, path, memory)
+
+
+def subtract(a, b, path: str, memory: int = MEMORY) -> Matrix:
+    """Subtract two matrices element wise, writing the difference into an ``.npy`` file, see ``add``."""
+    return _elementwise(sub, a, b, path, memory)
+
+
+def hadamard_product(a, b, path: str, memory: int = MEMORY) -> Matrix:
+    """Multiply two matrices element wise, writing the product into an ``.npy`` file, see ``add``."""
+    return _elementwise(mul, a, b, path, memory)
+
+
+def _elementwise(operator_, a, b, path: str, memory: int) -> Matrix:
+    a, b = _operand(a), _operand(b)
+    if (a.n_rows, a.n_cols) != (b.n_rows, b.n_cols):
+        raise c_ex_.MatrixDimensionsMismatch(f'{a.dim} and {b.dim} matrices can not be combined element wise.')
+
+    n_rows, n_cols = a.n_rows, a.n_cols
+    out_ = _create(path, stor_.result_typecode(_typecode(a), _typecode(b)), n_rows, n_cols)
+
+    # full width bands of rows when they fit, as the rows are then contiguous in all the files
+    n_elements = max(int(memory / (3 * ELEMENT_BYTES)), 1)
+    width = min(n_cols, n_elements)
+    height = max(n_elements // width, 1)
+
+    for i0 in range(0, n_rows, height):
+        i1 = min(i0 + height, n_rows)
+        for j0 in range(0, n_cols, width):
+            j1 = min(j0 + width, n_cols)
+            tile_ = [list(map(operator_, x, y)) for x, y in zip(_tile(a, i0, i1, j0, j1), _tile(b, i0, i1, j0, j1))]
+            _write(out_, i0, j0, tile_)
+
+    return out_
+
+
+def _operand(matrix) -> Matrix:
+    return matrix if isinstance(matrix, Matrix) else load(matrix)
+
+
+def _typecode(matrix: Matrix) -> str:
+    if matrix.storage == 'array':
+        return matrix._storage.typecode
+
+    return stor_.result_typecode(*(stor_.infer_typecode(row) for row in matrix._rows()))
+
+
+def _create(path: str, typecode: str, n_rows: int, n_cols: int) -> Matrix:
+    """Creates the output file, a single row is saved as a row vector, and memory maps it for writing."""
+    npy_.create(path, typecode, (n_cols,) if n_rows == 1 else (n_rows, n_cols))
+
+    return load(path, mode='r+')
+
+
+def _tile(matrix: Matrix, i0: int, i1: int, j0: int, j1: int, transposed: bool = False) -> list:
+    """Gives the rows ``i0:i1`` and the columns ``j0:j1`` of the matrix as a nested list, its columns if transposed."""
+    storage_ = matrix._storage
+    if storage_ is None:
+        rows_ = [row[j0:j1] for row in matrix._rows()[i0:i1]]
+        return [list(column) for column in zip(*rows_)] if transposed else rows_
+
+    view = storage_.sliced(slice(j0, j1)) if storage_.ndim == 1 else storage_.sliced(slice(i0, i1), slice(j0, j1))
+
+    return view.transposed().rows() if transposed else view.rows()
+
+
+def _write(out: Matrix, i0: int, j0: int, rows: list):
+    """Writes the rows into the contiguous buffer of the output, starting at row ``i0`` and column ``j0``."""
+    storage_ = out._storage
+    buffer, typecode, n_cols = storage_.buffer, storage_.typecode, storage_.shape[-1]
+
+    for i, row in enumerate(rows, i0):
+        start = i * n_cols + j0
+        buffer[start:start + len(row)] = array(typecode, row)
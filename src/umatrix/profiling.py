@@ -0,0 +1,276 @@
+"""Profiling module
+
+This module provides opt-in instrumentation of the :class:`matrix` operations. Inside the ``profile`` context, every
+call of an instrumented operation is recorded with,
+
+- calls: Number of calls.
+- time: Total wall time, in seconds, including the time spent in the instrumented operations it calls itself.
+- shapes: Number of calls per combination of operand shapes, e.g., '3x3 * 3x1'.
+- flops: Estimated number of floating point operations, from the shapes and the usual operation counts, e.g.,
+  2 r k c for a product, 2/3 n^3 for an LU factorization or 2 m n^2 - 2/3 n^3 for a QR factorization.
+- bytes: Bytes allocated by the call. By default, this is estimated from the size of the result, with
+  ``trace_memory=True`` it is measured through ``tracemalloc`` instead, which is exact but slows every call down.
+
+The products are recorded per branch, i.e., 'mul[scalar]', 'mul[matrix x matrix]', 'mul[matrix x column]',
+'mul[row x matrix]' and 'mul[row x column]'. Cached results, see :class:`matrix`, are not recomputed and therefore not
+recorded either.
+
+The instrumentation is installed when the first ``profile`` context is entered and removed when the last one exits,
+so the operations run unmodified, without any overhead, outside of it. Module functions, e.g., ``determinant``, are
+instrumented in :mod:`umatrix.matrix`, so references taken through ``from umatrix.matrix import determinant`` before
+entering the context call the uninstrumented function. The module provides,
+
+- profile: Context manager recording the operations run inside it.
+- Profile: The recorded statistics, exportable as a dictionary, as JSON or as a text report.
+
+Created on Oct 18 21:22:15 2026
+"""
+
+import json
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+from sys import getsizeof
+from time import perf_counter
+
+from . import matrix as matrix_module
+from .matrix import CholeskyDecomposition, LUDecomposition, Matrix, QRDecomposition
+
+# active profiles, the operations are recorded into all of them
+_PROFILES = []
+
+# the original attributes of the instrumented owners, while instrumented
+_ORIGINALS = []
+
+
+class Profile:
+    """Statistics of the profiled operations."""
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.operations = {}
+
+    def record(self, operation: str, shapes: str, elapsed: float, flops: int, bytes_: int):
+        statistics = self.operations.get(operation)
+        if statistics is None:
+            statistics = self.operations[operation] = {'calls': 0, 'time': 0.0, 'flops': 0, 'bytes': 0, 'shapes': {}}
+
+        statistics['calls'] += 1
+        statistics['time'] += elapsed
+        statistics['flops'] += flops
+        statistics['bytes'] += bytes_
+        statistics['shapes'][shapes] = statistics['shapes'].get(shapes, 0) + 1
+
+    def reset(self):
+        self.operations.clear()
+
+    def as_dict(self) -> dict:
+        """Gives the statistics per operation, sorted by decreasing total time."""
+        ordered = sorted(self.operations.items(), key=lambda item: -item[1]['time'])
+        return {operation: dict(statistics, shapes=dict(statistics['shapes'])) for operation, statistics in ordered}
+
+    def to_json(self, path: str = None) -> str:
+        """
+        Gives the statistics as JSON.
+
+        Parameters
+        ----------
+        path:
+            File to write the JSON to as well. Default is None.
+
+        Returns
+        -------
+            The JSON string.
+        """
+
+        json_ = json.dumps(self.as_dict(), indent=2)
+
+        if path is not None:
+            with open(path, 'w', encoding='utf-8') as file_:
+                file_.write(json_)
+
+        return json_
+
+    def report(self) -> str:
+        """Gives the statistics as a text table."""
+        lines = [f"{'operation':24s} {'calls':>8s} {'time (s)':>12s} {'flops':>14s} {'bytes':>14s}"]
+        for operation, statistics in self.as_dict().items():
+            lines.append(f"{operation:24s} {statistics['calls']:8d} {statistics['time']:12.6f} "
+                         f"{statistics['flops']:14d} {statistics['bytes']:14d}")
+
+        return '\n'.join(lines)
+
+
+@contextmanager
+def profile(trace_memory: bool = False):
+    """
+    Record the matrix operations run inside the context.
+
+    Parameters
+    ----------
+    trace_memory:
+        Whether to measure the allocated bytes with ``tracemalloc``, instead of estimating them. Default is False.
+
+    Returns
+    -------
+        The :class:`Profile` holding the statistics, filled as the operations run.
+    """
+
+    profile_ = Profile(trace_memory)
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    if not _PROFILES:
+        _install()
+    _PROFILES.append(profile_)
+
+    try:
+        yield profile_
+    finally:
+        _PROFILES.remove(profile_)
+        if not _PROFILES:
+            _uninstall()
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def _shape(value) -> tuple:
+    if isinstance(value, Matrix):
+        return value.n_rows, value.n_cols
+
+    if isinstance(value, list) and value:
+        return (len(value), len(value[0])) if isinstance(value[0], list) else (1, len(value))
+
+    return None
+
+
+def _signature(arguments: tuple) -> str:
+    shapes = []
+    for argument in arguments:
+        shape_ = _shape(argument)
+        if shape_ is not None:
+            shapes.append(f'{shape_[0]}x{shape_[1]}')
+        elif isinstance(argument, (int, float)):
+            shapes.append('scalar')
+
+    return ' * '.join(shapes)
+
+
+def _size(arguments: tuple) -> int:
+    shape_ = _shape(arguments[0])
+    return shape_[0] * shape_[1] if shape_ else 0
+
+
+def _cubic(factor: float):
+    def flops(arguments: tuple) -> int:
+        shape_ = _shape(arguments[0])
+        return int(factor * shape_[0]**3) if shape_ else 0
+
+    return flops
+
+
+def _product_flops(arguments: tuple) -> int:
+    left, right = _shape(arguments[0]), _shape(arguments[1])
+    if left is None or right is None:
+        return _size(arguments)
+
+    return 2 * left[0] * left[1] * right[1]
+
+
+def _qr_flops(arguments: tuple) -> int:
+    """2 m n^2 - 2/3 n^3 for the Householder QR of an m x n matrix, given by its columns."""
+    columns = arguments[1]
+    n_rows, n_cols = len(columns[0]), len(columns)
+
+    return int(2 * n_rows * n_cols**2 - 2 / 3 * min(n_rows, n_cols)**3)
+
+
+def _mul_branch(arguments: tuple) -> str:
+    self, other = arguments[:2]
+    if isinstance(other, (int, float)):
+        return 'mul[scalar]'
+
+    if not isinstance(other, Matrix):
+        return 'mul[other]'
+
+    left = 'row' if self.n_rows == 1 else 'matrix'
+    right = 'column' if other.n_cols == 1 else 'matrix'
+
+    return f'mul[{left} x {right}]'
+
+
+def _estimated_bytes(result) -> int:
+    """Size of a resulting matrix, its list objects and element objects or its flat buffer."""
+    if not isinstance(result, Matrix):
+        return 0
+
+    if result.storage == 'array':
+        return result.n_rows * result.n_cols * 8
+
+    rows_ = result._rows() if result._multi_rows() else []
+    return getsizeof(result._elements) + sum(getsizeof(row) for row in rows_) + 24 * result.n_rows * result.n_cols
+
+
+def _wrap(function, operation, flops):
+    @wraps(function)
+    def instrumented(*arguments, **keywords):
+        tracing = tracemalloc.is_tracing()
+        before = tracemalloc.get_traced_memory()[0] if tracing else 0
+
+        start = perf_counter()
+        result = function(*arguments, **keywords)
+        elapsed = perf_counter() - start
+
+        name = operation(arguments) if callable(operation) else operation
+        shapes, n_flops = _signature(arguments), flops(arguments)
+        for profile_ in _PROFILES:
+            if profile_.trace_memory and tracing:
+                bytes_ = max(tracemalloc.get_traced_memory()[0] - before, 0)
+            else:
+                bytes_ = _estimated_bytes(result)
+            profile_.record(name, shapes, elapsed, n_flops, bytes_)
+
+        return result
+
+    return instrumented
+
+
+# (owner, attribute, operation name or classifier, flops estimator)
+_TARGETS = ((Matrix, '__add__', 'add', _size),
+            (Matrix, '__radd__', 'add', _size),
+            (Matrix, '__sub__', 'sub', _size),
+            (Matrix, '__rsub__', 'sub', _size),
+            (Matrix, '__mul__', _mul_branch, _product_flops),
+            (Matrix, '__rmul__', _mul_branch, _product_flops),
+            (Matrix, '__truediv__', 'div', _size),
+            (Matrix, '__neg__', 'neg', _size),
+            (Matrix, '__pow__', 'pow', _size),
+            (Matrix, '__iadd__', 'iadd', _size),
+            (Matrix, '__isub__', 'isub', _size),
+            (Matrix, '__imul__', 'imul', _product_flops),
+            (Matrix, '__itruediv__', 'idiv', _size),
+            (Matrix, 'matmul', 'matmul', _product_flops),
+            (Matrix, 'hadamard_product', 'hadamard_product', _size),
+            (Matrix, '_transpose', 'transpose', lambda _: 0),
+            (Matrix, '_inverse', 'inverse', _cubic(2)),
+            (LUDecomposition, '__init__', 'lu', lambda arguments: _cubic(2 / 3)(arguments[1:])),
+            (CholeskyDecomposition, '__init__', 'cholesky', lambda arguments: _cubic(1 / 3)(arguments[1:])),
+            (QRDecomposition, '__init__', 'qr', _qr_flops),
+            (matrix_module, 'determinant', 'determinant', _cubic(2 / 3)),
+            (matrix_module, 'solve', 'solve', _cubic(2 / 3)),
+            (matrix_module, 'map_to_matrix', 'map_to_matrix', _size),
+            (matrix_module, 'matrix_copy', 'matrix_copy', lambda _: 0))
+
+
+def _install():
+    for owner, attribute, operation, flops in _TARGETS:
+        original = vars(owner)[attribute]
+        _ORIGINALS.append((owner, attribute, original))
+        setattr(owner, attribute, _wrap(original, operation, flops))
+
+
+def _uninstall():
+    while _ORIGINALS:
+        owner, attribute, original = _ORIGINALS.pop()
+        setattr(owner, attribute, original)
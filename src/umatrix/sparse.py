@@ -0,0 +1,392 @@
+"""Sparse matrix module
+
+This module provides a sparse counterpart to :class:`matrix`, for matrices whose elements are mostly zeros. The class
+is,
+
+- :class:`SparseMatrix`
+
+which is built from coordinate (COO) triplets and stores only the non-zero elements, in compressed sparse row (CSR)
+form: the column index and value of every non-zero element, row after row, with an index pointer marking where each
+row starts. Memory and the cost of every operation scale with the number of non-zero elements instead of the number
+of elements. The sparse matrices have the following associated properties,
+
+- n_rows: Number of rows of the matrix.
+- n_cols: Number of columns of the matrix.
+- dim: String describing the dimensions of the matrix.
+- is_square: Whether the given matrix is square or not.
+- nnz: Number of stored non-zero elements.
+- t: Short form for transpose of the matrix.
+- transpose: Transpose of the matrix, in O(n + nnz).
+
+Along with these properties, the sparse matrix object has the following functions,
+
+- hadamard_product: Element wise multiplication with a sparse matrix or a :class:`matrix`, giving a sparse matrix.
+- elementwise_product: Same as hadamard_product.
+- to_matrix: Gives the dense :class:`matrix`.
+- to_coo: Gives the row indices, column indices and values of the non-zero elements.
+
+Sparse matrices can be added to, subtracted from and multiplied by scalars, sparse matrices and dense matrices, on
+either side. Sparse results are given whenever both operands are sparse, sparse times dense and dense times sparse
+products give dense matrices, and adding a dense matrix or a non-zero scalar gives a dense matrix.
+
+Additionally, the module provides the following functions,
+
+- sparse_from_matrix: Creates a sparse matrix from the non-zero elements of a :class:`matrix`.
+- sparse_identity: Generates the sparse identity matrix, with n non-zero elements.
+
+Created on Oct 18 16:05:31 2026
+"""
+
+from array import array
+
+from . import IFloat
+from .__backend import custom_exceptions_ as c_ex_
+from .matrix import Matrix, _dense_output
+
+
+class SparseMatrix:
+
+    __slots__ = ('_indptr', '_indices', '_data', '_shape')
+
+    def __init__(self, rows: list, cols: list, values: list, shape: tuple):
+        """
+        Creates a sparse matrix from coordinate triplets.
+
+        Parameters
+        ----------
+        rows:
+            Row index of every element.
+        cols:
+            Column index of every element.
+        values:
+            Value of every element. Values given for the same position are summed and zeros are not stored.
+        shape:
+            Number of rows and columns of the matrix.
+        """
+
+        if not len(rows) == len(cols) == len(values):
+            raise ValueError('The rows, cols and values must have the same length.')
+
+        n_rows, n_cols = shape
+        entries = [{} for _ in range(n_rows)]
+
+        for row, col, value in zip(rows, cols, values):
+            if not (0 <= row < n_rows and 0 <= col < n_cols):
+                raise c_ex_.IndexOutOfBounds(f'Index ({row}, {col}) is out of bounds for a {n_rows}x{n_cols} matrix.')
+
+            row_ = entries[row]
+            row_[col] = row_.get(col, 0) + value
+
+        self._compress(entries, (n_rows, n_cols))
+
+    def _compress(self, entries: list, shape: tuple):
+        """Fills the CSR arrays from one ``{column: value}`` dictionary per row, dropping the zeros."""
+        indptr, indices, data = array('q', [0]), array('q'), []
+
+        for row_ in entries:
+            for col in sorted(row_):
+                value = row_[col]
+                if value != 0:
+                    indices.append(col)
+                    data.append(value)
+
+            indptr.append(len(data))
+
+        self._indptr, self._indices, self._data, self._shape = indptr, indices, data, tuple(shape)
+
+    @classmethod
+    def _from_entries(cls, entries: list, shape: tuple):
+        sparse_ = cls.__new__(cls)
+        sparse_._compress(entries, shape)
+
+        return sparse_
+
+    @classmethod
+    def _from_csr(cls, indptr: array, indices: array, data: list, shape: tuple):
+        sparse_ = cls.__new__(cls)
+        sparse_._indptr, sparse_._indices, sparse_._data, sparse_._shape = indptr, indices, data, tuple(shape)
+
+        return sparse_
+
+    def __repr__(self):
+        return f'SparseMatrix({self.dim}, nnz={self.nnz})'
+
+    def __eq__(self, other):
+        if isinstance(other, SparseMatrix):
+            return (self._shape == other._shape and self._indptr == other._indptr and self._indices == other._indices
+                    and self._data == other._data)
+
+        if isinstance(other, Matrix):
+            return self.to_matrix() == other
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __add__(self, other):
+        if isinstance(other, SparseMatrix):
+            self._check_shape(other)
+
+            entries = self._entries()
+            for row_, (cols, values) in zip(entries, other._row_items()):
+                for col, value in zip(cols, values):
+                    row_[col] = row_.get(col, 0) + value
+
+            return self._from_entries(entries, self._shape)
+
+        elif isinstance(other, Matrix):
+            self._check_shape(other)
+
+            rows_ = [list(row) for row in other._rows()]
+            for row, (cols, values) in zip(rows_, self._row_items()):
+                for col, value in zip(cols, values):
+                    row[col] += value
+
+            return _dense_output(rows_)
+
+        elif isinstance(other, (int, float)):
+            return self._scaled(1) if other == 0 else self.to_matrix() + other
+
+        else:
+            raise ValueError("Unsupported operand type for addition.")
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self.__add__(-1 * other)
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __neg__(self):
+        return self._scaled(-1)
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return self._scaled(other)
+
+        elif isinstance(other, SparseMatrix):
+            if self.n_cols != other.n_rows:
+                raise c_ex_.MatrixDimensionsMismatch(f'Inner CxR={self.n_cols}x{other.n_rows}, not allowed.')
+
+            other_rows = list(other._row_items())
+            entries = []
+
+            for cols, values in self._row_items():
+                row_ = {}
+                for k, a_value in zip(cols, values):
+                    for col, b_value in zip(*other_rows[k]):
+                        row_[col] = row_.get(col, 0) + a_value * b_value
+                entries.append(row_)
+
+            return self._from_entries(entries, (self.n_rows, other.n_cols))
+
+        elif isinstance(other, Matrix):
+            if self.n_cols != other.n_rows:
+                raise c_ex_.MatrixDimensionsMismatch(f'Inner CxR={self.n_cols}x{other.n_rows}, not allowed.')
+
+            b_rows, n_cols = other._rows(), other.n_cols
+            rows_ = []
+
+            for cols, values in self._row_items():
+                out = [0] * n_cols
+                for k, a_value in zip(cols, values):
+                    out = [value + a_value * b_value for value, b_value in zip(out, b_rows[k])]
+                rows_.append(out)
+
+            return _dense_output(rows_)
+
+        return NotImplemented
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float)):
+            return self._scaled(other)
+
+        elif isinstance(other, Matrix):
+            if other.n_cols != self.n_rows:
+                raise c_ex_.MatrixDimensionsMismatch(f'Inner CxR={other.n_cols}x{self.n_rows}, not allowed.')
+
+            own_rows = list(self._row_items())
+            rows_ = []
+
+            for a_row in other._rows():
+                out = [0] * self.n_cols
+                for a_value, (cols, values) in zip(a_row, own_rows):
+                    if a_value:
+                        for col, b_value in zip(cols, values):
+                            out[col] += a_value * b_value
+                rows_.append(out)
+
+            return _dense_output(rows_)
+
+        return NotImplemented
+
+    def __truediv__(self, other):
+        if isinstance(other, (Matrix, SparseMatrix)):
+            raise c_ex_.DivisionByMatrix()
+
+        return self._from_csr(array('q', self._indptr), array('q', self._indices),
+                              [value / other for value in self._data], self._shape)
+
+    @property
+    def n_rows(self) -> int:
+        return self._shape[0]
+
+    @property
+    def n_cols(self) -> int:
+        return self._shape[1]
+
+    @property
+    def dim(self) -> str:
+        return f'RxC: {self.n_rows}x{self.n_cols}'
+
+    @property
+    def is_square(self) -> bool:
+        return self.n_rows == self.n_cols
+
+    @property
+    def nnz(self) -> int:
+        return len(self._data)
+
+    def _row_items(self):
+        """Yields the column indices and the values of the non-zero elements of every row."""
+        indptr, indices, data = self._indptr, self._indices, self._data
+
+        for start, stop in zip(indptr, indptr[1:]):
+            yield indices[start:stop], data[start:stop]
+
+    def _entries(self) -> list:
+        return [dict(zip(cols, values)) for cols, values in self._row_items()]
+
+    def _check_shape(self, other):
+        if self.n_rows != other.n_rows or self.n_cols != other.n_cols:
+            raise c_ex_.MatrixDimensionsMismatch()
+
+    def _scaled(self, scalar: IFloat):
+        if scalar == 0:
+            return self._from_csr(array('q', [0] * (self.n_rows + 1)), array('q'), [], self._shape)
+
+        return self._from_csr(array('q', self._indptr), array('q', self._indices),
+                              [value * scalar for value in self._data], self._shape)
+
+    def _transpose(self):
+        n_rows, n_cols = self._shape
+        indptr, indices, data = self._indptr, self._indices, self._data
+
+        # counting sort of the elements by column
+        t_indptr = array('q', [0] * (n_cols + 1))
+        for col in indices:
+            t_indptr[col + 1] += 1
+        for col in range(n_cols):
+            t_indptr[col + 1] += t_indptr[col]
+
+        t_indices, t_data = array('q', [0] * len(data)), [0] * len(data)
+        next_ = array('q', t_indptr[:-1])
+
+        for row in range(n_rows):
+            for position in range(indptr[row], indptr[row + 1]):
+                col = indices[position]
+                t_indices[next_[col]], t_data[next_[col]] = row, data[position]
+                next_[col] += 1
+
+        return self._from_csr(t_indptr, t_indices, t_data, (n_cols, n_rows))
+
+    @property
+    def t(self):
+        return self._transpose()
+
+    @property
+    def transpose(self):
+        return self._transpose()
+
+    def hadamard_product(self, other):
+        self._check_shape(other)
+
+        if isinstance(other, SparseMatrix):
+            entries = []
+            for (cols, values), other_row in zip(self._row_items(), other._entries()):
+                entries.append({col: value * other_row[col] for col, value in zip(cols, values) if col in other_row})
+
+            return self._from_entries(entries, self._shape)
+
+        b_rows = other._rows()
+        entries = [{col: value * b_row[col] for col, value in zip(cols, values)}
+                   for (cols, values), b_row in zip(self._row_items(), b_rows)]
+
+        return self._from_entries(entries, self._shape)
+
+    def elementwise_product(self, other):
+        return self.hadamard_product(other)
+
+    def to_matrix(self, storage: str = 'list') -> Matrix:
+        """
+        Gives the dense matrix.
+
+        Parameters
+        ----------
+        storage:
+            Storage of the dense matrix, either 'list' or 'array'. Default is 'list'.
+
+        Returns
+        -------
+            The dense matrix, with zeros in place of the elements that are not stored.
+        """
+
+        rows_ = []
+        for cols, values in self._row_items():
+            row = [0] * self.n_cols
+            for col, value in zip(cols, values):
+                row[col] = value
+            rows_.append(row)
+
+        return _dense_output(rows_, storage)
+
+    def to_coo(self) -> tuple[list, list, list]:
+        """Gives the row indices, column indices and values of the non-zero elements, in row-major order."""
+        indptr = self._indptr
+        rows_ = [row for row in range(self.n_rows) for _ in range(indptr[row], indptr[row + 1])]
+
+        return rows_, self._indices.tolist(), list(self._data)
+
+    def dot(self, other):
+        return self * other
+
+
+def sparse_from_matrix(matrix) -> SparseMatrix:
+    """
+    Creates a sparse matrix from the non-zero elements of a matrix.
+
+    Parameters
+    ----------
+    matrix:
+        The dense matrix, either a :class:`matrix` or a nested list.
+
+    Returns
+    -------
+        The sparse matrix.
+    """
+
+    matrix = matrix if isinstance(matrix, Matrix) else Matrix(matrix)
+    entries = [{col: value for col, value in enumerate(row) if value != 0} for row in matrix._rows()]
+
+    return SparseMatrix._from_entries(entries, (matrix.n_rows, matrix.n_cols))
+
+
+def sparse_identity(n_rows: int) -> SparseMatrix:
+    """
+    Generates the sparse identity matrix.
+
+    Parameters
+    ----------
+    n_rows:
+        Number of rows (and columns) of the identity matrix.
+
+    Returns
+    -------
+        The identity matrix, storing only its n diagonal elements.
+    """
+
+    return SparseMatrix._from_csr(array('q', range(n_rows + 1)), array('q', range(n_rows)), [1] * n_rows,
+                                  (n_rows, n_rows))
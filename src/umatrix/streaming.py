@@ -0,0 +1,244 @@
+"""Streaming module
+
+This module provides the row by row reading and processing of matrices, so large inputs are handled in bounded
+memory. The readers are generators giving the rows of a file as they are parsed, which ``Matrix.from_rows`` appends to
+a flat array buffer without holding them as lists all at once. The module provides,
+
+- iter_csv: Generator of the rows of a CSV file.
+- iter_text: Generator of the rows of a whitespace, or otherwise, delimited text file.
+- read_csv: Reads a CSV file into a matrix.
+- read_text: Reads a delimited text file into a matrix.
+- row_blocks: Groups an iterable of rows into lists of a given number of rows.
+- prefetch: Consumes an iterable in a background thread, ahead of its consumer.
+- stream_multiply: Multiplies rows, consumed lazily, by a matrix, giving the rows of the product.
+
+The rows read, and the product rows given, are lists of Python numbers, a row is read as ints if all its elements are
+integers and as floats otherwise. Chaining them gives a pipeline whose memory is bounded by the block size, e.g.,
+
+    >>> product = Matrix.from_rows(stream_multiply(prefetch(iter_csv('a.csv')), x_), storage='array')
+
+``prefetch`` overlaps the reading of the next rows with the processing of the current ones. Only the file reads, and
+the NumPy products, release the global interpreter lock, so parsing and pure Python arithmetic do not run in parallel.
+
+Created on Oct 18 23:18:44 2026
+"""
+
+import csv
+from itertools import islice
+from operator import mul
+from queue import Full, Queue
+from threading import Event, Thread
+
+from .__backend import backends_, custom_exceptions_ as c_ex_
+from .matrix import Matrix
+
+# number of rows multiplied at once by ``stream_multiply``
+BLOCK_SIZE = 256
+
+# seconds between the checks of the producer thread of ``prefetch`` for its consumer having stopped
+_POLL_INTERVAL = 0.05
+
+
+def _numbers(tokens: list) -> list:
+    """Parses a row as ints, or as floats if any of its elements is not an integer."""
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        return list(map(float, tokens))
+
+
+def iter_csv(path: str, delimiter: str = ',', skip_rows: int = 0):
+    """
+    Iterate over the rows of a CSV file.
+
+    Parameters
+    ----------
+    path:
+        The file to read.
+    delimiter:
+        The delimiter of the elements. Default is ','.
+    skip_rows:
+        Number of lines to skip at the start of the file, e.g., 1 for a header. Default is 0.
+
+    Returns
+    -------
+        Generator of the rows, skipping the empty lines.
+    """
+
+    with open(path, newline='', encoding='utf-8') as file_:
+        for row in islice(csv.reader(file_, delimiter=delimiter), skip_rows, None):
+            if row:
+                yield _numbers(row)
+
+
+def iter_text(path: str, delimiter: str = None, comments: str = '#', skip_rows: int = 0):
+    """
+    Iterate over the rows of a delimited text file.
+
+    Parameters
+    ----------
+    path:
+        The file to read.
+    delimiter:
+        The delimiter of the elements. Default is None, for any whitespace.
+    comments:
+        The character starting the comments, which run until the end of the line. Default is '#'.
+    skip_rows:
+        Number of lines to skip at the start of the file. Default is 0.
+
+    Returns
+    -------
+        Generator of the rows, skipping the empty and comment lines.
+    """
+
+    with open(path, encoding='utf-8') as file_:
+        for line in islice(file_, skip_rows, None):
+            if comments:
+                line = line.split(comments, 1)[0]
+            if line.strip():
+                yield _numbers(line.split(delimiter))
+
+
+def read_csv(path: str, delimiter: str = ',', skip_rows: int = 0, storage: str = 'array') -> Matrix:
+    """Reads a CSV file into a matrix, see ``iter_csv`` and ``Matrix.from_rows``. The default storage is 'array'."""
+    return Matrix.from_rows(iter_csv(path, delimiter, skip_rows), storage=storage)
+
+
+def read_text(path: str, delimiter: str = None, comments: str = '#', skip_rows: int = 0,
+              storage: str = 'array') -> Matrix:
+    """Reads a delimited text file into a matrix, see ``iter_text`` and ``Matrix.from_rows``."""
+    return Matrix.from_rows(iter_text(path, delimiter, comments, skip_rows), storage=storage)
+
+
+def row_blocks(rows, block_size: int = BLOCK_SIZE):
+    """
+    Group the rows into blocks.
+
+    Parameters
+    ----------
+    rows:
+        Iterable of rows.
+    block_size:
+        Number of rows per block, the last block can have fewer rows. Default is ``BLOCK_SIZE``.
+
+    Returns
+    -------
+        Generator of the blocks, as lists of rows.
+    """
+
+    if block_size < 1:
+        raise ValueError('The block size must be at least 1.')
+
+    rows = iter(rows)
+    while True:
+        block = [row if isinstance(row, list) else list(row) for row in islice(rows, block_size)]
+        if not block:
+            return
+        yield block
+
+
+class _Failure:
+    """An exception raised by the producer of ``prefetch``, to be raised again in the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetch(iterable, depth: int = 2):
+    """
+    Consume the iterable in a background thread, keeping up to ``depth`` items ready ahead of the consumer.
+
+    Parameters
+    ----------
+    iterable:
+        The iterable to consume, e.g., the rows or the row blocks of a file.
+    depth:
+        Maximum number of items consumed ahead. Default is 2.
+
+    Returns
+    -------
+        Generator of the items of the iterable, in order. An exception raised while consuming the iterable is raised
+        again at the position of the failing item, and closing the generator signals the background thread to stop,
+        without waiting for an item the iterable is still producing.
+    """
+
+    queue_, stop, end = Queue(max(depth, 1)), Event(), object()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                queue_.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except Full:
+                continue
+
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+        except Exception as error:
+            put(_Failure(error))
+            return
+
+        put(end)
+
+    thread = Thread(target=produce, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = queue_.get()
+            if item is end:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+
+            yield item
+    finally:
+        # the thread is a daemon, so it is not waited for while it is blocked in the iterable, e.g., on a slow read
+        stop.set()
+        thread.join(_POLL_INTERVAL)
+
+
+def stream_multiply(rows, other: Matrix, block_size: int = BLOCK_SIZE):
+    """
+    Multiply the matrix made of the rows by the other matrix, consuming the rows lazily.
+
+    Parameters
+    ----------
+    rows:
+        Iterable of the rows of the left operand, or a matrix, which is iterated in blocks of rows.
+    other:
+        The right operand, e.g., a column vector for a matrix-vector product.
+    block_size:
+        Number of rows multiplied at once, blocks reaching the threshold of the accelerated backend, e.g., NumPy,
+        are dispatched to it. Default is ``BLOCK_SIZE``.
+
+    Returns
+    -------
+        Generator of the rows of the product, as lists.
+    """
+
+    if not isinstance(other, Matrix):
+        raise ValueError('The other must be a Matrix object')
+
+    if isinstance(rows, Matrix):
+        blocks = (block._rows() for block in rows.iter_row_blocks(block_size))
+    else:
+        blocks = row_blocks(rows, block_size)
+
+    n_inner = other.n_rows
+    columns, kernels, native = other._columns(), backends_.select(block_size * n_inner), None
+
+    for block in blocks:
+        if any(len(row) != n_inner for row in block):
+            raise c_ex_.MatrixDimensionsMismatch(f'Rows of length {n_inner} are needed for a {other.dim} matrix.')
+
+        if kernels is not None:
+            native = kernels.from_rows(other._rows()) if native is None else native
+            yield from kernels.to_rows(kernels.matmul(kernels.from_rows(block), native))
+        else:
+            yield from ([sum(map(mul, row, column)) for column in columns] for row in block)
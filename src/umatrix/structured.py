@@ -0,0 +1,1083 @@
+"""Structured matrix module
+
+This module provides square matrices whose zeros, or repeated elements, are known from their structure, so only the
+remaining elements are stored and every operation skips the known zeros. The classes are,
+
+- :class:`DiagonalMatrix`, storing the n diagonal elements.
+- :class:`TriangularMatrix`, upper or lower, storing the n(n + 1)/2 elements of its triangle, row by row.
+- :class:`BandedMatrix`, storing the elements within its lower and upper bandwidths, row by row.
+- :class:`SymmetricMatrix`, storing the n(n + 1)/2 elements of its lower triangle, row by row.
+
+The operations use the kernel of the structure, e.g., for a product with an n x k matrix,
+
+- diagonal: O(n k) products and solutions, O(n) determinant and inverse.
+- triangular: O(n^2 k / 2) products, O(n^2 k) solutions through substitution, O(n) determinant.
+- banded, with bandwidths l and u: O(n (l + u + 1) k) products, O(n l (l + u) + n (l + u) k) solutions and
+  determinant through banded elimination with partial pivoting.
+- symmetric: O(n^2 k) products, without ever holding the dense matrix, its solutions go through the LU of
+  :class:`matrix`, and its Cholesky factorization is read directly from the packed rows.
+
+The structured matrices have the following associated properties,
+
+- n_rows: Number of rows of the matrix.
+- n_cols: Number of columns of the matrix.
+- dim: String describing the dimensions of the matrix.
+- is_square: Always True.
+- t: Short form for transpose of the matrix.
+- transpose: Transpose of the matrix, keeping its structure.
+
+Along with these properties, the structured matrix objects have the following functions,
+
+- determinant: Determinant of the matrix.
+- solve: Solves Ax = b for a vector or matrix b.
+- inverse: Inverse of the matrix, keeping its structure except for the banded matrices.
+- trace: Sum of the diagonal elements.
+- diagonal: The diagonal elements, as a list.
+- hadamard_product: Element wise multiplication with a structured matrix or a :class:`matrix`.
+- elementwise_product: Same as hadamard_product.
+- to_matrix: Gives the dense :class:`matrix`.
+
+Structured matrices can be added to, subtracted from and multiplied by scalars, structured matrices and dense matrices,
+on either side. The result keeps the structure whenever the structure of the operands allows it, e.g., the product of
+two upper triangular matrices is upper triangular, the sum of two banded matrices is banded, a diagonal matrix times
+any structured matrix scales its rows, and it is a dense :class:`matrix` otherwise. Products of two structures without
+a common one use the kernel of the operand storing the fewest elements.
+
+Additionally, the module provides the following functions,
+
+- diagonal_from_matrix: Creates a diagonal matrix from the diagonal of a :class:`matrix`.
+- diagonal_identity: Generates the identity matrix, storing only its n diagonal elements.
+- triangular_from_matrix: Creates a triangular matrix from the upper or lower triangle of a :class:`matrix`.
+- banded_from_matrix: Creates a banded matrix from the band of a :class:`matrix`.
+- symmetric_from_matrix: Creates a symmetric matrix from the lower triangle of a :class:`matrix`.
+
+Created on Oct 19 01:12:40 2026
+"""
+
+from functools import partial
+from itertools import repeat
+from math import prod
+from operator import add, mul, sub
+
+from .__backend import custom_exceptions_ as c_ex_, elimination_ as elim_
+from .matrix import CholeskyDecomposition, Matrix, _dense_output, _rhs_columns, _solution_output, determinant, solve
+
+
+class _StructuredMatrix:
+    """
+    Operators and properties shared by the structured matrices.
+
+    The subclasses provide the storage specific kernels, ``_layout``, ``_stored``, ``_size``, ``_dense_rows``,
+    ``_diagonal_values``, ``_mapped``, ``_added_to``, ``_shifted``, ``_matmul``, ``_transpose`` and
+    ``_masked_product``, and optionally the structure preserving versions of ``_structured_sum``, ``_product``,
+    ``_scale_rows`` and ``_scale_columns``, which fall back to the dense result given here when the structure is not
+    preserved.
+    """
+
+    __slots__ = ('_n',)
+
+    def __init__(self, n_rows: int):
+        self._n = n_rows
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.dim})'
+
+    def __eq__(self, other):
+        if type(other) is type(self) and self._layout() == other._layout():
+            return self._stored() == other._stored()
+
+        if isinstance(other, _StructuredMatrix):
+            return self._n == other._n and self._dense_rows() == other._dense_rows()
+
+        if isinstance(other, Matrix):
+            return self.to_matrix() == other
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __add__(self, other):
+        if isinstance(other, _StructuredMatrix):
+            self._check_shape(other)
+
+            if isinstance(other, DiagonalMatrix):
+                return self._shifted(other._diagonal)
+            if isinstance(self, DiagonalMatrix):
+                return other._shifted(self._diagonal)
+
+            return self._structured_sum(other)
+
+        elif isinstance(other, Matrix):
+            self._check_shape(other)
+            return _dense_output(self._added_to([list(row) for row in other._rows()]))
+
+        elif isinstance(other, (int, float)):
+            return self._scaled(1) if other == 0 else self.to_matrix() + other
+
+        else:
+            raise ValueError("Unsupported operand type for addition.")
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self.__add__(-1 * other)
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __neg__(self):
+        return self._scaled(-1)
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return self._scaled(other)
+
+        elif isinstance(other, _StructuredMatrix):
+            self._check_shape(other)
+
+            if isinstance(self, DiagonalMatrix):
+                return other._scale_rows(self._diagonal)
+            if isinstance(other, DiagonalMatrix):
+                return self._scale_columns(other._diagonal)
+
+            return self._product(other)
+
+        elif isinstance(other, Matrix):
+            if self._n != other.n_rows:
+                raise c_ex_.MatrixDimensionsMismatch(f'Inner CxR={self._n}x{other.n_rows}, not allowed.')
+
+            return _dense_output(self._matmul(other._rows()))
+
+        return NotImplemented
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float)):
+            return self._scaled(other)
+
+        elif isinstance(other, Matrix):
+            if other.n_cols != self._n:
+                raise c_ex_.MatrixDimensionsMismatch(f'Inner CxR={other.n_cols}x{self._n}, not allowed.')
+
+            return _dense_output(self._rmatmul(other._rows()))
+
+        return NotImplemented
+
+    def __truediv__(self, other):
+        if isinstance(other, (Matrix, _StructuredMatrix)):
+            raise c_ex_.DivisionByMatrix()
+
+        return self._mapped(lambda element: element / other)
+
+    @property
+    def n_rows(self) -> int:
+        return self._n
+
+    @property
+    def n_cols(self) -> int:
+        return self._n
+
+    @property
+    def dim(self) -> str:
+        return f'RxC: {self._n}x{self._n}'
+
+    @property
+    def is_square(self) -> bool:
+        return True
+
+    @property
+    def t(self):
+        return self._transpose()
+
+    @property
+    def transpose(self):
+        return self._transpose()
+
+    def _check_shape(self, other):
+        if self._n != other.n_rows or self._n != other.n_cols:
+            raise c_ex_.MatrixDimensionsMismatch()
+
+    def _scaled(self, scalar):
+        return self._mapped(partial(mul, scalar))
+
+    def _rmatmul(self, a_rows: list) -> list:
+        """Gives the rows of A S, as the transpose of S^T A^T."""
+        product = self._transpose()._matmul([list(column) for column in zip(*a_rows)])
+        return [list(row) for row in zip(*product)]
+
+    def _layout(self) -> tuple:
+        """Gives the shape parameters, equal for two matrices whose stored elements are laid out the same way."""
+        raise NotImplementedError
+
+    def _stored(self) -> list:
+        """Gives the stored elements."""
+        raise NotImplementedError
+
+    def _size(self) -> int:
+        """Gives the number of stored elements."""
+        raise NotImplementedError
+
+    def _dense_rows(self) -> list:
+        """Gives the rows of the dense matrix."""
+        raise NotImplementedError
+
+    def _diagonal_values(self) -> list:
+        """Gives the elements of the main diagonal."""
+        raise NotImplementedError
+
+    def _mapped(self, function):
+        """Gives the matrix of the same structure with the function applied to every stored element."""
+        raise NotImplementedError
+
+    def _added_to(self, rows_: list) -> list:
+        """Adds the matrix into the dense rows, in place, and gives them."""
+        raise NotImplementedError
+
+    def _shifted(self, diagonal: list):
+        """Gives the matrix of the same structure with the diagonal added to its main diagonal."""
+        raise NotImplementedError
+
+    def _matmul(self, b_rows: list) -> list:
+        """Gives the rows of S B."""
+        raise NotImplementedError
+
+    def _transpose(self):
+        """Gives the transpose, with the structure of the transpose."""
+        raise NotImplementedError
+
+    def _masked_product(self, rows_: list):
+        """Gives the element wise product with the dense rows, with the structure of the matrix."""
+        raise NotImplementedError
+
+    def _structured_sum(self, other):
+        """Gives the sum with another structured matrix, as a dense matrix unless a subclass keeps a structure."""
+        return _dense_output(self._added_to(other._dense_rows()))
+
+    def _product(self, other):
+        """Gives the product with another structured matrix, as a dense matrix unless a subclass keeps a structure."""
+        if other._size() < self._size():
+            return _dense_output(other._rmatmul(self._dense_rows()))
+
+        return _dense_output(self._matmul(other._dense_rows()))
+
+    def _scale_rows(self, diagonal: list):
+        """Gives DS, with D the diagonal matrix, as a dense matrix unless a subclass keeps the structure."""
+        return _dense_output([list(map(mul, row, repeat(value))) for row, value in zip(self._dense_rows(), diagonal)])
+
+    def _scale_columns(self, diagonal: list):
+        """Gives SD, with D the diagonal matrix, as a dense matrix unless a subclass keeps the structure."""
+        return _dense_output([list(map(mul, row, diagonal)) for row in self._dense_rows()])
+
+    def trace(self):
+        return sum(self._diagonal_values())
+
+    def diagonal(self) -> list:
+        return list(self._diagonal_values())
+
+    def hadamard_product(self, other):
+        self._check_shape(other)
+
+        if isinstance(other, DiagonalMatrix):
+            return other.hadamard_product(self)
+
+        return self._masked_product(other._rows() if isinstance(other, Matrix) else other._dense_rows())
+
+    def elementwise_product(self, other):
+        return self.hadamard_product(other)
+
+    def to_matrix(self, storage: str = 'list') -> Matrix:
+        """
+        Gives the dense matrix.
+
+        Parameters
+        ----------
+        storage:
+            Storage of the dense matrix, either 'list' or 'array'. Default is 'list'.
+
+        Returns
+        -------
+            The dense matrix, with the elements known from the structure filled in.
+        """
+
+        return _dense_output(self._dense_rows(), storage)
+
+    def dot(self, other):
+        return self * other
+
+
+class DiagonalMatrix(_StructuredMatrix):
+
+    __slots__ = ('_diagonal',)
+
+    def __init__(self, diagonal: list):
+        """
+        Creates a diagonal matrix.
+
+        Parameters
+        ----------
+        diagonal:
+            The diagonal elements.
+        """
+
+        diagonal = list(diagonal)
+        if not diagonal:
+            raise ValueError('The diagonal must have at least one element.')
+
+        super().__init__(len(diagonal))
+        self._diagonal = diagonal
+
+    def _layout(self) -> tuple:
+        return (self._n,)
+
+    def _stored(self) -> list:
+        return self._diagonal
+
+    def _size(self) -> int:
+        return self._n
+
+    def _dense_rows(self) -> list:
+        rows_ = []
+        for i, value in enumerate(self._diagonal):
+            row = [0] * self._n
+            row[i] = value
+            rows_.append(row)
+
+        return rows_
+
+    def _diagonal_values(self) -> list:
+        return self._diagonal
+
+    def _mapped(self, function):
+        return DiagonalMatrix(map(function, self._diagonal))
+
+    def _added_to(self, rows_: list) -> list:
+        for i, (row, value) in enumerate(zip(rows_, self._diagonal)):
+            row[i] += value
+
+        return rows_
+
+    def _shifted(self, diagonal: list):
+        return DiagonalMatrix(map(add, self._diagonal, diagonal))
+
+    def _scale_rows(self, diagonal: list):
+        return DiagonalMatrix(map(mul, diagonal, self._diagonal))
+
+    def _scale_columns(self, diagonal: list):
+        return DiagonalMatrix(map(mul, self._diagonal, diagonal))
+
+    def _matmul(self, b_rows: list) -> list:
+        return [list(map(mul, row, repeat(value))) for row, value in zip(b_rows, self._diagonal)]
+
+    def _rmatmul(self, a_rows: list) -> list:
+        return [list(map(mul, row, self._diagonal)) for row in a_rows]
+
+    def _transpose(self):
+        # the structured matrices are never modified in place, so the transpose can share the storage
+        return self
+
+    def _check_invertible(self):
+        if any(value == 0 for value in self._diagonal):
+            raise c_ex_.DeterminantIsZero("The given diagonal matrix has a zero on its diagonal.")
+
+    def determinant(self):
+        return prod(self._diagonal)
+
+    def inverse(self):
+        self._check_invertible()
+        return DiagonalMatrix(1 / value for value in self._diagonal)
+
+    def solve(self, b) -> Matrix:
+        """
+        Solve Dx = b, dividing every row of b by the diagonal element.
+
+        Parameters
+        ----------
+        b:
+            The right-hand side, either a column vector, a row vector or a matrix whose columns are the right-hand
+            sides.
+
+        Returns
+        -------
+            The solution x, with the same shape as ``b``.
+        """
+
+        self._check_invertible()
+        columns, as_vector = _rhs_columns(b, self._n)
+
+        return _solution_output([[x / value for x, value in zip(column, self._diagonal)] for column in columns],
+                                as_vector)
+
+    def _masked_product(self, rows_: list):
+        return DiagonalMatrix(map(mul, self._diagonal, (row[i] for i, row in enumerate(rows_))))
+
+    def hadamard_product(self, other):
+        self._check_shape(other)
+
+        if isinstance(other, Matrix):
+            return self._masked_product(other._rows())
+
+        return DiagonalMatrix(map(mul, self._diagonal, other._diagonal_values()))
+
+
+class TriangularMatrix(_StructuredMatrix):
+
+    __slots__ = ('_packed', '_lower')
+
+    def __init__(self, rows: list, lower: bool = False):
+        """
+        Creates a triangular matrix from the packed rows of its triangle.
+
+        Parameters
+        ----------
+        rows:
+            The elements of every row within the triangle, i.e., from the diagonal on for an upper triangular matrix,
+            n - i elements in the row i, and up to the diagonal for a lower triangular one, i + 1 elements.
+        lower:
+            Whether the matrix is lower triangular or not. Default is False.
+        """
+
+        packed, n_rows = [list(row) for row in rows], len(rows)
+        if not packed:
+            raise ValueError('The matrix must have at least one row.')
+
+        for i, row in enumerate(packed):
+            if len(row) != (i + 1 if lower else n_rows - i):
+                raise c_ex_.MatrixDimensionsMismatch(f'Row {i} of the triangle must have '
+                                                     f'{i + 1 if lower else n_rows - i} elements.')
+
+        super().__init__(n_rows)
+        self._packed, self._lower = packed, lower
+
+    @classmethod
+    def _from_packed(cls, packed: list, lower: bool):
+        triangular_ = cls.__new__(cls)
+        triangular_._n, triangular_._packed, triangular_._lower = len(packed), packed, lower
+
+        return triangular_
+
+    @property
+    def lower(self) -> bool:
+        return self._lower
+
+    def _layout(self) -> tuple:
+        return self._n, self._lower
+
+    def _stored(self) -> list:
+        return self._packed
+
+    def _size(self) -> int:
+        return self._n * (self._n + 1) // 2
+
+    def _dense_rows(self) -> list:
+        n_rows = self._n
+        if self._lower:
+            return [row + [0] * (n_rows - i - 1) for i, row in enumerate(self._packed)]
+
+        return [[0] * i + row for i, row in enumerate(self._packed)]
+
+    def _diagonal_values(self) -> list:
+        return [row[-1] for row in self._packed] if self._lower else [row[0] for row in self._packed]
+
+    def _mapped(self, function):
+        return self._from_packed([list(map(function, row)) for row in self._packed], self._lower)
+
+    def _added_to(self, rows_: list) -> list:
+        for i, (row, packed_row) in enumerate(zip(rows_, self._packed)):
+            if self._lower:
+                row[:i + 1] = map(add, row[:i + 1], packed_row)
+            else:
+                row[i:] = map(add, row[i:], packed_row)
+
+        return rows_
+
+    def _shifted(self, diagonal: list):
+        if self._lower:
+            packed = [row[:-1] + [row[-1] + value] for row, value in zip(self._packed, diagonal)]
+        else:
+            packed = [[row[0] + value] + row[1:] for row, value in zip(self._packed, diagonal)]
+
+        return self._from_packed(packed, self._lower)
+
+    def _structured_sum(self, other):
+        if isinstance(other, TriangularMatrix) and other._lower == self._lower:
+            return self._from_packed([list(map(add, x, y)) for x, y in zip(self._packed, other._packed)], self._lower)
+
+        return super()._structured_sum(other)
+
+    def _scale_rows(self, diagonal: list):
+        return self._from_packed([list(map(mul, row, repeat(value))) for row, value in zip(self._packed, diagonal)],
+                                 self._lower)
+
+    def _scale_columns(self, diagonal: list):
+        if self._lower:
+            packed = [list(map(mul, row, diagonal)) for row in self._packed]
+        else:
+            packed = [list(map(mul, row, diagonal[i:])) for i, row in enumerate(self._packed)]
+
+        return self._from_packed(packed, self._lower)
+
+    def _matmul(self, b_rows: list) -> list:
+        columns = list(zip(*b_rows))
+        if self._lower:
+            return [[sum(map(mul, row, column)) for column in columns] for row in self._packed]
+
+        return [[sum(map(mul, row, column[i:])) for column in columns] for i, row in enumerate(self._packed)]
+
+    def _product(self, other):
+        if not isinstance(other, TriangularMatrix) or other._lower != self._lower:
+            return super()._product(other)
+
+        n_rows, b_packed = self._n, other._packed
+
+        if self._lower:
+            # the column j of the lower triangle of B, from its row j on
+            b_columns = [[b_packed[k][j] for k in range(j, n_rows)] for j in range(n_rows)]
+            packed = [[sum(map(mul, row[j:], b_columns[j])) for j in range(i + 1)]
+                      for i, row in enumerate(self._packed)]
+        else:
+            # the column j of the upper triangle of B, up to its row j
+            b_columns = [[b_packed[k][j - k] for k in range(j + 1)] for j in range(n_rows)]
+            packed = [[sum(map(mul, row, b_columns[j][i:])) for j in range(i, n_rows)]
+                      for i, row in enumerate(self._packed)]
+
+        return self._from_packed(packed, self._lower)
+
+    def _transpose(self):
+        n_rows, packed = self._n, self._packed
+        if self._lower:
+            return self._from_packed([[packed[i][j] for i in range(j, n_rows)] for j in range(n_rows)], False)
+
+        return self._from_packed([[packed[i][j - i] for i in range(j + 1)] for j in range(n_rows)], True)
+
+    def _masked_product(self, rows_: list):
+        if self._lower:
+            packed = [list(map(mul, row, other_row)) for row, other_row in zip(self._packed, rows_)]
+        else:
+            packed = [list(map(mul, row, other_row[i:])) for i, (row, other_row) in enumerate(zip(self._packed, rows_))]
+
+        return self._from_packed(packed, self._lower)
+
+    def _substitution(self, columns: list) -> list:
+        if any(value == 0 for value in self._diagonal_values()):
+            raise c_ex_.DeterminantIsZero("The given triangular matrix has a zero on its diagonal.")
+
+        if self._lower:
+            return elim_.forward_substitution(self._packed, columns)
+
+        return elim_.back_substitution(self._packed, columns, packed=True)
+
+    def determinant(self):
+        return prod(self._diagonal_values())
+
+    def inverse(self):
+        n_rows = self._n
+        identity_columns = [[int(i == j) for i in range(n_rows)] for j in range(n_rows)]
+        columns = self._substitution(identity_columns)
+
+        if self._lower:
+            packed = [[columns[j][i] for j in range(i + 1)] for i in range(n_rows)]
+        else:
+            packed = [[columns[j][i] for j in range(i, n_rows)] for i in range(n_rows)]
+
+        return self._from_packed(packed, self._lower)
+
+    def solve(self, b) -> Matrix:
+        """
+        Solve Tx = b through forward or back substitution.
+
+        Parameters
+        ----------
+        b:
+            The right-hand side, either a column vector, a row vector or a matrix whose columns are the right-hand
+            sides.
+
+        Returns
+        -------
+            The solution x, with the same shape as ``b``.
+        """
+
+        columns, as_vector = _rhs_columns(b, self._n)
+        return _solution_output(self._substitution(columns), as_vector)
+
+
+class BandedMatrix(_StructuredMatrix):
+
+    __slots__ = ('_band', '_lower', '_upper')
+
+    def __init__(self, diagonals: dict, n_rows: int):
+        """
+        Creates a banded matrix from its diagonals.
+
+        Parameters
+        ----------
+        diagonals:
+            The diagonals, as ``{offset: elements}``, with offset 0 for the main diagonal, k > 0 for the k-th diagonal
+            above it and k < 0 for the diagonals below it. The diagonal of offset k has n - |k| elements, and the
+            diagonals that are not given, within the bandwidths, are zeros.
+        n_rows:
+            Number of rows (and columns) of the matrix.
+        """
+
+        if n_rows < 1:
+            raise ValueError('The matrix must have at least one row.')
+
+        for offset, elements in diagonals.items():
+            if abs(offset) >= n_rows:
+                raise c_ex_.IndexOutOfBounds(f'Diagonal {offset} is out of bounds for a {n_rows}x{n_rows} matrix.')
+            if len(elements) != n_rows - abs(offset):
+                raise c_ex_.MatrixDimensionsMismatch(f'Diagonal {offset} must have {n_rows - abs(offset)} elements.')
+
+        lower = max((-offset for offset in diagonals if offset < 0), default=0)
+        upper = max((offset for offset in diagonals if offset > 0), default=0)
+
+        # the element (i, j) is the element min(i, j) of the diagonal j - i
+        band = []
+        for i in range(n_rows):
+            start, stop = max(0, i - lower), min(n_rows, i + upper + 1)
+            band.append([diagonals[j - i][min(i, j)] if j - i in diagonals else 0 for j in range(start, stop)])
+
+        super().__init__(n_rows)
+        self._band, self._lower, self._upper = band, lower, upper
+
+    @classmethod
+    def _from_band(cls, band: list, lower: int, upper: int):
+        banded_ = cls.__new__(cls)
+        banded_._n, banded_._band, banded_._lower, banded_._upper = len(band), band, lower, upper
+
+        return banded_
+
+    @property
+    def bandwidths(self) -> tuple[int, int]:
+        """The lower and upper bandwidths."""
+        return self._lower, self._upper
+
+    def _layout(self) -> tuple:
+        return self._n, self._lower, self._upper
+
+    def _stored(self) -> list:
+        return self._band
+
+    def _size(self) -> int:
+        return sum(map(len, self._band))
+
+    def _start(self, i: int) -> int:
+        """Gives the column of the first stored element of the row i."""
+        return max(0, i - self._lower)
+
+    def _dense_rows(self) -> list:
+        n_rows = self._n
+        rows_ = []
+        for i, row in enumerate(self._band):
+            start = self._start(i)
+            rows_.append([0] * start + row + [0] * (n_rows - start - len(row)))
+
+        return rows_
+
+    def _diagonal_values(self) -> list:
+        return [row[i - self._start(i)] for i, row in enumerate(self._band)]
+
+    def _mapped(self, function):
+        return self._from_band([list(map(function, row)) for row in self._band], self._lower, self._upper)
+
+    def _added_to(self, rows_: list) -> list:
+        for i, (row, band_row) in enumerate(zip(rows_, self._band)):
+            start = self._start(i)
+            stop = start + len(band_row)
+            row[start:stop] = map(add, row[start:stop], band_row)
+
+        return rows_
+
+    def _shifted(self, diagonal: list):
+        band = [list(row) for row in self._band]
+        for i, (row, value) in enumerate(zip(band, diagonal)):
+            row[i - self._start(i)] += value
+
+        return self._from_band(band, self._lower, self._upper)
+
+    def _widened(self, lower: int, upper: int) -> list:
+        """Gives the band rows padded with zeros to the larger bandwidths."""
+        n_rows, band = self._n, []
+        for i, row in enumerate(self._band):
+            start, stop = self._start(i), self._start(i) + len(row)
+            band.append([0] * (start - max(0, i - lower)) + row + [0] * (min(n_rows, i + upper + 1) - stop))
+
+        return band
+
+    def _structured_sum(self, other):
+        if not isinstance(other, BandedMatrix):
+            return super()._structured_sum(other)
+
+        lower, upper = max(self._lower, other._lower), max(self._upper, other._upper)
+        band = [list(map(add, x, y)) for x, y in zip(self._widened(lower, upper), other._widened(lower, upper))]
+
+        return self._from_band(band, lower, upper)
+
+    def _scale_rows(self, diagonal: list):
+        return self._from_band([list(map(mul, row, repeat(value))) for row, value in zip(self._band, diagonal)],
+                               self._lower, self._upper)
+
+    def _scale_columns(self, diagonal: list):
+        band = [list(map(mul, row, diagonal[self._start(i):])) for i, row in enumerate(self._band)]
+        return self._from_band(band, self._lower, self._upper)
+
+    def _matmul(self, b_rows: list) -> list:
+        columns = list(zip(*b_rows))
+        rows_ = []
+        for i, row in enumerate(self._band):
+            start = self._start(i)
+            stop = start + len(row)
+            rows_.append([sum(map(mul, row, column[start:stop])) for column in columns])
+
+        return rows_
+
+    def _product(self, other):
+        if not isinstance(other, BandedMatrix):
+            return super()._product(other)
+
+        n_rows = self._n
+        lower, upper = min(self._lower + other._lower, n_rows - 1), min(self._upper + other._upper, n_rows - 1)
+
+        band = []
+        for i, row in enumerate(self._band):
+            start = max(0, i - lower)
+            out = [0] * (min(n_rows, i + upper + 1) - start)
+            for k, value in enumerate(row, self._start(i)):
+                other_row = other._band[k]
+                offset = other._start(k) - start
+                out[offset:offset + len(other_row)] = map(add, out[offset:offset + len(other_row)],
+                                                          map(mul, other_row, repeat(value)))
+            band.append(out)
+
+        return self._from_band(band, lower, upper)
+
+    def _transpose(self):
+        return BandedMatrix({-offset: elements for offset, elements in self.to_diagonals().items()}, self._n)
+
+    def _masked_product(self, rows_: list):
+        band = []
+        for i, (row, other_row) in enumerate(zip(self._band, rows_)):
+            start = self._start(i)
+            band.append(list(map(mul, row, other_row[start:start + len(row)])))
+
+        return self._from_band(band, self._lower, self._upper)
+
+    def _eliminate(self, columns: list) -> tuple:
+        """
+        Gaussian elimination with partial pivoting, restricted to the band.
+
+        The row exchanges widen the upper bandwidth of U to at most l + u. At the step k, the candidate pivot rows,
+        k to k + l, all have their first remaining element in the column k, which is dropped as it is eliminated.
+
+        Returns
+        -------
+            The rows of U, the row k starting at the column k, the eliminated right-hand sides and the sign of the row
+            permutation. The rows stop at the first zero pivot, if any.
+        """
+
+        n_rows, lower = self._n, self._lower
+        rows_ = [list(row) for row in self._band]
+        columns = [list(column) for column in columns]
+        sign = 1
+
+        for k in range(n_rows):
+            stop = min(k + lower + 1, n_rows)
+            pivot = max(range(k, stop), key=lambda r: abs(rows_[r][0]))
+            if rows_[pivot][0] == 0:
+                return rows_[:k], columns, 0
+
+            if pivot != k:
+                rows_[k], rows_[pivot] = rows_[pivot], rows_[k]
+                for column in columns:
+                    column[k], column[pivot] = column[pivot], column[k]
+                sign = -sign
+
+            pivot_row = rows_[k]
+            tail = pivot_row[1:]
+            for r in range(k + 1, stop):
+                row = rows_[r]
+                factor = row[0] / pivot_row[0]
+                # a row with no element left after the column k is all zeros up to the end of the pivot row
+                row = row[1:]
+                row += [0] * (max(len(tail), 1) - len(row))
+                row[:len(tail)] = map(sub, row[:len(tail)], map(mul, tail, repeat(factor)))
+                rows_[r] = row
+
+                for column in columns:
+                    column[r] -= factor * column[k]
+
+        return rows_, columns, sign
+
+    def determinant(self):
+        rows_, _, sign = self._eliminate([])
+        if len(rows_) < self._n:
+            return 0
+
+        return sign * prod(row[0] for row in rows_)
+
+    def inverse(self) -> Matrix:
+        """Gives the inverse, which is dense in general, as a :class:`matrix`."""
+        n_rows = self._n
+        return self.solve(Matrix([[int(i == j) for j in range(n_rows)] for i in range(n_rows)]))
+
+    def solve(self, b) -> Matrix:
+        """
+        Solve Bx = b through banded elimination with partial pivoting and back substitution.
+
+        Parameters
+        ----------
+        b:
+            The right-hand side, either a column vector, a row vector or a matrix whose columns are the right-hand
+            sides.
+
+        Returns
+        -------
+            The solution x, with the same shape as ``b``.
+        """
+
+        n_rows = self._n
+        columns, as_vector = _rhs_columns(b, n_rows)
+        rows_, columns, _ = self._eliminate(columns)
+        if len(rows_) < n_rows:
+            raise c_ex_.DeterminantIsZero("The given banded matrix is singular.")
+
+        solutions = []
+        for column in columns:
+            x_ = [0] * n_rows
+            for k in reversed(range(n_rows)):
+                row = rows_[k]
+                x_[k] = (column[k] - sum(map(mul, row[1:], x_[k + 1:k + len(row)]))) / row[0]
+            solutions.append(x_)
+
+        return _solution_output(solutions, as_vector)
+
+    def to_diagonals(self) -> dict:
+        """Gives the diagonals within the bandwidths, as ``{offset: elements}``, see :class:`BandedMatrix`."""
+        n_rows, band = self._n, self._band
+
+        diagonals = {}
+        for offset in range(-self._lower, self._upper + 1):
+            rows_ = range(max(0, -offset), min(n_rows, n_rows - offset))
+            diagonals[offset] = [band[i][i + offset - self._start(i)] for i in rows_]
+
+        return diagonals
+
+
+class SymmetricMatrix(_StructuredMatrix):
+
+    __slots__ = ('_packed',)
+
+    def __init__(self, rows: list):
+        """
+        Creates a symmetric matrix from the packed rows of its lower triangle.
+
+        Parameters
+        ----------
+        rows:
+            The elements of every row up to the diagonal, i + 1 elements in the row i. The element (i, j) above the
+            diagonal is the element (j, i).
+        """
+
+        packed = [list(row) for row in rows]
+        if not packed:
+            raise ValueError('The matrix must have at least one row.')
+
+        for i, row in enumerate(packed):
+            if len(row) != i + 1:
+                raise c_ex_.MatrixDimensionsMismatch(f'Row {i} of the lower triangle must have {i + 1} elements.')
+
+        super().__init__(len(packed))
+        self._packed = packed
+
+    @classmethod
+    def _from_packed(cls, packed: list):
+        symmetric_ = cls.__new__(cls)
+        symmetric_._n, symmetric_._packed = len(packed), packed
+
+        return symmetric_
+
+    def _layout(self) -> tuple:
+        return (self._n,)
+
+    def _stored(self) -> list:
+        return self._packed
+
+    def _size(self) -> int:
+        return self._n * (self._n + 1) // 2
+
+    def _row(self, i: int) -> list:
+        """Gives the full row i, its part above the diagonal being read down the column i of the lower triangle."""
+        packed = self._packed
+        return packed[i] + [packed[j][i] for j in range(i + 1, self._n)]
+
+    def _dense_rows(self) -> list:
+        return [self._row(i) for i in range(self._n)]
+
+    def _diagonal_values(self) -> list:
+        return [row[-1] for row in self._packed]
+
+    def _mapped(self, function):
+        return self._from_packed([list(map(function, row)) for row in self._packed])
+
+    def _added_to(self, rows_: list) -> list:
+        for i, row in enumerate(rows_):
+            row[:] = map(add, row, self._row(i))
+
+        return rows_
+
+    def _shifted(self, diagonal: list):
+        return self._from_packed([row[:-1] + [row[-1] + value] for row, value in zip(self._packed, diagonal)])
+
+    def _structured_sum(self, other):
+        if isinstance(other, SymmetricMatrix):
+            return self._from_packed([list(map(add, x, y)) for x, y in zip(self._packed, other._packed)])
+
+        return super()._structured_sum(other)
+
+    def _matmul(self, b_rows: list) -> list:
+        columns = list(zip(*b_rows))
+        return [[sum(map(mul, row, column)) for column in columns] for row in map(self._row, range(self._n))]
+
+    def _transpose(self):
+        # the structured matrices are never modified in place, so the transpose can share the storage
+        return self
+
+    def _masked_product(self, rows_: list):
+        return _dense_output([list(map(mul, self._row(i), other_row)) for i, other_row in enumerate(rows_)])
+
+    def hadamard_product(self, other):
+        if isinstance(other, SymmetricMatrix):
+            self._check_shape(other)
+            return self._from_packed([list(map(mul, x, y)) for x, y in zip(self._packed, other._packed)])
+
+        return super().hadamard_product(other)
+
+    def cholesky(self) -> CholeskyDecomposition:
+        """Gives the Cholesky factorization, read directly from the packed lower triangle, see ``Matrix.cholesky``."""
+        return CholeskyDecomposition(self._packed)
+
+    def is_positive_definite(self) -> bool:
+        return elim_.cholesky_factor(self._packed) is not None
+
+    def determinant(self):
+        return determinant(self.to_matrix())
+
+    def inverse(self):
+        inverse_ = self.to_matrix().inverse()
+        return symmetric_from_matrix(inverse_)
+
+    def solve(self, b) -> Matrix:
+        """Solve Sx = b through the LU decomposition of the dense matrix, see ``solve``."""
+        return solve(self.to_matrix(), b)
+
+
+def _square_rows(matrix) -> list:
+    matrix = matrix if isinstance(matrix, Matrix) else Matrix(matrix)
+    if not matrix.is_square:
+        raise c_ex_.NotASquareMatrix("Matrix must be square for a structured matrix.")
+
+    return matrix._rows()
+
+
+def diagonal_from_matrix(matrix) -> DiagonalMatrix:
+    """
+    Creates a diagonal matrix from the diagonal of a matrix.
+
+    Parameters
+    ----------
+    matrix:
+        The square dense matrix, either a :class:`matrix` or a nested list, the other elements are never read.
+
+    Returns
+    -------
+        The diagonal matrix.
+    """
+
+    return DiagonalMatrix(row[i] for i, row in enumerate(_square_rows(matrix)))
+
+
+def diagonal_identity(n_rows: int) -> DiagonalMatrix:
+    """
+    Generates the identity matrix.
+
+    Parameters
+    ----------
+    n_rows:
+        Number of rows (and columns) of the identity matrix.
+
+    Returns
+    -------
+        The identity matrix, storing only its n diagonal elements.
+    """
+
+    return DiagonalMatrix([1] * n_rows)
+
+
+def triangular_from_matrix(matrix, lower: bool = False) -> TriangularMatrix:
+    """
+    Creates a triangular matrix from the triangle of a matrix.
+
+    Parameters
+    ----------
+    matrix:
+        The square dense matrix, either a :class:`matrix` or a nested list, the elements in the other triangle are
+        never read.
+    lower:
+        Whether to take the lower triangle or the upper one. Default is False.
+
+    Returns
+    -------
+        The triangular matrix.
+    """
+
+    rows_ = _square_rows(matrix)
+    packed = [row[:i + 1] if lower else row[i:] for i, row in enumerate(rows_)]
+
+    return TriangularMatrix._from_packed([list(row) for row in packed], lower)
+
+
+def banded_from_matrix(matrix, lower: int, upper: int) -> BandedMatrix:
+    """
+    Creates a banded matrix from the band of a matrix.
+
+    Parameters
+    ----------
+    matrix:
+        The square dense matrix, either a :class:`matrix` or a nested list, the elements outside of the band are never
+        read.
+    lower:
+        The lower bandwidth, i.e., the number of diagonals below the main one.
+    upper:
+        The upper bandwidth, i.e., the number of diagonals above the main one.
+
+    Returns
+    -------
+        The banded matrix.
+    """
+
+    rows_ = _square_rows(matrix)
+    n_rows = len(rows_)
+    if not (0 <= lower < n_rows and 0 <= upper < n_rows):
+        raise ValueError(f'The bandwidths must be between 0 and {n_rows - 1}.')
+
+    band = [list(row[max(0, i - lower):i + upper + 1]) for i, row in enumerate(rows_)]
+
+    return BandedMatrix._from_band(band, lower, upper)
+
+
+def symmetric_from_matrix(matrix) -> SymmetricMatrix:
+    """
+    Creates a symmetric matrix from the lower triangle of a matrix.
+
+    Parameters
+    ----------
+    matrix:
+        The square dense matrix, either a :class:`matrix` or a nested list, the elements above the diagonal are never
+        read.
+
+    Returns
+    -------
+        The symmetric matrix.
+    """
+
+    return SymmetricMatrix._from_packed([list(row[:i + 1]) for i, row in enumerate(_square_rows(matrix))])
@@ -0,0 +1,83 @@
+"""Created on Oct 18 19:40:18 2026"""
+
+from unittest import TestCase
+
+from umatrix.__backend import custom_exceptions_ as c_ex_
+from umatrix.lazy import LazyMatrix, lazy
+from umatrix.matrix import Matrix
+
+
+class TestLazyMatrix(TestCase):
+    a1 = Matrix([[2, 3], [-5, 6]])
+    a2 = Matrix([[2, 0], [3, 5]])
+    a3 = Matrix([[1, -2], [3, 4]])
+    a4 = Matrix([[0, 7], [-3, 8]])
+
+    def test_deferred(self):
+        expression = lazy(self.a1) * self.a2 + self.a3 - 2 * self.a4
+        self.assertIsInstance(expression, LazyMatrix)
+        self.assertFalse(expression.is_evaluated)
+        self.assertEqual(expression.dim, 'RxC: 2x2')
+
+        self.assertEqual(expression[0][1], (self.a1 * self.a2 + self.a3 - 2 * self.a4)[0][1])
+        self.assertTrue(expression.is_evaluated)
+        self.assertIs(expression.evaluate(), expression.evaluate())
+        self.assertEqual(expression.elements, (self.a1 * self.a2 + self.a3 - 2 * self.a4).elements)
+
+    def test_elementwise_fusion(self):
+        expected = (self.a1 + self.a2).hadamard_product(self.a3) / 2 - self.a4
+        self.assertEqual((lazy(self.a1) + self.a2).hadamard_product(self.a3) / 2 - self.a4, expected)
+        self.assertEqual(self.a1 - lazy(self.a1), Matrix([[0, 0], [0, 0]]))
+        self.assertEqual(-lazy(self.a1) + 1, -self.a1 + 1)
+        self.assertEqual(10 - lazy(self.a1), Matrix([[8, 7], [15, 4]]))
+
+        a1, a2 = self.a1.with_storage('array'), self.a2.with_storage('array')
+        result = (lazy(a1) + a2 * 3).evaluate()
+        self.assertEqual((result.storage, result.elements), ('array', (self.a1 + self.a2 * 3).elements))
+
+        vector = lazy(Matrix([1, 2])) + Matrix([3, 4])
+        self.assertEqual(vector.evaluate().elements, [4, 6])
+
+    def test_operands_untouched(self):
+        a1 = Matrix([[2, 3], [-5, 6]])
+        product = a1 * self.a2
+        self.assertEqual((lazy(a1) * self.a2 + a1).evaluate(), product + a1)
+        self.assertEqual(a1, self.a1)
+
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, lambda: lazy(self.a1) + Matrix([[1, 2, 3]]))
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, lambda: lazy(self.a1) * Matrix([[1, 2, 3]]))
+        self.assertRaises(c_ex_.DivisionByMatrix, lambda: lazy(self.a1) / self.a2)
+
+    def test_long_chain(self):
+        expression, expected = lazy(self.a1), self.a1
+        for i in range(3000):
+            expression, expected = (expression + 1, expected + 1) if i % 2 else (expression * 2, expected * 2)
+        self.assertEqual(expression.evaluate(), expected)
+
+        expression = lazy(self.a1)
+        for _ in range(300):
+            expression = expression + 1
+        self.assertEqual(expression, self.a1 + 300)
+
+    def test_shared_subexpressions(self):
+        calls = []
+        multiply = Matrix.__mul__
+
+        def counted(self_, other):
+            calls.append(other)
+            return multiply(self_, other)
+
+        p = lazy(self.a1) * self.a2
+        Matrix.__mul__ = counted
+        try:
+            result = (p + p + p).evaluate()
+        finally:
+            Matrix.__mul__ = multiply
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(result, 3 * (self.a1 * self.a2))
+
+        q = lazy(self.a1) + 1
+        for _ in range(40):
+            q = q + q
+        self.assertEqual(q, (self.a1 + 1) * 2**40)
@@ -1,9 +1,21 @@
 """Created on Oct 08 21:27:22 2023"""
 
-from unittest import TestCase
+import math
+import os
+import sys
+from fractions import Fraction
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipIf
 
+from umatrix.__backend import custom_exceptions_ as c_ex_
 from umatrix.matrix import Matrix
-from umatrix.matrix import identity_matrix
+from umatrix.matrix import determinant, identity_matrix, load, map_to_matrix, matrix_from_numpy, set_backend, vector_mag
+from umatrix.matrix import allclose, expm, lstsq, map_to_matrices, matrix_power, parallel, solve, solve_triangular
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestMatrix(TestCase):
@@ -105,6 +117,17 @@ class TestMatrix(TestCase):
         self.assertTrue(self.j2.is_singular)
         self.assertFalse(self.j3.is_singular)
 
+    def test_determinant_methods(self):
+        self.assertEqual(self.g1.determinant(method='bareiss'), 0)
+        self.assertEqual(self.g1.determinant(method='cofactor'), 0)
+        self.assertAlmostEqual(self.j3.determinant(method='lu'), 62)
+        self.assertEqual(determinant([[Fraction(1, 2), 1], [1, Fraction(1, 3)]]), Fraction(-5, 6))
+        self.assertAlmostEqual(determinant([[0.5, 3 / 4], [1, 2]]), 0.25)
+
+        large_ = [[(3 * i + 7 * j) % 11 + (i == j) * 20 for j in range(12)] for i in range(12)]
+        self.assertAlmostEqual(determinant(large_, method='lu') / determinant(large_, method='bareiss'), 1)
+        self.assertRaises(ValueError, determinant, large_, 'cofactor')
+
     # TODO: get more inverse tests, the InFraction change has broken the inverse tests.
     def test_inverse(self):
         self.assertFalse(self.k1.is_singular)
@@ -119,9 +142,390 @@ class TestMatrix(TestCase):
         # self.assertAlmostEqual((self.k4 * self.k5).inverse().in_fractions,
         #                        self.k5.inverse().in_fractions * self.k4.inverse().in_fractions)
 
+    def test_array_storage(self):
+        h3, h4 = self.h3.with_storage('array'), self.h4.with_storage('array')
+        self.assertEqual(h3.storage, 'array')
+        self.assertEqual(h3.dim, 'RxC: 3x2')
+        self.assertEqual(h3 * h4, self.h3 * self.h4)
+        self.assertEqual(h3 * self.h4, self.h3 * self.h4)
+        self.assertEqual((h3 + 1 - h3 * 2).elements, (self.h3 + 1 - self.h3 * 2).elements)
+        self.assertEqual(h3.t, Matrix([[2, 1, 0], [3, 1, -2]], storage='array'))
+        self.assertEqual(Matrix([0, 1, 2], storage='array').t.elements, [[0], [1], [2]])
+        self.assertEqual((h3 / 2)[2][1], -1.0)
+        self.assertEqual(h3[1:, 1:].elements, [[1], [-2]])
+        self.assertEqual(repr(h4), repr(self.h4))
+
+        h4[0][1] = 5
+        self.assertEqual(h4.elements, [[2, 5], [3, 0]])
+        self.assertEqual(self.h4.elements, [[2, -1], [3, 0]])
+
+    def test_array_views(self):
+        g1 = self.g1.with_storage('array')
+        view_ = g1.t[1:, ::2]
+        self.assertEqual(view_.elements, [[2, 1], [3, 2]])
+        self.assertEqual(g1[:, 1].elements, [[2], [-1], [1]])
+        self.assertEqual(g1[2, 1:].elements, [1, 2])
+        self.assertEqual(g1.t.t, g1)
+
+        copy_ = view_.copy()
+        view_[0][1] = 9
+        self.assertEqual(g1[2][1], 9)
+        self.assertEqual(copy_.elements, [[2, 1], [3, 2]])
+
+    def test_multiplication_algorithms(self):
+        a_ = Matrix([[(i * 7 + j * 3) % 5 - 2 for j in range(9)] for i in range(11)])
+        b_ = Matrix([[(i * 2 + j * 5) % 7 - 3 for j in range(6)] for i in range(9)])
+        expected = a_.matmul(b_, algorithm='naive')
+
+        self.assertEqual(a_ * b_, expected)
+        self.assertEqual(a_.matmul(b_, algorithm='blocked', block_size=4), expected)
+        self.assertEqual(a_.matmul(b_, algorithm='strassen', strassen_threshold=2), expected)
+        self.assertEqual(a_.with_storage('array').matmul(b_, algorithm='strassen', strassen_threshold=2), expected)
+        self.assertRaises(ValueError, a_.matmul, b_, 'unknown')
+
+    @skipIf(numpy is None, 'NumPy is not installed.')
+    def test_numpy_backend(self):
+        a_ = Matrix([[float((i * 7 + j * 3) % 5 - 2 + (i == j) * 9) for j in range(20)] for i in range(20)])
+        b_ = a_.with_storage('array')
+
+        try:
+            set_backend('python')
+            expected = a_ * a_, a_.inverse(), a_.determinant(), map_to_matrix(b_.copy(), lambda x: x * 2)
+        finally:
+            set_backend('auto', threshold=0)
+
+        try:
+            self.assertEqual(a_ * a_, expected[0])
+            self.assertTrue(numpy.allclose((a_.inverse() * a_).elements, numpy.eye(20)))
+            self.assertAlmostEqual(a_.determinant() / expected[2], 1)
+            self.assertEqual(map_to_matrix(b_, lambda x: x * 2), expected[3])
+            self.assertEqual((b_ * b_).storage, 'array')
+        finally:
+            set_backend('auto', threshold=256)
+
+        ndarray = b_.get_numpy_compatible_matrix()
+        ndarray[0, 1] = 42.
+        self.assertEqual(b_[0][1], 42.)
+
+        ndarray = numpy.arange(6.).reshape(2, 3)
+        c_ = matrix_from_numpy(ndarray)
+        ndarray[1, 2] = -1.
+        self.assertEqual(c_.t.elements, [[0., 3.], [1., 4.], [2., -1.]])
+
+    def test_lu_decomposition(self):
+        lu_ = self.g1.t.lu()
+        self.assertEqual(lu_.permutation_matrix * self.g1.t, lu_.lower * lu_.upper)
+        self.assertTrue(lu_.is_singular)
+
+        lu_ = self.j3.lu()
+        self.assertAlmostEqual(lu_.det(), 62)
+        x_ = lu_.solve(Matrix([[5, 1], [13, 2]]))
+        self.assertEqual(x_.dim, 'RxC: 2x2')
+        for row, expected in zip((self.j3 * x_).elements, [[5, 1], [13, 2]]):
+            for value, expected_value in zip(row, expected):
+                self.assertAlmostEqual(value, expected_value)
+
+        self.assertEqual(Matrix([[2, 1], [1, 3]], storage='array').lu().solve([5, 10]).elements, [1.0, 3.0])
+        self.assertEqual(self.l1.lu().inverse().elements, [[7.0, -5.0], [-4.0, 3.0]])
+        self.assertRaises(c_ex_.DeterminantIsZero, self.j2.lu().solve, [1, 1])
+
+    def test_solve(self):
+        self.assertEqual(solve(self.m1, self.m2), self.m1.inverse() * self.m2)
+        self.assertEqual(solve([[2, 1], [1, 3]], [[5, 1], [10, 2]]).elements, [[1.0, 0.2], [3.0, 0.6]])
+        self.assertRaises(c_ex_.DeterminantIsZero, solve, self.j2, [1, 2])
+        self.assertRaises(c_ex_.NotASquareMatrix, solve, self.h3, [1, 2, 3])
+
+        self.assertEqual(solve_triangular([[2, 0], [1, 4]], [2, 9], lower=True).elements, [1.0, 2.0])
+        self.assertEqual(solve_triangular([[1, 3], [0, 1]], Matrix([[7], [2]]), unit_diagonal=True).elements,
+                         [[1], [2]])
+        self.assertRaises(c_ex_.DeterminantIsZero, solve_triangular, [[1, 3], [0, 0]], [1, 1])
+
+    def test_parallel(self):
+        a_ = Matrix([[(i * 7 + j * 3) % 5 - 2 + (i == j) * 9 for j in range(12)] for i in range(12)])
+        expected = a_.matmul(a_), a_.inverse(), map_to_matrix(a_.copy(), abs)
+
+        self.assertEqual(a_.matmul(a_, workers=2), expected[0])
+
+        with parallel(workers=2, threshold=0):
+            self.assertEqual(a_ * a_, expected[0])
+            self.assertEqual(a_.with_storage('array') * a_, expected[0])
+            self.assertEqual(map_to_matrix(a_.copy(), abs), expected[2])
+            for row, expected_row in zip(a_.inverse().elements, expected[1].elements):
+                for value, expected_value in zip(row, expected_row):
+                    self.assertAlmostEqual(value, expected_value)
+
+    def test_cached_properties(self):
+        a_ = Matrix([[2, 1], [1, 3]])
+        self.assertEqual(a_.determinant(), 5)
+        self.assertIs(a_.lu(), a_.lu())
+        self.assertTrue(a_.is_symmetric())
+
+        a_[0][1] = 0
+        self.assertEqual(a_.determinant(), 6)
+        self.assertFalse(a_.is_symmetric())
+        self.assertEqual(a_.inverse() * a_, identity_matrix(2))
+
+        inverse_ = a_.inverse()
+        inverse_[0] = [0, 0]
+        self.assertNotEqual(a_.inverse(), inverse_)
+
+        b_ = Matrix([[1, 2], [3, 4]], storage='array')
+        self.assertEqual((b_.n_rows, b_.trace, b_.determinant()), (2, 5, -2))
+        b_.t[0][1] = 5
+        self.assertEqual((b_.trace, b_.determinant()), (5, -6))
+
+    def test_in_place(self):
+        a_ = Matrix([[2, 1], [1, 3]])
+        rows_ = a_.elements[0]
+        a_ += self.e3
+        a_ -= 1
+        a_ *= 2
+        self.assertEqual(a_.elements, [[0, 0], [2, 8]])
+        self.assertIs(a_.elements[0], rows_)
+
+        a_ *= Matrix([[1, 2], [3, 4]])
+        a_ /= 4
+        self.assertEqual(a_.elements, [[0, 0], [6.5, 9]])
+        self.assertIs(a_.elements[0], rows_)
+
+        b_ = Matrix([[1, 2], [3, 4]], storage='array')
+        view_ = b_.t
+        view_ += 10
+        self.assertEqual(b_.elements, [[11, 12], [13, 14]])
+        b_ /= 2
+        self.assertEqual((b_.storage, b_.elements), ('array', [[5.5, 6], [6.5, 7]]))
+
+        out_ = Matrix([[0, 0], [0, 0]])
+        self.assertIs(self.h1.add(self.h2, out=out_), out_)
+        self.assertEqual(out_, self.h1 + self.h2)
+        self.assertEqual(self.h1.subtract(self.h2, out=out_), self.h1 - self.h2)
+        self.assertEqual(self.h1.hadamard_product(self.h2, out=out_), self.h1.hadamard_product(self.h2))
+        self.assertEqual(self.h1.matmul(self.h2, out=out_), self.h1 * self.h2)
+        self.assertEqual(map_to_matrix(self.h1, abs, 'off-diagonal', out=out_), Matrix([[1, 2], [3, 4]]))
+        self.assertEqual(self.h1, Matrix([[1, -2], [3, 4]]))
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, self.h3.add, self.h3, out=out_)
+
+    def test_exact(self):
+        hilbert_ = Matrix([[Fraction(1, i + j + 1) for j in range(8)] for i in range(8)])
+        inverse_ = hilbert_.inverse(exact=True)
+        self.assertEqual(inverse_[7][7], 176679360)
+        self.assertEqual(hilbert_ * inverse_, identity_matrix(8))
+
+        self.assertEqual(self.k1.inverse(exact=True), Matrix([[-5, -2], [3, 1]]))
+        self.assertEqual(self.k2.inverse(exact=True), Matrix([[0, Fraction(1, 2)], [Fraction(1, 3), Fraction(1, 6)]]))
+        self.assertEqual(self.k1.adjoint_matrix(), Matrix([[-5, -2], [3, 1]]))
+        self.assertEqual(self.k2.adjoint_matrix().elements, [[0, -3], [-2, -1]])
+        self.assertEqual(solve(self.k2, [[3], [2]], exact=True).elements, [[1], [Fraction(4, 3)]])
+        self.assertEqual(str(Matrix([[Fraction(1, 3000001)]]).in_fractions), '[[1/3000001]]')
+
+        self.assertRaises(ValueError, self.k3.inverse, exact=True)
+        self.assertRaises(c_ex_.DeterminantIsZero, self.g1.inverse, exact=True)
+
+    def test_save_load(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'matrix.npy')
+
+            self.h1.save(path)
+            loaded = load(path)
+            self.assertEqual((loaded.storage, loaded, loaded.t[1][0]), ('array', self.h1, -2))
+            self.assertRaises(TypeError, loaded.__setitem__, 0, [0, 0])
+
+            self.h3.with_storage('array').t.save(path)
+            self.assertEqual(load(path, mmap=False), self.h3.t)
+
+            Matrix([1.5, 2, 3]).save(path)
+            self.assertEqual(load(path).elements, [1.5, 2.0, 3.0])
+
+            loaded = load(path, mode='r+')
+            loaded[1] = 7.5
+            del loaded
+            self.assertEqual(load(path, mode='c').elements, [1.5, 7.5, 3.0])
+
+            # unsigned 64-bit elements are loaded as long as they fit in an int64
+            Matrix([1, 2**63 - 1]).save(path)
+            with open(path, 'r+b') as file_:
+                header = file_.read(64)
+                file_.seek(0)
+                file_.write(header.replace(b"i8'", b"u8'", 1))
+            self.assertEqual(load(path).elements, [1, 2**63 - 1])
+            with open(path, 'r+b') as file_:
+                file_.seek(-8, os.SEEK_END)
+                file_.write((2**63).to_bytes(8, sys.byteorder))
+            self.assertRaises(ValueError, load, path)
+
+            if numpy is not None:
+                Matrix([1.5, 7.5, 3.0]).save(path)
+                self.assertTrue(numpy.array_equal(numpy.load(path), [1.5, 7.5, 3.0]))
+                numpy.save(path, numpy.arange(6, dtype=numpy.int32).reshape(2, 3).T)
+                self.assertEqual(load(path).elements, [[0, 3], [1, 4], [2, 5]])
+
+    def test_from_rows(self):
+        rows_ = (range(i, i + 3) for i in range(4))
+        a_ = Matrix.from_rows(rows_, storage='array')
+        self.assertEqual((a_.storage, a_._storage.typecode, a_.dim), ('array', 'q', 'RxC: 4x3'))
+        self.assertEqual(a_.elements, [[0, 1, 2], [1, 2, 3], [2, 3, 4], [3, 4, 5]])
+
+        b_ = Matrix.from_rows(iter([[1, 2], [3.5, 4]]), storage='array')
+        self.assertEqual((b_._storage.typecode, b_.elements), ('d', [[1, 2], [3.5, 4]]))
+        self.assertEqual(Matrix.from_rows([[1, 2], (3, 4)]).elements, [[1, 2], [3, 4]])
+
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, Matrix.from_rows, [[1, 2], [3]])
+        self.assertRaises(ValueError, Matrix.from_rows, [])
+
+        blocks = list(a_.iter_row_blocks(3))
+        self.assertEqual([block.elements for block in blocks], [a_[0:3].elements, [[3, 4, 5]]])
+        blocks[1][0][2] = 9
+        self.assertEqual(a_[3][2], 9)
+        self.assertEqual(list(self.h1.iter_row_blocks(5)), [self.h1])
+        self.assertEqual(list(Matrix([1, 2]).iter_row_blocks(5)), [Matrix([1, 2])])
+
+    def test_map(self):
+        a_ = Matrix([[1, -4], [9, -16]])
+        self.assertEqual(map_to_matrix(a_, abs), Matrix([[1, 4], [9, 16]]))
+        self.assertEqual(a_, Matrix([[1, -4], [9, -16]]))
+        self.assertEqual(map_to_matrix(a_, abs, 'diagonal').elements, [[1, -4], [9, 16]])
+        self.assertEqual(map_to_matrix(a_, abs, 'off-diagonal').elements, [[1, 4], [9, -16]])
+        self.assertEqual(map_to_matrix(Matrix([-1, 2, -3]), abs, 'diagonal').elements, [1, 2, -3])
+        self.assertEqual(map_to_matrix(self.a3, math.sqrt, 'off-diagonal').elements, [[4], [0.0], [math.sqrt(6)]])
+
+        b_ = a_.with_storage('array')
+        c_ = map_to_matrix(b_, abs)
+        self.assertEqual((c_.storage, c_._storage.typecode, c_), ('array', 'q', Matrix([[1, 4], [9, 16]])))
+        self.assertEqual(map_to_matrix(b_.t, abs, 'diagonal').elements, [[1, 9], [-4, 16]])
+        self.assertEqual(map_to_matrix(b_, float)._storage.typecode, 'd')
+
+        self.assertEqual(map_to_matrices(max, a_, self.h1).elements, [[1, -2], [9, 4]])
+        self.assertEqual(map_to_matrices(lambda x, y: x - y, b_, self.h1, apply_to='diagonal').elements,
+                         [[0, -4], [9, -20]])
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, map_to_matrices, max, a_, self.a3)
+        self.assertRaises(ValueError, map_to_matrix, a_, abs, 'upper')
+
+        self.assertEqual(a_**2, Matrix([[1, 16], [81, 256]]))
+        self.assertEqual(b_**3, Matrix([[1, -64], [729, -4096]]))
+        self.assertEqual((a_**0.5)[0][0], 1.0)
+        self.assertEqual(pow(a_, 3, 5), Matrix([[1, 1], [4, 4]]))
+
+        if numpy is not None:
+            d_ = Matrix([[float(i + j + 1) for j in range(20)] for i in range(20)], storage='array')
+            self.assertEqual(map_to_matrix(d_, math.sqrt), map_to_matrix(d_.with_storage('list'), math.sqrt))
+
+    def test_matrix_power(self):
+        fibonacci_ = Matrix([[1, 1], [1, 0]])
+        self.assertEqual(matrix_power(fibonacci_, 10).elements, [[89, 55], [55, 34]])
+        self.assertEqual(matrix_power(fibonacci_, 0), identity_matrix(2))
+        self.assertEqual(matrix_power(fibonacci_, -3).elements, [[-1, 2], [2, -3]])
+        self.assertEqual(matrix_power(fibonacci_, 90, 10**9 + 7)[0][1], 2880067194370816120 % (10**9 + 7))
+
+        inverse_ = matrix_power(fibonacci_, -5, 7)
+        self.assertEqual(map_to_matrix(inverse_ * matrix_power(fibonacci_, 5, 7), lambda x: x % 7), identity_matrix(2))
+        self.assertRaises(c_ex_.DeterminantIsZero, matrix_power, Matrix([[2, 0], [0, 1]]), -1, 4)
+
+        markov_ = Matrix([[0.5, 0.5], [0.2, 0.8]])
+        for row in matrix_power(markov_, 1000).elements:
+            self.assertAlmostEqual(row[0], 2 / 7)
+        self.assertEqual(matrix_power(Matrix([3]), 4, 5).elements, [1])
+
+        self.assertRaises(c_ex_.NotASquareMatrix, matrix_power, self.a3, 2)
+        self.assertRaises(ValueError, matrix_power, fibonacci_, 0.5)
+        self.assertRaises(ValueError, matrix_power, markov_, 2, 5)
+
+    def test_expm(self):
+        rotation_ = expm([[0, 1], [-1, 0]]).elements
+        for row, expected_row in zip(rotation_, [[math.cos(1), math.sin(1)], [-math.sin(1), math.cos(1)]]):
+            for element, expected in zip(row, expected_row):
+                self.assertAlmostEqual(element, expected, 14)
+
+        # nilpotent, e^N = I + N + N^2 / 2, with a norm large enough for scaling and squaring
+        exponential_ = expm([[0, 40, 0], [0, 0, 40], [0, 0, 0]]).elements
+        for row, expected_row in zip(exponential_, [[1, 40, 800], [0, 1, 40], [0, 0, 1]]):
+            for element, expected in zip(row, expected_row):
+                self.assertAlmostEqual(element, expected, 9)
+
+        self.assertEqual(expm(Matrix([0])).elements, [1.0])
+        self.assertRaises(c_ex_.NotASquareMatrix, expm, self.a3)
+
     def test_multiplicative_inverse(self):
         self.assertTrue(self.l1.is_multiplicative_inverse_of(self.l2))
         self.assertEqual(self.l1 * self.l2, identity_matrix(self.l1.n_rows))
 
+    def test_cholesky(self):
+        a_ = Matrix([[4, 12, -16], [12, 37, -43], [-16, -43, 98]])
+        cholesky_ = a_.cholesky()
+        self.assertEqual(cholesky_.lower, Matrix([[2, 0, 0], [6, 1, 0], [-8, 5, 3]]))
+        self.assertEqual(cholesky_.lower * cholesky_.upper, a_)
+        self.assertIs(a_.cholesky(), cholesky_)
+        self.assertAlmostEqual(cholesky_.det(), 36)
+        self.assertAlmostEqual(cholesky_.logdet(), math.log(36))
+
+        b_ = Matrix([[1], [2], [3]])
+        for x_, expected in zip(cholesky_.solve(b_).elements, a_.lu().solve(b_).elements):
+            self.assertAlmostEqual(x_[0], expected[0])
+        self.assertTrue((cholesky_.inverse() * a_).is_multiplicative_inverse_of(identity_matrix(3)))
+        self.assertEqual(len(cholesky_.solve([1, 2, 3]).elements), 3)
+
+        self.assertTrue(a_.is_positive_definite())
+        # symmetric with a positive x^T A x for the all-ones vector, but indefinite
+        self.assertFalse(Matrix([[1, 2], [2, 1]]).is_positive_definite())
+        self.assertFalse(Matrix([[1, 1], [1, 1]]).is_positive_definite())
+        self.assertFalse(Matrix([[2, 1], [0, 2]]).is_positive_definite())
+        self.assertFalse(self.a3.is_positive_definite())
+        self.assertRaises(c_ex_.NotPositiveDefinite, Matrix([[1, 2], [2, 1]]).cholesky)
+        self.assertRaises(c_ex_.NotASquareMatrix, self.a3.cholesky)
+
+    def test_qr_lstsq(self):
+        a_ = Matrix([[1, 1], [1, 2], [1, 3], [1, 4]])
+        for pivoting in (False, True):
+            qr_ = a_.qr(pivoting)
+            self.assertEqual(qr_.q.dim, 'RxC: 4x2')
+            self.assertTrue(allclose(qr_.q * qr_.r, a_ * qr_.permutation_matrix, atol=1e-12))
+            self.assertTrue(allclose(qr_.q.t * qr_.q, identity_matrix(2), atol=1e-12))
+        self.assertIs(a_.qr(), a_.qr())
+
+        # the regression line through (1, 6), (2, 5), (3, 7), (4, 10) is y = 3.5 + 1.4 x
+        x_, residuals, rank_ = lstsq(a_, [[6], [5], [7], [10]])
+        self.assertTrue(allclose(x_, [[3.5], [1.4]]))
+        self.assertAlmostEqual(residuals[0], 4.2)
+        self.assertEqual(rank_, 2)
+        self.assertTrue(allclose(lstsq(a_, [6, 5, 7, 10])[0], [3.5, 1.4]))
+
+        # the second column is twice the first
+        b_ = Matrix([[1, 2, 0], [2, 4, 1], [3, 6, 1], [4, 8, 0]])
+        self.assertEqual((b_.rank(), b_.t.rank(), self.a3.rank(), Matrix([[0, 0], [0, 0]]).rank()), (2, 2, 1, 0))
+        x_, residuals, rank_ = lstsq(b_, [[1], [3], [4], [4]])
+        self.assertEqual(rank_, 2)
+        self.assertAlmostEqual(vector_mag(b_ * x_ - Matrix([[1], [3], [4], [4]]), squared=True), residuals[0])
+        self.assertRaises(c_ex_.DeterminantIsZero, b_.qr().lstsq, [[1], [3], [4], [4]])
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, lstsq, b_, [1, 2])
+
+    def test_verification(self):
+        # the Householder reflection I - 2vv^T / v^Tv
+        v_ = [0.3, 0.5, 0.8]
+        reflection = Matrix([[float(i == j) - 2 * v_[i] * v_[j] / 0.98 for j in range(3)] for i in range(3)])
+        self.assertNotEqual(reflection * reflection.t, identity_matrix(3))
+        permutation = Matrix([[0, 1, 0], [0, 0, 1], [1, 0, 0]])
+
+        # the round-off of the float product fails the exact comparison, but not the tolerance aware checks
+        self.assertTrue(reflection.is_orthogonal())
+        self.assertTrue(reflection.is_orthogonal(method='full'))
+        self.assertTrue(reflection.is_orthogonal_to(reflection, trials=1))
+        self.assertFalse((reflection * 1.001).is_orthogonal())
+        self.assertFalse((reflection * 1.001).is_orthogonal(method='full'))
+
+        # integer matrices are compared exactly
+        self.assertTrue(permutation.is_orthogonal())
+        self.assertFalse((permutation + identity_matrix(3)).is_orthogonal())
+        self.assertFalse(self.a3.is_orthogonal())
+
+        a_ = Matrix([[2, 1], [7, 4]])
+        self.assertTrue(a_.is_multiplicative_inverse_of(Matrix([[4, -1], [-7, 2]])))
+        self.assertFalse(a_.is_multiplicative_inverse_of(Matrix([[4, -1], [-7, 3]]), method='full'))
+        self.assertTrue(a_.is_multiplicative_inverse_of(a_.inverse()))
+        self.assertRaises(ValueError, a_.is_orthogonal, method='unknown')
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, a_.is_orthogonal_to, self.a3)
+
+        self.assertTrue(allclose(reflection * reflection.t, identity_matrix(3)))
+        self.assertFalse(allclose([[1, 2]], [[1, 2.001]]))
+        self.assertFalse(allclose([[1, 2]], [[1], [2]]))
+
     def test_random(self):
         self.assertEqual(self.m1.inverse() * self.m2, Matrix([[2], [0]]))
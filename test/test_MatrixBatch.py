@@ -0,0 +1,53 @@
+"""Created on Oct 18 18:20:44 2026"""
+
+from unittest import TestCase
+
+from umatrix.__backend import custom_exceptions_ as c_ex_
+from umatrix.batch import MatrixBatch
+from umatrix.matrix import Matrix
+
+
+def _square(n_rows, seed):
+    return Matrix([[(seed * 7 + i * 5 + j * 3) % 11 - 5 + (i == j) * 13 for j in range(n_rows)]
+                   for i in range(n_rows)])
+
+
+class TestMatrixBatch(TestCase):
+    matrices = {n_rows: [_square(n_rows, seed) for seed in range(3)] for n_rows in (1, 2, 3, 4, 5)}
+
+    def assertMatricesAlmostEqual(self, first, second):
+        for value, other_value in zip(first._values(), second._values()):
+            self.assertAlmostEqual(value, other_value)
+
+    def test_construction(self):
+        batch = MatrixBatch(self.matrices[3])
+        self.assertEqual((len(batch), batch.shape, batch.dim), (3, (3, 3, 3), '3 x RxC: 3x3'))
+        self.assertEqual(batch[1], self.matrices[3][1])
+        self.assertEqual(batch.to_matrices(), self.matrices[3])
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, MatrixBatch, [[[1, 2], [3, 4]], [[1, 2, 3]]])
+        self.assertRaises(ValueError, MatrixBatch, [])
+
+    def test_closed_form_kernels(self):
+        for n_rows, matrices in self.matrices.items():
+            batch = MatrixBatch(matrices)
+            self.assertEqual(batch.n_rows, n_rows)
+            self.assertEqual(batch.determinant(), [matrix_.determinant() for matrix_ in matrices])
+            self.assertEqual(batch * batch, MatrixBatch([matrix_ * matrix_ for matrix_ in matrices]))
+            self.assertEqual(batch.t.to_matrices(), [matrix_.t for matrix_ in matrices])
+
+            for inverse_, matrix_ in zip(batch.inverse(), matrices):
+                self.assertMatricesAlmostEqual(inverse_, matrix_.inverse())
+
+        self.assertRaises(c_ex_.DeterminantIsZero, MatrixBatch([[[1, 2], [2, 4]]]).inverse)
+
+    def test_broadcasting(self):
+        batch, single = MatrixBatch(self.matrices[4]), self.matrices[4][0]
+        self.assertEqual((batch * single).to_matrices(), [matrix_ * single for matrix_ in self.matrices[4]])
+        self.assertEqual((single * batch).to_matrices(), [single * matrix_ for matrix_ in self.matrices[4]])
+        self.assertEqual((2 * batch)[2], 2 * self.matrices[4][2])
+
+        rotation = MatrixBatch([[[0, -1], [1, 0]]])
+        self.assertEqual(rotation.matvec([[1, 0], [0, 1], [2, 3]]), [[0, 1], [-1, 0], [-3, 2]])
+        self.assertEqual(MatrixBatch(self.matrices[3]).matvec([[1, 0, 0]]),
+                         [matrix_.t.elements[0] for matrix_ in self.matrices[3]])
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, rotation.matvec, [[1, 2, 3]])
@@ -0,0 +1,56 @@
+"""Created on Oct 18 16:40:12 2026"""
+
+from unittest import TestCase
+
+from umatrix.__backend import custom_exceptions_ as c_ex_
+from umatrix.matrix import Matrix, identity_matrix
+from umatrix.sparse import SparseMatrix, sparse_from_matrix, sparse_identity
+
+
+class TestSparseMatrix(TestCase):
+    a1 = Matrix([[1, 0, 2], [0, 0, 3], [4, 5, 0]])
+    a2 = Matrix([[0, 1, 0], [2, 0, 0], [0, 0, 3]])
+    a3 = Matrix([[1, 2], [3, 4], [5, 6]])
+
+    s1 = SparseMatrix([0, 0, 1, 2, 2], [0, 2, 2, 0, 1], [1, 2, 3, 4, 5], (3, 3))
+    s2 = sparse_from_matrix(a2)
+
+    def test_construction(self):
+        self.assertEqual(self.s1.nnz, 5)
+        self.assertEqual(self.s1.dim, 'RxC: 3x3')
+        self.assertEqual(self.s1.to_matrix(), self.a1)
+        self.assertEqual(self.s1, self.a1)
+        self.assertEqual(self.s1.to_coo(), ([0, 0, 1, 2, 2], [0, 2, 2, 0, 1], [1, 2, 3, 4, 5]))
+
+        # duplicates are summed and zeros are not stored
+        s_ = SparseMatrix([1, 0, 1, 0], [1, 1, 1, 0], [2, 0, -2, 7], (2, 2))
+        self.assertEqual((s_.nnz, s_.to_matrix()), (1, Matrix([[7, 0], [0, 0]])))
+
+        self.assertRaises(c_ex_.IndexOutOfBounds, SparseMatrix, [2], [0], [1], (2, 2))
+        self.assertRaises(ValueError, SparseMatrix, [0, 1], [0], [1], (2, 2))
+        self.assertEqual(sparse_identity(3), identity_matrix(3))
+
+    def test_arithmetic(self):
+        self.assertEqual(self.s1 + self.s2, sparse_from_matrix(self.a1 + self.a2))
+        self.assertEqual(self.s1 - self.s1, SparseMatrix([], [], [], (3, 3)))
+        self.assertEqual(self.s1 + self.a2, self.a1 + self.a2)
+        self.assertEqual(self.a2 + self.s1, self.a1 + self.a2)
+        self.assertEqual(self.a2 - self.s1, self.a2 - self.a1)
+        self.assertEqual(2 * self.s1, sparse_from_matrix(2 * self.a1))
+        self.assertEqual((self.s1 / 2).to_matrix(), self.a1 / 2)
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, self.s1.__add__, sparse_identity(2))
+
+    def test_multiplication(self):
+        self.assertEqual(self.s1 * self.s2, sparse_from_matrix(self.a1 * self.a2))
+        self.assertEqual(self.s1 * self.a3, self.a1 * self.a3)
+        self.assertEqual(self.a3.t * self.s1, self.a3.t * self.a1)
+        self.assertEqual(Matrix([1, 2, 3]) * self.s1, Matrix([1, 2, 3]) * self.a1)
+        self.assertEqual(self.s1 * sparse_identity(3), self.s1)
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, self.s1.__mul__, self.a3.t)
+
+    def test_transpose_and_hadamard(self):
+        self.assertEqual(self.s1.t, sparse_from_matrix(self.a1.t))
+        self.assertEqual(self.s1.t.t, self.s1)
+        self.assertEqual(self.s1.hadamard_product(self.s2), sparse_from_matrix(self.a1.hadamard_product(self.a2)))
+        self.assertEqual(self.s1.hadamard_product(self.a1).to_matrix(), self.a1.hadamard_product(self.a1))
+        self.assertEqual(self.a1.hadamard_product(self.s1), sparse_from_matrix(self.a1.hadamard_product(self.a1)))
@@ -0,0 +1,111 @@
+"""Created on Oct 19 01:58:06 2026"""
+
+from unittest import TestCase
+
+from umatrix.__backend import custom_exceptions_ as c_ex_
+from umatrix.matrix import Matrix, determinant, identity_matrix, solve
+from umatrix.structured import (BandedMatrix, DiagonalMatrix, SymmetricMatrix, TriangularMatrix, banded_from_matrix,
+                                diagonal_from_matrix, diagonal_identity, symmetric_from_matrix, triangular_from_matrix)
+
+
+def _close(x, y, tolerance=1e-9):
+    return all(abs(a - b) < tolerance for row_x, row_y in zip(x._rows(), y._rows()) for a, b in zip(row_x, row_y))
+
+
+class TestStructuredMatrix(TestCase):
+    a1 = Matrix([[4, 1, 2, 0], [3, 5, 1, 2], [1, 2, 6, 1], [0, 1, 3, 7]])
+    a2 = Matrix([[1, 2], [3, 4], [5, 6], [7, 8]])
+
+    d1 = DiagonalMatrix([2, 3, 5, 7])
+    u1 = TriangularMatrix([[4, 1, 2, 0], [5, 1, 2], [6, 1], [7]])
+    l1 = triangular_from_matrix(a1, lower=True)
+    b1 = BandedMatrix({-1: [3, 2, 3], 0: [4, 5, 6, 7], 1: [1, 1, 1]}, 4)
+    s1 = SymmetricMatrix([[4], [1, 5], [2, 1, 6], [0, 2, 1, 7]])
+
+    def test_construction(self):
+        self.assertEqual(self.d1, Matrix([[2, 0, 0, 0], [0, 3, 0, 0], [0, 0, 5, 0], [0, 0, 0, 7]]))
+        self.assertEqual(diagonal_from_matrix(self.a1), DiagonalMatrix([4, 5, 6, 7]))
+        self.assertEqual(diagonal_identity(3), identity_matrix(3))
+        self.assertEqual(self.u1, triangular_from_matrix(self.a1))
+        self.assertEqual(self.l1.to_matrix(), Matrix([[4, 0, 0, 0], [3, 5, 0, 0], [1, 2, 6, 0], [0, 1, 3, 7]]))
+        self.assertEqual(self.b1, banded_from_matrix(self.a1 - Matrix([[0, 0, 2, 0], [0, 0, 0, 2], [1, 0, 0, 0],
+                                                                       [0, 0, 0, 0]]), 1, 1))
+        self.assertEqual(self.b1.to_diagonals(), {-1: [3, 2, 3], 0: [4, 5, 6, 7], 1: [1, 1, 1]})
+        self.assertEqual(self.s1, symmetric_from_matrix(self.s1.to_matrix()))
+        self.assertEqual(symmetric_from_matrix(self.a1), SymmetricMatrix([[4], [3, 5], [1, 2, 6], [0, 1, 3, 7]]))
+        self.assertEqual(self.s1.t, self.s1.to_matrix().t)
+        self.assertEqual((self.s1.dim, self.b1.bandwidths, self.d1.trace()), ('RxC: 4x4', (1, 1), 17))
+
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, TriangularMatrix, [[1, 2], [3, 4]])
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, BandedMatrix, {1: [1, 2, 3]}, 3)
+        self.assertRaises(c_ex_.NotASquareMatrix, symmetric_from_matrix, self.a2)
+
+    def test_arithmetic(self):
+        for x_ in (self.d1, self.u1, self.l1, self.b1, self.s1):
+            dense = x_.to_matrix()
+            self.assertEqual(x_ + self.a1, dense + self.a1)
+            self.assertEqual(self.a1 - x_, self.a1 - dense)
+            self.assertEqual(2 * x_, 2 * dense)
+            self.assertEqual(-x_, -dense)
+            self.assertEqual(x_ + self.d1, dense + self.d1.to_matrix())
+            self.assertEqual(x_ + self.s1, dense + self.s1.to_matrix())
+
+        self.assertIsInstance(self.d1 + self.u1, TriangularMatrix)
+        self.assertIsInstance(self.u1 + self.u1, TriangularMatrix)
+        self.assertIsInstance(self.b1 + banded_from_matrix(self.a1, 2, 0), BandedMatrix)
+        self.assertIsInstance(self.s1 - self.s1, SymmetricMatrix)
+        self.assertIsInstance(self.u1 + self.l1, Matrix)
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, self.d1.__add__, diagonal_identity(2))
+        self.assertRaises(c_ex_.DivisionByMatrix, self.u1.__truediv__, self.a1)
+
+    def test_multiplication(self):
+        structured = (self.d1, self.u1, self.l1, self.b1, self.s1)
+        for x_ in structured:
+            dense = x_.to_matrix()
+            self.assertEqual(x_ * self.a2, dense * self.a2)
+            self.assertEqual(self.a2.t * x_, self.a2.t * dense)
+            self.assertEqual(Matrix([1, 2, 3, 4]) * x_, Matrix([1, 2, 3, 4]) * dense)
+            for y_ in structured:
+                self.assertEqual(x_ * y_, dense * y_.to_matrix())
+
+        self.assertIsInstance(self.d1 * self.b1, BandedMatrix)
+        self.assertIsInstance(self.u1 * self.d1, TriangularMatrix)
+        self.assertIsInstance(self.l1 * self.l1, TriangularMatrix)
+        self.assertIsInstance(self.b1 * self.b1, BandedMatrix)
+        self.assertEqual((self.b1 * self.b1).bandwidths, (2, 2))
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, self.u1.__mul__, self.a2.t)
+
+    def test_transpose_and_hadamard(self):
+        for x_ in (self.d1, self.u1, self.l1, self.b1, self.s1):
+            self.assertEqual(x_.t, x_.to_matrix().t)
+            self.assertEqual(x_.hadamard_product(self.a1), x_.to_matrix().hadamard_product(self.a1))
+            self.assertEqual(self.a1.hadamard_product(x_), x_.to_matrix().hadamard_product(self.a1))
+
+        self.assertTrue(self.u1.t.lower)
+        self.assertIsInstance(self.b1.hadamard_product(self.s1), BandedMatrix)
+        self.assertIsInstance(self.s1.hadamard_product(self.s1), SymmetricMatrix)
+        self.assertEqual(self.s1.hadamard_product(self.s1), self.s1.to_matrix().hadamard_product(self.s1.to_matrix()))
+
+    def test_solve_determinant_inverse(self):
+        b = Matrix([[1], [2], [3], [4]])
+        for x_ in (self.d1, self.u1, self.l1, self.b1, self.s1):
+            dense = x_.to_matrix()
+            self.assertAlmostEqual(x_.determinant(), determinant(dense))
+            self.assertAlmostEqual(determinant(x_), determinant(dense))
+            self.assertTrue(_close(x_.solve(b), dense.lu().solve(b)))
+            self.assertTrue(_close(solve(x_, self.a2), dense.lu().solve(self.a2)))
+            self.assertTrue(_close(x_.inverse() * dense, identity_matrix(4)))
+
+        self.assertTrue(self.s1.is_positive_definite())
+        self.assertEqual(self.s1.cholesky().lower_elements, self.s1.to_matrix().cholesky().lower_elements)
+        self.assertFalse(SymmetricMatrix([[1], [2, 1]]).is_positive_definite())
+
+        # the partial pivoting exchanges rows whose band ends before the pivot row
+        b2 = BandedMatrix({-1: [4, 5, 6], 0: [1, 1, 1, 1]}, 4)
+        self.assertTrue(_close(b2.solve(b), b2.to_matrix().lu().solve(b)))
+        self.assertAlmostEqual(b2.determinant(), determinant(b2.to_matrix()))
+
+        self.assertEqual(BandedMatrix({0: [1, 0, 1]}, 3).determinant(), 0)
+        self.assertRaises(c_ex_.DeterminantIsZero, BandedMatrix({1: [1, 1]}, 3).solve, [1, 2, 3])
+        self.assertRaises(c_ex_.DeterminantIsZero, TriangularMatrix([[0, 1], [1]]).inverse)
+        self.assertRaises(c_ex_.DeterminantIsZero, DiagonalMatrix([1, 0]).solve, [1, 2])
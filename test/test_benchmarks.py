@@ -0,0 +1,23 @@
+"""Created on Oct 18 21:04:46 2026"""
+
+from unittest import TestCase
+
+from benchmarks.runner import compare, run
+
+
+class TestBenchmarks(TestCase):
+
+    def test_run(self):
+        results = run(['transpose', 'determinant'], sizes=[2, 4, 512], max_size=4, repeat=1, min_time=0)
+        self.assertEqual(set(results['results']), {'transpose', 'determinant'})
+        self.assertEqual(set(results['results']['transpose']), {'2', '4'})
+        self.assertGreater(results['results']['determinant']['4']['peak_memory'], 0)
+        self.assertRaises(ValueError, run, ['unknown'])
+
+    def test_compare(self):
+        baseline = {'results': {'inverse': {'8': {'time': 1e-3, 'peak_memory': 1000}}}}
+        current = {'results': {'inverse': {'8': {'time': 1.2e-3, 'peak_memory': 2000}, '16': {'time': 1.0}}}}
+
+        self.assertEqual(compare(current, baseline), [])
+        self.assertEqual([regression['metric'] for regression in compare(current, baseline, 1.1, 1.5)],
+                         ['time', 'peak_memory'])
@@ -0,0 +1,70 @@
+"""Created on Oct 18 23:02:36 2026"""
+
+import os
+import tracemalloc
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from umatrix import outofcore
+from umatrix.__backend import custom_exceptions_ as c_ex_
+from umatrix.matrix import Matrix, load
+
+
+class TestOutOfCore(TestCase):
+    a1 = Matrix([[(3 * i + 5 * j) % 7 - 3 for j in range(13)] for i in range(11)])
+    a2 = Matrix([[(i * j) % 5 + 0.5 for j in range(9)] for i in range(13)])
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.a_path, self.b_path = self._path('a'), self._path('b')
+        self.a1.save(self.a_path)
+        self.a2.save(self.b_path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.directory.name, f'{name}.npy')
+
+    def test_multiply(self):
+        # tiles of 4x4 elements, so no dimension is a multiple of the tile size
+        product = outofcore.multiply(self.a_path, load(self.b_path), self._path('c'), memory=2048)
+        self.assertEqual((outofcore.tile_size(1536), outofcore.tile_size(2048, 4)), (4, 4))
+        self.assertEqual((product.storage, product), ('array', self.a1 * self.a2))
+        self.assertEqual(load(self._path('c'), mmap=False), self.a1 * self.a2)
+
+        product = outofcore.multiply(Matrix([1, 2, 3]), Matrix([[1], [2], [3]]), self._path('d'))
+        self.assertEqual(product.elements, [14])
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, outofcore.multiply, self.a_path, self.a_path, self._path('e'))
+
+    def test_multiply_memory(self):
+        # a 300x300 product, in tiles of 39x39 elements accumulated over two steps of the inner dimension
+        a_ = Matrix([[(i * j) % 11 + 0.25 for j in range(60)] for i in range(300)])
+        a_.save(self._path('m'))
+        a_.t.save(self._path('n'))
+
+        tracemalloc.start()
+        try:
+            product = outofcore.multiply(self._path('m'), self._path('n'), self._path('p'), memory=200_000)
+            self.assertLess(tracemalloc.get_traced_memory()[1], 200_000)
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual((product.n_rows, product.n_cols), (300, 300))
+        self.assertEqual(product[299].elements, (Matrix([a_.elements[299]]) * a_.t).elements[0])
+
+    def test_transpose(self):
+        transpose = outofcore.transpose(self.a_path, self._path('t'), memory=200)
+        self.assertEqual((transpose.n_rows, transpose.n_cols), (13, 11))
+        self.assertEqual(transpose.elements, self.a1.t.elements)
+        self.assertEqual(outofcore.transpose(Matrix([1, 2]), self._path('t')).elements, [[1], [2]])
+
+    def test_elementwise(self):
+        a_ = load(self.a_path)
+        self.assertEqual(outofcore.add(a_, self.a1, self._path('s'), memory=300), self.a1 + self.a1)
+        self.assertEqual(outofcore.subtract(self.a_path, a_.t.t, self._path('s')), self.a1 - self.a1)
+
+        product = outofcore.hadamard_product(self.b_path, self.a2.with_storage('array'), self._path('h'), memory=100)
+        self.assertEqual(product, self.a2.hadamard_product(self.a2))
+        self.assertEqual(load(self._path('h'))._storage.typecode, 'd')
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, outofcore.add, self.a_path, self.b_path, self._path('s'))
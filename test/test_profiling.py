@@ -0,0 +1,41 @@
+"""Created on Oct 18 21:48:03 2026"""
+
+import json
+from unittest import TestCase
+
+from umatrix import matrix as matrix_module
+from umatrix.matrix import Matrix
+from umatrix.profiling import profile
+
+
+class TestProfiling(TestCase):
+    a1 = Matrix([[2, 3], [-5, 6]])
+    a2 = Matrix([[4], [0]])
+
+    def test_profile(self):
+        original_mul = Matrix.__mul__
+
+        with profile() as profile_:
+            _ = self.a1 * self.a1, self.a1 * self.a2, 2 * self.a1, self.a1 + self.a1
+            Matrix([[1, 2], [3, 4]]).inverse()
+            matrix_module.determinant([[1, 2], [3, 5]])
+
+            self.assertIsNot(Matrix.__mul__, original_mul)
+
+        self.assertIs(Matrix.__mul__, original_mul)
+
+        statistics = profile_.as_dict()
+        self.assertEqual(statistics['mul[matrix x matrix]']['calls'], 1)
+        self.assertEqual(statistics['mul[matrix x matrix]']['flops'], 16)
+        self.assertEqual(statistics['mul[matrix x column]']['shapes'], {'2x2 * 2x1': 1})
+        self.assertEqual(statistics['mul[scalar]']['shapes'], {'2x2 * scalar': 1})
+        self.assertEqual((statistics['add']['calls'], statistics['inverse']['calls']), (1, 1))
+        self.assertEqual(statistics['determinant']['calls'], 1)
+        self.assertGreater(statistics['add']['bytes'], 0)
+        self.assertEqual(json.loads(profile_.to_json()), statistics)
+
+    def test_trace_memory(self):
+        with profile(trace_memory=True) as profile_:
+            _ = Matrix([[1.5] * 50] * 50) * 2.0
+
+        self.assertGreater(profile_.as_dict()['mul[scalar]']['bytes'], 50 * 50 * 8)
@@ -0,0 +1,77 @@
+"""Created on Oct 18 23:41:27 2026"""
+
+import os
+import time
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from umatrix import streaming
+from umatrix.__backend import custom_exceptions_ as c_ex_
+from umatrix.matrix import Matrix
+
+
+class TestStreaming(TestCase):
+    a1 = Matrix([[(2 * i + j) % 5 - 2 for j in range(4)] for i in range(7)])
+    x1 = Matrix([[1], [0.5], [-2], [3]])
+
+    def test_readers(self):
+        with TemporaryDirectory() as directory:
+            csv_path, text_path = os.path.join(directory, 'a.csv'), os.path.join(directory, 'a.txt')
+
+            with open(csv_path, 'w', encoding='utf-8') as file_:
+                file_.write('a,b,c\n1,2,3\n\n4,5.5,6\n')
+            with open(text_path, 'w', encoding='utf-8') as file_:
+                file_.write('# two rows\n1 2   3\n4 5 6  # last\n')
+
+            a_ = streaming.read_csv(csv_path, skip_rows=1)
+            self.assertEqual((a_.storage, a_.elements), ('array', [[1, 2, 3], [4, 5.5, 6]]))
+            self.assertEqual(list(streaming.iter_csv(csv_path, skip_rows=1)), [[1, 2, 3], [4.0, 5.5, 6.0]])
+
+            b_ = streaming.read_text(text_path, storage='list')
+            self.assertEqual((b_.storage, b_.elements), ('list', [[1, 2, 3], [4, 5, 6]]))
+            self.assertRaises(ValueError, streaming.read_csv, csv_path)
+
+    def test_row_blocks(self):
+        blocks = list(streaming.row_blocks(iter(self.a1.elements), 3))
+        self.assertEqual([len(block) for block in blocks], [3, 3, 1])
+        self.assertRaises(ValueError, list, streaming.row_blocks([], 0))
+
+    def test_prefetch(self):
+        self.assertEqual(list(streaming.prefetch(range(10), 3)), list(range(10)))
+
+        def failing():
+            yield 1
+            raise KeyError('failed')
+
+        items = streaming.prefetch(failing())
+        self.assertEqual(next(items), 1)
+        self.assertRaises(KeyError, next, items)
+
+        items = streaming.prefetch(iter(range(1000)), 1)
+        self.assertEqual(next(items), 0)
+        items.close()
+
+        def slow():
+            yield 1
+            time.sleep(2)
+            yield 2
+
+        items = streaming.prefetch(slow())
+        self.assertEqual(next(items), 1)
+        start = time.perf_counter()
+        items.close()
+        self.assertLess(time.perf_counter() - start, 1)
+
+    def test_stream_multiply(self):
+        expected = (self.a1 * self.x1).elements
+
+        self.assertEqual(list(streaming.stream_multiply(iter(self.a1.elements), self.x1, 2)), expected)
+        self.assertEqual(list(streaming.stream_multiply(self.a1.with_storage('array'), self.x1, 3)), expected)
+
+        rows_ = streaming.prefetch(streaming.row_blocks(self.a1.elements, 2))
+        product = Matrix.from_rows(row for block in rows_ for row in block)
+        self.assertEqual(product, self.a1)
+
+        product = Matrix.from_rows(streaming.stream_multiply(self.a1.elements, self.a1.t), storage='array')
+        self.assertEqual(product, self.a1 * self.a1.t)
+        self.assertRaises(c_ex_.MatrixDimensionsMismatch, list, streaming.stream_multiply([[1, 2]], self.x1))